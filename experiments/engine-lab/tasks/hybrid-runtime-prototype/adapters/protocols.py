@@ -32,6 +32,7 @@ class ScientificInterpreterAdapter(Protocol):
         rawDirectory: Path,
         scenario: str,
         turn: str,
+        stageInputKey: str | None = None,
     ) -> InterpreterResult: ...
 
 
@@ -59,4 +60,48 @@ class SemanticAdjudicatorAdapter(Protocol):
         rawDirectory: Path,
         scenario: str,
         turn: str,
+        stageInputKey: str | None = None,
+    ) -> tuple[AdjudicationOutput, str, int, int]: ...
+
+
+class AsyncScientificInterpreterAdapter(Protocol):
+    async def interpret_async(
+        self,
+        *,
+        conversationId: str,
+        turns: list[ConversationTurn],
+        previousCandidateState: CandidateScientificState | None,
+        contextInputs: list[ContextInput],
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+        stageInputKey: str | None = None,
+    ) -> InterpreterResult: ...
+
+
+class AsyncSemanticAuditorAdapter(Protocol):
+    async def audit_async(
+        self,
+        *,
+        turns: list[ConversationTurn],
+        previousState: CandidateScientificState | None,
+        candidateState: CandidateScientificState,
+        confirmedDecisionIds: list[str],
+        deterministicFindings: list[AuditFinding] | None = None,
+    ) -> list[AuditFinding]: ...
+
+
+class AsyncSemanticAdjudicatorAdapter(Protocol):
+    async def adjudicate_async(
+        self,
+        *,
+        turns: list[ConversationTurn],
+        previousState: CandidateScientificState | None,
+        primaryCandidate: CandidateScientificState,
+        deterministicFindings: list[AuditFinding],
+        semanticAuditFindings: list[AuditFinding],
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+        stageInputKey: str | None = None,
     ) -> tuple[AdjudicationOutput, str, int, int]: ...
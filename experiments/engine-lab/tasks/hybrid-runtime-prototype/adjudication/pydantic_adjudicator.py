@@ -3,11 +3,9 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-from google.genai import types
 from pydantic_ai import Agent
-from pydantic_ai.providers.google import GoogleProvider
 
 from contracts.models import (
     AdjudicationOutput,
@@ -16,8 +14,9 @@ from contracts.models import (
     ConversationTurn,
 )
 from interpreter.prompts import ADJUDICATOR_PROMPT_VERSION, ADJUDICATOR_SYSTEM_PROMPT
-from interpreter.pydantic_primary import RawFirstGoogleModel
-from pipeline.ledger import MODEL, ProviderLedger, utc_now
+from interpreter.pydantic_primary import AgentPool, bind_raw_capture, shared_agent_pool
+from pipeline.ledger import MODEL, ProviderLedger, operation_key, utc_now
+from pipeline.snapshot import documents, snapshot
 from pipeline.storage import atomic_write_json, logical_digest, read_json, stable_json
 
 
@@ -35,9 +34,10 @@ class PydanticTypedAdjudicator:
     runtimeId = "PYDANTIC_TYPED_ADJUDICATOR"
     runtimeVersion = "0.1.0-experimental"
 
-    def __init__(self, *, ledger: ProviderLedger, apiKey: str):
+    def __init__(self, *, ledger: ProviderLedger, apiKey: str, pool: AgentPool | None = None):
         self.ledger = ledger
         self.apiKey = apiKey
+        self.pool = pool or shared_agent_pool(apiKey)
         self.promptDigest = logical_digest({"version": ADJUDICATOR_PROMPT_VERSION, "prompt": ADJUDICATOR_SYSTEM_PROMPT})
         self.schemaDigest = logical_digest(AdjudicationOutput.model_json_schema())
         self.configurationDigest = logical_digest({
@@ -51,6 +51,113 @@ class PydanticTypedAdjudicator:
             "schemaDigest": self.schemaDigest,
         })
 
+    def _prepare(
+        self,
+        reservation: dict[str, Any],
+        *,
+        turns: list[ConversationTurn],
+        previousState: CandidateScientificState | None,
+        primaryCandidate: CandidateScientificState,
+        deterministicFindings: list[AuditFinding],
+        semanticAuditFindings: list[AuditFinding],
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+    ) -> tuple[Agent[None, AdjudicationOutput], str, Path, Callable[[dict[str, Any]], None]]:
+        raw_path = rawDirectory / f"request-{reservation['requestNumber']:04d}-adjudicator-{scenario.lower()}-{turn.lower()}.json"
+        request_payload = {
+            "conversation": documents(turns),
+            "previousState": snapshot(previousState).document if previousState else None,
+            "immutablePrimaryCandidate": snapshot(primaryCandidate).document,
+            "deterministicFindings": documents(deterministicFindings),
+            "semanticAuditFindings": documents(semanticAuditFindings),
+            "confirmedDecisions": [],
+        }
+        record = {
+            "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
+            "requestNumber": reservation["requestNumber"],
+            "operationKey": reservation["operationKey"],
+            "configuration": "PYDANTIC_TYPED_ADJUDICATOR",
+            "scenario": scenario,
+            "turn": turn,
+            "role": "SEMANTIC_ADJUDICATOR",
+            "provider": "GOOGLE_GEMINI",
+            "model": MODEL,
+            "temperature": None,
+            "promptVersion": ADJUDICATOR_PROMPT_VERSION,
+            "promptDigest": self.promptDigest,
+            "schemaVersion": "SEMANTIC_ADJUDICATION_OUTPUT_0.1.0-experimental",
+            "schemaDigest": self.schemaDigest,
+            "requestPayload": request_payload,
+            "requestPayloadDigest": logical_digest(request_payload),
+            "providerStartedAt": utc_now(),
+            "rawPersistedAt": None,
+            "rawResponse": None,
+            "rawDigest": None,
+            "parseResult": "PENDING",
+            "validationErrors": [],
+            "validationCompletedAt": None,
+        }
+
+        def capture(raw: dict[str, Any]) -> None:
+            record["rawResponse"] = raw
+            record["rawPersistedAt"] = utc_now()
+            record["rawDigest"] = logical_digest(raw)
+            atomic_write_json(raw_path, record)
+
+        agent = self.pool.agent(AdjudicationOutput, ADJUDICATOR_SYSTEM_PROMPT)
+        return agent, stable_json(request_payload), raw_path, capture
+
+    @staticmethod
+    def _failed(
+        raw_path: Path,
+        capture: Callable[[dict[str, Any]], None],
+        caught: Exception,
+        findings: list[AuditFinding],
+    ) -> AdjudicatorProviderValue:
+        if not raw_path.exists():
+            capture({
+                "kind": "CLIENT_SIDE_FAILURE_BEFORE_PROVIDER_RESPONSE",
+                "exceptionType": caught.__class__.__name__,
+                "exception": str(caught)[:4000],
+            })
+        stored = read_json(raw_path)
+        stored["parseResult"] = "STRUCTURED_CONTRACT_FAILURE"
+        stored["validationErrors"] = [{
+            "errorType": caught.__class__.__name__,
+            "message": str(caught)[:4000],
+        }]
+        stored["validationCompletedAt"] = utc_now()
+        atomic_write_json(raw_path, stored)
+        return AdjudicatorProviderValue(
+            output=AdjudicationOutput(
+                resolutions=[],
+                consolidatedInterpretation=None,
+                unresolvedFindingIds=[item.findingId for item in findings],
+                disposition="FAIL_CLOSED",
+            ),
+            rawOutputRef=str(raw_path),
+            success=False,
+            finalDisposition="STRUCTURED_CONTRACT_FAILURE",
+            providerStatus="SUCCEEDED" if stored["rawResponse"]["kind"] == "PROVIDER_RESPONSE" else "FAILED",
+            error=f"{caught.__class__.__name__}: {caught}",
+        )
+
+    @staticmethod
+    def _succeeded(raw_path: Path, output: AdjudicationOutput) -> AdjudicatorProviderValue:
+        stored = read_json(raw_path)
+        stored["parseResult"] = "VALID"
+        stored["validationCompletedAt"] = utc_now()
+        atomic_write_json(raw_path, stored)
+        return AdjudicatorProviderValue(
+            output=output,
+            rawOutputRef=str(raw_path),
+            success=True,
+            finalDisposition="SUCCESS",
+            providerStatus="SUCCEEDED",
+            error=None,
+        )
+
     def adjudicate(
         self,
         *,
@@ -62,112 +169,75 @@ class PydanticTypedAdjudicator:
         rawDirectory: Path,
         scenario: str,
         turn: str,
+        stageInputKey: str | None = None,
     ) -> tuple[AdjudicationOutput, str, int, int]:
-        operation_key = f"HYBRID-RUNTIME-PROTOTYPE-01:{scenario}:{turn}:ADJUDICATOR"
         started = time.perf_counter()
 
         def execute(reservation: dict[str, Any]) -> AdjudicatorProviderValue:
-            raw_path = rawDirectory / f"request-{reservation['requestNumber']:04d}-adjudicator-{scenario.lower()}-{turn.lower()}.json"
-            request_payload = {
-                "conversation": [item.model_dump(mode="json") for item in turns],
-                "previousState": previousState.model_dump(mode="json") if previousState else None,
-                "immutablePrimaryCandidate": primaryCandidate.model_dump(mode="json"),
-                "deterministicFindings": [item.model_dump(mode="json") for item in deterministicFindings],
-                "semanticAuditFindings": [item.model_dump(mode="json") for item in semanticAuditFindings],
-                "confirmedDecisions": [],
-            }
-            record = {
-                "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
-                "requestNumber": reservation["requestNumber"],
-                "operationKey": reservation["operationKey"],
-                "configuration": "PYDANTIC_TYPED_ADJUDICATOR",
-                "scenario": scenario,
-                "turn": turn,
-                "role": "SEMANTIC_ADJUDICATOR",
-                "provider": "GOOGLE_GEMINI",
-                "model": MODEL,
-                "temperature": None,
-                "promptVersion": ADJUDICATOR_PROMPT_VERSION,
-                "promptDigest": self.promptDigest,
-                "schemaVersion": "SEMANTIC_ADJUDICATION_OUTPUT_0.1.0-experimental",
-                "schemaDigest": self.schemaDigest,
-                "requestPayload": request_payload,
-                "requestPayloadDigest": logical_digest(request_payload),
-                "providerStartedAt": utc_now(),
-                "rawPersistedAt": None,
-                "rawResponse": None,
-                "rawDigest": None,
-                "parseResult": "PENDING",
-                "validationErrors": [],
-                "validationCompletedAt": None,
-            }
-
-            def capture(raw: dict[str, Any]) -> None:
-                record["rawResponse"] = raw
-                record["rawPersistedAt"] = utc_now()
-                record["rawDigest"] = logical_digest(raw)
-                atomic_write_json(raw_path, record)
-
-            model = RawFirstGoogleModel(
-                MODEL,
-                provider=GoogleProvider(
-                    api_key=self.apiKey,
-                    retry_options=types.HttpRetryOptions(attempts=1),
-                ),
-                raw_capture=capture,
-            )
-            agent = Agent(
-                model,
-                output_type=AdjudicationOutput,
-                system_prompt=ADJUDICATOR_SYSTEM_PROMPT,
-                model_settings={"timeout": 45},
-                retries=0,
+            agent, prompt, raw_path, capture = self._prepare(
+                reservation,
+                turns=turns,
+                previousState=previousState,
+                primaryCandidate=primaryCandidate,
+                deterministicFindings=deterministicFindings,
+                semanticAuditFindings=semanticAuditFindings,
+                rawDirectory=rawDirectory,
+                scenario=scenario,
+                turn=turn,
             )
             try:
-                output = agent.run_sync(stable_json(request_payload)).output
-            except BaseException as caught:
-                if not raw_path.exists():
-                    capture({
-                        "kind": "CLIENT_SIDE_FAILURE_BEFORE_PROVIDER_RESPONSE",
-                        "exceptionType": caught.__class__.__name__,
-                        "exception": str(caught)[:4000],
-                    })
-                stored = read_json(raw_path)
-                stored["parseResult"] = "STRUCTURED_CONTRACT_FAILURE"
-                stored["validationErrors"] = [{
-                    "errorType": caught.__class__.__name__,
-                    "message": str(caught)[:4000],
-                }]
-                stored["validationCompletedAt"] = utc_now()
-                atomic_write_json(raw_path, stored)
-                return AdjudicatorProviderValue(
-                    output=AdjudicationOutput(
-                        resolutions=[],
-                        consolidatedInterpretation=None,
-                        unresolvedFindingIds=[item.findingId for item in [*deterministicFindings, *semanticAuditFindings]],
-                        disposition="FAIL_CLOSED",
-                    ),
-                    rawOutputRef=str(raw_path),
-                    success=False,
-                    finalDisposition="STRUCTURED_CONTRACT_FAILURE",
-                    providerStatus="SUCCEEDED" if stored["rawResponse"]["kind"] == "PROVIDER_RESPONSE" else "FAILED",
-                    error=f"{caught.__class__.__name__}: {caught}",
-                )
-            stored = read_json(raw_path)
-            stored["parseResult"] = "VALID"
-            stored["validationCompletedAt"] = utc_now()
-            atomic_write_json(raw_path, stored)
-            return AdjudicatorProviderValue(
-                output=output,
-                rawOutputRef=str(raw_path),
-                success=True,
-                finalDisposition="SUCCESS",
-                providerStatus="SUCCEEDED",
-                error=None,
-            )
+                with bind_raw_capture(capture):
+                    output = agent.run_sync(prompt).output
+            except Exception as caught:
+                return self._failed(raw_path, capture, caught, [*deterministicFindings, *semanticAuditFindings])
+            return self._succeeded(raw_path, output)
 
         result = self.ledger.execute(
-            operationKey=operation_key,
+            operationKey=operation_key(scenario, turn, "ADJUDICATOR", stageInputKey),
+            configuration="PYDANTIC_TYPED_ADJUDICATOR",
+            scenario=scenario,
+            turn=turn,
+            role="SEMANTIC_ADJUDICATOR",
+            function=execute,
+        )
+        return result.output, result.rawOutputRef, round((time.perf_counter() - started) * 1000), 1
+
+    async def adjudicate_async(
+        self,
+        *,
+        turns: list[ConversationTurn],
+        previousState: CandidateScientificState | None,
+        primaryCandidate: CandidateScientificState,
+        deterministicFindings: list[AuditFinding],
+        semanticAuditFindings: list[AuditFinding],
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+        stageInputKey: str | None = None,
+    ) -> tuple[AdjudicationOutput, str, int, int]:
+        started = time.perf_counter()
+
+        async def execute(reservation: dict[str, Any]) -> AdjudicatorProviderValue:
+            agent, prompt, raw_path, capture = self._prepare(
+                reservation,
+                turns=turns,
+                previousState=previousState,
+                primaryCandidate=primaryCandidate,
+                deterministicFindings=deterministicFindings,
+                semanticAuditFindings=semanticAuditFindings,
+                rawDirectory=rawDirectory,
+                scenario=scenario,
+                turn=turn,
+            )
+            try:
+                with bind_raw_capture(capture):
+                    output = (await agent.run(prompt)).output
+            except Exception as caught:
+                return self._failed(raw_path, capture, caught, [*deterministicFindings, *semanticAuditFindings])
+            return self._succeeded(raw_path, output)
+
+        result = await self.ledger.execute_async(
+            operationKey=operation_key(scenario, turn, "ADJUDICATOR", stageInputKey),
             configuration="PYDANTIC_TYPED_ADJUDICATOR",
             scenario=scenario,
             turn=turn,
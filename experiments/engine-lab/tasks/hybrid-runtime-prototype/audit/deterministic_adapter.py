@@ -1,12 +1,24 @@
 from __future__ import annotations
 
-import copy
 import importlib.util
 import sys
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, ClassVar, TypeVar
 
-from contracts.models import AuditFinding, CandidateScientificState, ConversationTurn, SourceEvidence
+from contracts.models import (
+    AuditFinding,
+    CandidateScientificState,
+    ConversationTurn,
+    CorrectionAndSupersession,
+    SourceEvidence,
+)
+from pipeline.snapshot import documents
+from pipeline.storage import file_digest, logical_digest
 
 
 TASK_ROOT = Path(__file__).resolve().parents[1]
@@ -21,13 +33,129 @@ def _load_auditor() -> Any:
         raise RuntimeError("SEM_AUDIT_D_LOAD_FAILED")
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
-    return module.audit_semantic_integrity
+    return module
 
 
-AUDIT = _load_auditor()
+_AUDITOR = _load_auditor()
+AUDIT = _AUDITOR.audit_semantic_integrity
+AUDIT_INCREMENTAL = _AUDITOR.audit_semantic_integrity_incremental
+V = TypeVar("V", bound="ModelView")
 
 
-def _items(candidate: CandidateScientificState) -> list[dict[str, Any]]:
+Spec = str | tuple[str, Callable[[Any], Any]]
+
+
+class ModelView(Mapping[str, Any]):
+    """Read-only audit-payload mapping over one contract model.
+
+    ``SPEC`` maps each payload key to a model attribute, optionally with a transform;
+    keys resolve on access, so building a payload copies nothing. ``dict(view)``
+    materializes it where the payload is serialized. The models stay mutable, so a
+    view always reads them and is never stored beyond one audit.
+    """
+
+    __slots__ = ("model",)
+    SPEC: ClassVar[dict[str, Spec]] = {}
+    FIELDS: ClassVar[dict[str, Callable[[Any], Any]]] = {}
+    ATTRIBUTES: ClassVar[tuple[str, ...]] = ()
+    READ: ClassVar[Callable[[Any], Any]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        fields: dict[str, Callable[[Any], Any]] = {}
+        for key, spec in cls.SPEC.items():
+            attribute, transform = (spec, None) if isinstance(spec, str) else spec
+            read = attrgetter(attribute)
+            fields[key] = read if transform is None else partial(_transformed, read, transform)
+        cls.FIELDS = fields
+        cls.ATTRIBUTES = tuple(dict.fromkeys(spec if isinstance(spec, str) else spec[0] for spec in cls.SPEC.values()))
+        cls.READ = attrgetter(*cls.ATTRIBUTES)
+
+    def __init__(self, model: Any) -> None:
+        self.model = model
+
+    def __getitem__(self, key: str) -> Any:
+        return self.FIELDS[key](self.model)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is type(self):
+            return self.READ(self.model) == self.READ(other.model)
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def _transformed(read: Callable[[Any], Any], transform: Callable[[Any], Any], model: Any) -> Any:
+    return transform(read(model))
+
+
+class ItemView(ModelView):
+    SPEC = {
+        "itemId": "elementId",
+        "semanticIdentity": "semanticIdentity",
+        "label": "content",
+        "conceptClass": ("semanticType", str.upper),
+        "role": ("studyRole", str.upper),
+        "sourceTurnIds": "sourceTurnIds",
+        "sourceText": "sourceText",
+        "polarity": "polarity",
+        "ownership": "ownership",
+        "epistemicStatus": "epistemicStatus",
+        "active": "activeState",
+        "lifecycleStatus": ("epistemicStatus", lambda status: status if status in {"REJECTED_BY_USER"} else None),
+        "originStatus": "originStatus",
+        "adoptionStatus": "adoptionStatus",
+        "originType": "originType",
+        "availabilityScope": "availabilityScope",
+        "availabilityClaim": "availabilityClaim",
+        "decisionId": "decisionId",
+    }
+
+
+class RelationView(ModelView):
+    SPEC = {
+        "relationId": "relationId",
+        "sourceId": "sourceElementId",
+        "targetId": "targetElementId",
+        "relationType": ("relationType", str.upper),
+        "sourceTurnIds": "sourceTurnIds",
+        "sourceText": "sourceText",
+        "polarity": "polarity",
+        "ownership": "ownership",
+        "epistemicStatus": "epistemicStatus",
+        "active": "activeState",
+    }
+
+
+class AmbiguityView(ModelView):
+    SPEC = {
+        name: name for name in ("ambiguityId", "content", "status", "decisionId", "sourceTurnIds", "sourceText")
+    }
+
+
+class ClarificationView(ModelView):
+    SPEC = {
+        "clarificationId": "clarificationId",
+        "status": ("clarificationId", lambda _: "OPEN"),
+        "answerTurnIds": ("clarificationId", lambda _: []),
+    }
+
+
+class CorrectionView(ModelView):
+    # Every field is a string or a list of strings, so this equals ``model_dump(mode="json")``.
+    SPEC = {name: name for name in CorrectionAndSupersession.model_fields}
+
+
+def _items(candidate: CandidateScientificState) -> tuple[ItemView, ...]:
     values = [
         *candidate.objects,
         *candidate.explicitStatements,
@@ -36,94 +164,54 @@ def _items(candidate: CandidateScientificState) -> list[dict[str, Any]]:
         *candidate.negationsAndConstraints,
         *candidate.temporalElements,
     ]
-    result: list[dict[str, Any]] = []
+    result: list[ItemView] = []
     seen: set[tuple[str, str]] = set()
     for item in values:
         key = (item.elementId, item.semanticIdentity or "")
         if key in seen:
             continue
         seen.add(key)
-        result.append({
-            "itemId": item.elementId,
-            "semanticIdentity": item.semanticIdentity,
-            "label": item.content,
-            "conceptClass": item.semanticType.upper(),
-            "role": item.studyRole.upper(),
-            "sourceTurnIds": item.sourceTurnIds,
-            "sourceText": item.sourceText,
-            "polarity": item.polarity,
-            "ownership": item.ownership,
-            "epistemicStatus": item.epistemicStatus,
-            "active": item.activeState,
-            "lifecycleStatus": item.epistemicStatus if item.epistemicStatus in {"REJECTED_BY_USER"} else None,
-            "originStatus": item.originStatus,
-            "adoptionStatus": item.adoptionStatus,
-            "originType": item.originType,
-            "availabilityScope": item.availabilityScope,
-            "availabilityClaim": item.availabilityClaim,
-            "decisionId": item.decisionId,
-        })
-    return result
-
-
-def _relations(candidate: CandidateScientificState) -> list[dict[str, Any]]:
-    return [{
-        "relationId": value.relationId,
-        "sourceId": value.sourceElementId,
-        "targetId": value.targetElementId,
-        "relationType": value.relationType.upper(),
-        "sourceTurnIds": value.sourceTurnIds,
-        "sourceText": value.sourceText,
-        "polarity": value.polarity,
-        "ownership": value.ownership,
-        "epistemicStatus": value.epistemicStatus,
-        "active": value.activeState,
-    } for value in candidate.relations]
-
-
-def _ambiguities(candidate: CandidateScientificState) -> list[dict[str, Any]]:
-    return [{
-        "ambiguityId": value.ambiguityId,
-        "content": value.content,
-        "status": value.status,
-        "decisionId": value.decisionId,
-        "sourceTurnIds": value.sourceTurnIds,
-        "sourceText": value.sourceText,
-    } for value in candidate.ambiguities]
-
-
-def _state(candidate: CandidateScientificState | None) -> dict[str, Any]:
+        result.append(ItemView(item))
+    return tuple(result)
+
+
+def _views(view: type[V], values: list[Any]) -> tuple[V, ...]:
+    return tuple(view(value) for value in values)
+
+
+EMPTY_STATE = MappingProxyType({"items": (), "relations": (), "ambiguities": (), "clarifications": (), "corrections": ()})
+
+
+def _state(candidate: CandidateScientificState | None) -> Mapping[str, Any]:
     if not candidate:
-        return {"items": [], "relations": [], "ambiguities": [], "clarifications": [], "corrections": []}
-    return {
+        return EMPTY_STATE
+    return MappingProxyType({
         "items": _items(candidate),
-        "relations": _relations(candidate),
-        "ambiguities": _ambiguities(candidate),
-        "clarifications": [{
-            "clarificationId": item.clarificationId,
-            "status": "OPEN",
-            "answerTurnIds": [],
-        } for item in candidate.clarificationNeeds],
-        "corrections": [item.model_dump(mode="json") for item in candidate.correctionsAndSupersessions],
-    }
+        "relations": _views(RelationView, candidate.relations),
+        "ambiguities": _views(AmbiguityView, candidate.ambiguities),
+        "clarifications": _views(ClarificationView, candidate.clarificationNeeds),
+        "corrections": _views(CorrectionView, candidate.correctionsAndSupersessions),
+    })
 
 
-def _constraints(candidate: CandidateScientificState) -> list[dict[str, Any]]:
-    constraints: list[dict[str, Any]] = []
+def _constraints(candidate: CandidateScientificState) -> tuple[Mapping[str, Any], ...]:
+    constraints: list[Mapping[str, Any]] = []
     non_causal = any(
         any(token in f"{item.content} {item.sourceText or ''}".casefold() for token in ["caus", "ne cause pas", "pas dire"])
         for item in candidate.negationsAndConstraints
     )
     if non_causal:
+        turn_ids = tuple(turn for item in candidate.negationsAndConstraints for turn in item.sourceTurnIds)
+        text = "; ".join(filter(None, [item.sourceText for item in candidate.negationsAndConstraints]))
         for relation in candidate.relations:
-            constraints.append({
+            constraints.append(MappingProxyType({
                 "type": "NON_CAUSAL",
                 "subjectId": relation.sourceElementId,
                 "targetId": relation.targetElementId,
-                "sourceTurnIds": [turn for item in candidate.negationsAndConstraints for turn in item.sourceTurnIds],
-                "sourceText": "; ".join(filter(None, [item.sourceText for item in candidate.negationsAndConstraints])),
-            })
-    return constraints
+                "sourceTurnIds": turn_ids,
+                "sourceText": text,
+            }))
+    return tuple(constraints)
 
 
 def _source_evidence(finding: dict[str, Any]) -> list[SourceEvidence]:
@@ -141,6 +229,17 @@ STRUCTURAL_ONLY = {"RAW_OUTPUT_NOT_PERSISTED", "PROVENANCE_GAP", "SELF_REFERENTI
 class DeterministicSemanticAuditor:
     runtimeId = "SEM_AUDIT_D"
     runtimeVersion = "0.1.0"
+    configurationDigest = logical_digest({
+        "audit": file_digest(SEM_AUDIT_DIR / "semantic_audit.py"),
+        "guards": file_digest(SEM_AUDIT_DIR / "guards.py"),
+    })
+
+    def __init__(self) -> None:
+        # Last audit record per conversation: successive turns of one conversation differ
+        # by a few elements, so only those are re-checked. A record holds input fingerprints,
+        # never views over the models, which callers may still mutate after the audit.
+        self._last: dict[str, Any] = {}
+        self._lock = threading.Lock()
 
     def audit(
         self,
@@ -152,18 +251,23 @@ class DeterministicSemanticAuditor:
         deterministicFindings: list[AuditFinding] | None = None,
     ) -> list[AuditFinding]:
         del deterministicFindings
-        payload = {
-            "conversationTurns": [turn.model_dump(mode="json") for turn in turns],
+        # Every container is immutable, so the auditor cannot change its input; it fails
+        # with TypeError on an attempt instead of after a before/after comparison.
+        payload = MappingProxyType({
+            "conversationTurns": tuple(MappingProxyType(document) for document in documents(turns)),
             "previousState": _state(previousState),
             "candidateState": _state(candidateState),
-            "confirmedDecisionIds": confirmedDecisionIds,
+            "confirmedDecisionIds": tuple(confirmedDecisionIds),
             "constraints": _constraints(candidateState),
-            "rawProviderOutput": {"persisted": Path(candidateState.source.rawOutputRef).exists()},
-        }
-        before = copy.deepcopy(payload)
-        raw_findings = AUDIT(payload)
-        if payload != before:
-            raise RuntimeError("SEM_AUDIT_D_MUTATED_INPUT")
+            "rawProviderOutput": MappingProxyType({"persisted": Path(candidateState.source.rawOutputRef).exists()}),
+        })
+        conversation = candidateState.identity.conversationId
+        with self._lock:
+            last = self._last.get(conversation)
+        record = AUDIT_INCREMENTAL(payload, previous=last)
+        with self._lock:
+            self._last[conversation] = record
+        raw_findings = record.findings
         return [AuditFinding(
             findingId=finding["findingId"],
             findingClass=finding["findingClass"],
@@ -182,12 +286,13 @@ class DeterministicSemanticAuditor:
 
 
 def audit_payload(candidate: CandidateScientificState) -> dict[str, Any]:
-    """Exposed for tests and the semantic second-reader request."""
+    """Exposed for tests and the semantic second-reader request; materialized, since it is serialized."""
+    state = _state(candidate)
     return {
-        "items": _items(candidate),
-        "relations": _relations(candidate),
-        "ambiguities": _ambiguities(candidate),
-        "corrections": [item.model_dump(mode="json") for item in candidate.correctionsAndSupersessions],
+        "items": [dict(item) for item in state["items"]],
+        "relations": [dict(relation) for relation in state["relations"]],
+        "ambiguities": [dict(ambiguity) for ambiguity in state["ambiguities"]],
+        "corrections": [dict(correction) for correction in state["corrections"]],
         "unknowns": [item.model_dump(mode="json") for item in candidate.unknowns],
         "missingInformation": [item.model_dump(mode="json") for item in candidate.missingInformation],
         "openDecisions": [item.model_dump(mode="json") for item in candidate.openDecisions],
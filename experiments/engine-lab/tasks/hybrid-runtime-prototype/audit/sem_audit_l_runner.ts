@@ -2,6 +2,7 @@ import { createHash } from "node:crypto";
 import { readFileSync, renameSync, writeFileSync } from "node:fs";
 
 import { SCIENTIFIC_SEMANTIC_RECONSTRUCTION_PROMPT } from "../../../../../api/prompts/scientific-semantic-reconstruction-prompt.js";
+import { isServing, serveLines } from "../../../../semantic-engine-comparison/providers/node_worker.mjs";
 
 type Input = {
   experimentId: string;
@@ -113,8 +114,7 @@ const writeAtomic = (path: string, value: unknown) => {
 
 const responseText = (value: any) => value?.candidates?.[0]?.content?.parts?.map((part: any) => part?.text ?? "").join("") ?? "";
 
-const main = async () => {
-  const input = JSON.parse(readFileSync(0, "utf8")) as Input;
+const run = async (input: Input) => {
   const apiKey = process.env.GEMINI_API_KEY ?? "";
   if (!apiKey) throw new Error("GEMINI_API_KEY_REQUIRED");
   const payload = {
@@ -169,7 +169,15 @@ const main = async () => {
   }
 };
 
-void main().catch((caught) => {
-  process.stderr.write(`${caught instanceof Error ? caught.stack ?? caught.message : String(caught)}\n`);
-  process.exitCode = 1;
-});
+const main = async () => {
+  await run(JSON.parse(readFileSync(0, "utf8")) as Input);
+};
+
+if (isServing()) {
+  serveLines(run);
+} else {
+  void main().catch((caught) => {
+    process.stderr.write(`${caught instanceof Error ? caught.stack ?? caught.message : String(caught)}\n`);
+    process.exitCode = 1;
+  });
+}
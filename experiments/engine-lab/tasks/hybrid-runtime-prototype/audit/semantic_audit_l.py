@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
-import subprocess
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -11,11 +13,31 @@ from pydantic import ValidationError
 
 from audit.deterministic_adapter import audit_payload
 from contracts.models import AuditFinding, CandidateScientificState, ConversationTurn, SemanticAuditLBatch
-from pipeline.ledger import MODEL, ProviderLedger, ProviderOperationError
-from pipeline.storage import atomic_write_json, logical_digest, read_json
+from pipeline.ledger import MODEL, ProviderLedger, ProviderOperationError, operation_key
+from pipeline.snapshot import documents
+from pipeline.storage import atomic_write_json, file_digest, logical_digest, read_json
 
 
 PROMPT_VERSION = "SEM-AUDIT-L-NOXIA-SEM-SINGLE-0.1.0-experimental"
+NODE_WORKER_PATH = (
+    Path(__file__).resolve().parents[5] / "experiments" / "semantic-engine-comparison" / "providers" / "node_worker.py"
+)
+
+
+def _load_node_worker() -> Any:
+    name = "semantic_engine_comparison_node_worker"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, NODE_WORKER_PATH)
+    if not spec or not spec.loader:
+        raise RuntimeError("SEM_AUDIT_L_NODE_WORKER_LOAD_FAILED")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+NodeWorkerPool = _load_node_worker().NodeWorkerPool
 
 
 @dataclass
@@ -32,12 +54,138 @@ class SemanticAuditL:
     runtimeId = "NOXIA_SEM_SINGLE_PROMPTED_SECOND_READER"
     runtimeVersion = "0.1.0-experimental"
 
-    def __init__(self, *, ledger: ProviderLedger, apiKey: str, repositoryRoot: Path):
+    def __init__(self, *, ledger: ProviderLedger, apiKey: str, repositoryRoot: Path, runnerPoolSize: int = 1):
         self.ledger = ledger
+        self.runnerPoolSize = runnerPoolSize
         self.apiKey = apiKey
         self.repositoryRoot = repositoryRoot
         self.runner = Path(__file__).resolve().parent / "sem_audit_l_runner.ts"
+        self._worker: Any = None
+        self._worker_lock = threading.Lock()
         self.schemaDigest = logical_digest(SemanticAuditLBatch.model_json_schema())
+        self.promptDigest = logical_digest({
+            "semPromptSource": file_digest(repositoryRoot / "api" / "prompts" / "scientific-semantic-reconstruction-prompt.ts"),
+            "adapterRunner": file_digest(self.runner),
+        })
+        self.configurationDigest = logical_digest({
+            "runtime": self.runtimeId,
+            "runtimeVersion": self.runtimeVersion,
+            "model": MODEL,
+            "promptDigest": self.promptDigest,
+            "schemaDigest": self.schemaDigest,
+        })
+
+    def _request(
+        self,
+        reservation: dict[str, Any],
+        *,
+        turns: list[ConversationTurn],
+        candidateState: CandidateScientificState,
+        findings: list[AuditFinding],
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+    ) -> tuple[Path, dict[str, Any]]:
+        raw_path = rawDirectory / f"request-{reservation['requestNumber']:04d}-audit-l-{scenario.lower()}-{turn.lower()}.json"
+        return raw_path, {
+            "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
+            "requestNumber": reservation["requestNumber"],
+            "operationKey": reservation["operationKey"],
+            "scenario": scenario,
+            "turn": turn,
+            "model": MODEL,
+            "rawPath": str(raw_path),
+            "conversationTurns": documents(turns),
+            "candidateState": audit_payload(candidateState),
+            "deterministicFindings": [item.model_dump(mode="json") for item in findings],
+            "promptVersion": PROMPT_VERSION,
+        }
+
+    def _command(self) -> tuple[list[str], dict[str, str]]:
+        environment = os.environ.copy()
+        environment["GEMINI_API_KEY"] = self.apiKey
+        return [str(self.repositoryRoot / "node_modules" / ".bin" / "vite-node"), str(self.runner)], environment
+
+    def _runner(self) -> Any:
+        # Warm vite-node processes per adapter; Node startup is paid once per campaign.
+        with self._worker_lock:
+            if self._worker is None:
+                command, environment = self._command()
+                self._worker = NodeWorkerPool(command, cwd=self.repositoryRoot, size=self.runnerPoolSize, env=environment)
+            return self._worker
+
+    def _run_runner(self, payload: dict[str, Any]) -> tuple[int, str, str]:
+        reply = self._runner().call(payload)
+        return reply.exit_code, reply.stdout, reply.stderr
+
+    async def _run_runner_async(self, payload: dict[str, Any]) -> tuple[int, str, str]:
+        reply = await self._runner().call_async(payload)
+        return reply.exit_code, reply.stdout, reply.stderr
+
+    def close(self) -> None:
+        with self._worker_lock:
+            if self._worker is not None:
+                self._worker.close()
+                self._worker = None
+
+    def _value(self, raw_path: Path, returncode: int, stdout: str, stderr: str) -> AuditLProviderValue:
+        if returncode != 0:
+            raise ProviderOperationError(
+                "SEM_AUDIT_L_RUNNER_FAILURE",
+                (stderr or stdout or "SEM_AUDIT_L_RUNNER_FAILED")[-4000:],
+                rawOutputRef=str(raw_path) if raw_path.exists() else None,
+            )
+        lines = [line for line in stdout.splitlines() if line.strip()]
+        if not lines:
+            raise ProviderOperationError("SEM_AUDIT_L_EMPTY_OUTPUT", "SEM-AUDIT-L runner returned no status")
+        result = json.loads(lines[-1])
+        status = result.get("status")
+        raw_ref = str(result.get("rawOutputRef") or raw_path)
+        if status in {"NETWORK_FAILURE", "HTTP_FAILURE"}:
+            http = int(result.get("httpStatus") or 0)
+            transient = status == "NETWORK_FAILURE" or http in {429, 502, 503, 504}
+            raise ProviderOperationError(
+                "TRANSIENT_PROVIDER_FAILURE" if transient else "PROVIDER_FAILURE",
+                str(result.get("error") or status)[:4000],
+                transient=transient,
+                rawOutputRef=raw_ref,
+            )
+        if status != "SUCCESS":
+            return AuditLProviderValue(
+                findings=[],
+                rawOutputRef=raw_ref,
+                success=False,
+                finalDisposition=str(status),
+                providerStatus="SUCCEEDED",
+                error=str(result.get("error") or status),
+            )
+        try:
+            batch = SemanticAuditLBatch.model_validate(result["parsed"])
+        except ValidationError as caught:
+            record = read_json(Path(raw_ref))
+            record["parseResult"] = "SCHEMA_FAILURE"
+            record["validationErrors"] = caught.errors(include_url=False)
+            atomic_write_json(Path(raw_ref), record)
+            return AuditLProviderValue(
+                findings=[],
+                rawOutputRef=raw_ref,
+                success=False,
+                finalDisposition="STRUCTURED_CONTRACT_FAILURE",
+                providerStatus="SUCCEEDED",
+                error=str(caught),
+            )
+        record = read_json(Path(raw_ref))
+        record["parseResult"] = "VALID"
+        record["validationErrors"] = []
+        atomic_write_json(Path(raw_ref), record)
+        return AuditLProviderValue(
+            findings=batch.findings,
+            rawOutputRef=raw_ref,
+            success=True,
+            finalDisposition="SUCCESS",
+            providerStatus="SUCCEEDED",
+            error=None,
+        )
 
     def audit_with_metadata(
         self,
@@ -50,97 +198,60 @@ class SemanticAuditL:
         rawDirectory: Path,
         scenario: str,
         turn: str,
+        stageInputKey: str | None = None,
     ) -> AuditLProviderValue:
         del previousState, confirmedDecisionIds
-        findings = deterministicFindings or []
-        operation_key = f"HYBRID-RUNTIME-PROTOTYPE-01:{scenario}:{turn}:SEM_AUDIT_L"
 
         def execute(reservation: dict[str, Any]) -> AuditLProviderValue:
-            raw_path = rawDirectory / f"request-{reservation['requestNumber']:04d}-audit-l-{scenario.lower()}-{turn.lower()}.json"
-            payload = {
-                "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
-                "requestNumber": reservation["requestNumber"],
-                "operationKey": reservation["operationKey"],
-                "scenario": scenario,
-                "turn": turn,
-                "model": MODEL,
-                "rawPath": str(raw_path),
-                "conversationTurns": [item.model_dump(mode="json") for item in turns],
-                "candidateState": audit_payload(candidateState),
-                "deterministicFindings": [item.model_dump(mode="json") for item in findings],
-                "promptVersion": PROMPT_VERSION,
-            }
-            environment = os.environ.copy()
-            environment["GEMINI_API_KEY"] = self.apiKey
-            completed = subprocess.run(
-                [str(self.repositoryRoot / "node_modules" / ".bin" / "vite-node"), str(self.runner)],
-                cwd=self.repositoryRoot,
-                input=json.dumps(payload, ensure_ascii=False),
-                text=True,
-                capture_output=True,
-                check=False,
-                env=environment,
-            )
-            if completed.returncode != 0:
-                raise ProviderOperationError(
-                    "SEM_AUDIT_L_RUNNER_FAILURE",
-                    (completed.stderr or completed.stdout or "SEM_AUDIT_L_RUNNER_FAILED")[-4000:],
-                    rawOutputRef=str(raw_path) if raw_path.exists() else None,
-                )
-            lines = [line for line in completed.stdout.splitlines() if line.strip()]
-            if not lines:
-                raise ProviderOperationError("SEM_AUDIT_L_EMPTY_OUTPUT", "SEM-AUDIT-L runner returned no status")
-            result = json.loads(lines[-1])
-            status = result.get("status")
-            raw_ref = str(result.get("rawOutputRef") or raw_path)
-            if status in {"NETWORK_FAILURE", "HTTP_FAILURE"}:
-                http = int(result.get("httpStatus") or 0)
-                transient = status == "NETWORK_FAILURE" or http in {429, 502, 503, 504}
-                raise ProviderOperationError(
-                    "TRANSIENT_PROVIDER_FAILURE" if transient else "PROVIDER_FAILURE",
-                    str(result.get("error") or status)[:4000],
-                    transient=transient,
-                    rawOutputRef=raw_ref,
-                )
-            if status != "SUCCESS":
-                return AuditLProviderValue(
-                    findings=[],
-                    rawOutputRef=raw_ref,
-                    success=False,
-                    finalDisposition=str(status),
-                    providerStatus="SUCCEEDED",
-                    error=str(result.get("error") or status),
-                )
-            try:
-                batch = SemanticAuditLBatch.model_validate(result["parsed"])
-            except ValidationError as caught:
-                record = read_json(Path(raw_ref))
-                record["parseResult"] = "SCHEMA_FAILURE"
-                record["validationErrors"] = caught.errors(include_url=False)
-                atomic_write_json(Path(raw_ref), record)
-                return AuditLProviderValue(
-                    findings=[],
-                    rawOutputRef=raw_ref,
-                    success=False,
-                    finalDisposition="STRUCTURED_CONTRACT_FAILURE",
-                    providerStatus="SUCCEEDED",
-                    error=str(caught),
-                )
-            record = read_json(Path(raw_ref))
-            record["parseResult"] = "VALID"
-            record["validationErrors"] = []
-            atomic_write_json(Path(raw_ref), record)
-            return AuditLProviderValue(
-                findings=batch.findings,
-                rawOutputRef=raw_ref,
-                success=True,
-                finalDisposition="SUCCESS",
-                providerStatus="SUCCEEDED",
-                error=None,
+            raw_path, payload = self._request(
+                reservation,
+                turns=turns,
+                candidateState=candidateState,
+                findings=deterministicFindings or [],
+                rawDirectory=rawDirectory,
+                scenario=scenario,
+                turn=turn,
             )
+            return self._value(raw_path, *self._run_runner(payload))
 
         return self.ledger.execute(
-            operationKey=operation_key,
+            operationKey=operation_key(scenario, turn, "SEM_AUDIT_L", stageInputKey),
+            configuration="SEM_AUDIT_L",
+            scenario=scenario,
+            turn=turn,
+            role="SEMANTIC_AUDITOR",
+            function=execute,
+        )
+
+    async def audit_with_metadata_async(
+        self,
+        *,
+        turns: list[ConversationTurn],
+        previousState: CandidateScientificState | None,
+        candidateState: CandidateScientificState,
+        confirmedDecisionIds: list[str],
+        deterministicFindings: list[AuditFinding] | None = None,
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+        stageInputKey: str | None = None,
+    ) -> AuditLProviderValue:
+        del previousState, confirmedDecisionIds
+
+        async def execute(reservation: dict[str, Any]) -> AuditLProviderValue:
+            raw_path, payload = self._request(
+                reservation,
+                turns=turns,
+                candidateState=candidateState,
+                findings=deterministicFindings or [],
+                rawDirectory=rawDirectory,
+                scenario=scenario,
+                turn=turn,
+            )
+            return self._value(raw_path, *await self._run_runner_async(payload))
+
+        return await self.ledger.execute_async(
+            operationKey=operation_key(scenario, turn, "SEM_AUDIT_L", stageInputKey),
             configuration="SEM_AUDIT_L",
             scenario=scenario,
             turn=turn,
@@ -150,3 +261,6 @@ class SemanticAuditL:
 
     def audit(self, **kwargs: Any) -> list[AuditFinding]:
         return self.audit_with_metadata(**kwargs).findings
+
+    async def audit_async(self, **kwargs: Any) -> list[AuditFinding]:
+        return (await self.audit_with_metadata_async(**kwargs)).findings
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable
+
+
+TASK_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(TASK_ROOT))
+
+from audit.deterministic_adapter import DeterministicSemanticAuditor  # noqa: E402
+from contracts.models import CandidateScientificState  # noqa: E402
+from pipeline.storage import compact_json, read_json  # noqa: E402
+
+try:
+    import pyarrow
+    import pyarrow.feather
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional columnar output
+    pyarrow = None
+
+
+KINDS = ("candidate-states", "consolidated-states")
+COLUMNS = (
+    "resultRoot",
+    "stateKind",
+    "scenario",
+    "turn",
+    "stateId",
+    "previousStateId",
+    "findingId",
+    "findingClass",
+    "severity",
+    "candidatePointer",
+    "resolutionOwner",
+    "structuralOnly",
+)
+
+
+def _turn_key(turn: str) -> list[Any]:
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", turn)]
+
+
+def _state(record: dict[str, Any], kind: str) -> dict[str, Any] | None:
+    if kind == "candidate-states":
+        return record["candidateState"]
+    return record["consolidated"].get("candidateState")
+
+
+def corpus_chains(result_roots: Iterable[Path]) -> list[list[dict[str, Any]]]:
+    """One ordered chain of audit jobs per (result root, scenario).
+
+    Each job carries the stored state and the previous state the pipeline handed to
+    SEM-AUDIT-D for that turn: the previous consolidated state, or the previous
+    primary candidate when consolidation produced none.
+    """
+
+    chains: list[list[dict[str, Any]]] = []
+    for result_root in result_roots:
+        records: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+        for kind in KINDS:
+            for path in sorted((result_root / kind).glob("*.json")):
+                record = read_json(path)
+                records.setdefault(record["scenario"], {}).setdefault(record["turn"], {})[kind] = record
+        for scenario in sorted(records):
+            jobs: list[dict[str, Any]] = []
+            previous: dict[str, Any] | None = None
+            for turn in sorted(records[scenario], key=_turn_key):
+                stored = records[scenario][turn]
+                states = {kind: _state(stored[kind], kind) for kind in KINDS if kind in stored}
+                for kind, state in states.items():
+                    if state is not None:
+                        jobs.append({
+                            "resultRoot": str(result_root),
+                            "stateKind": kind,
+                            "scenario": scenario,
+                            "turn": turn,
+                            "state": state,
+                            "previousState": previous,
+                        })
+                previous = states.get("consolidated-states") or states.get("candidate-states") or previous
+            chains.append(jobs)
+    return chains
+
+
+def audit_chain(jobs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Audit one chain in order; runs in a worker process."""
+
+    auditor = DeterministicSemanticAuditor()
+    rows: list[dict[str, Any]] = []
+    for job in jobs:
+        state = CandidateScientificState.model_validate(job["state"])
+        previous = CandidateScientificState.model_validate(job["previousState"]) if job["previousState"] else None
+        findings = auditor.audit(
+            turns=state.source.turns,
+            previousState=previous,
+            candidateState=state,
+            confirmedDecisionIds=[],
+        )
+        for finding in findings:
+            rows.append({
+                "resultRoot": job["resultRoot"],
+                "stateKind": job["stateKind"],
+                "scenario": job["scenario"],
+                "turn": job["turn"],
+                "stateId": state.identity.stateId,
+                "previousStateId": previous.identity.stateId if previous else None,
+                "findingId": finding.findingId,
+                "findingClass": finding.findingClass,
+                "severity": finding.severity,
+                "candidatePointer": finding.candidatePointer,
+                "resolutionOwner": finding.resolutionOwner,
+                "structuralOnly": finding.structuralOnly,
+            })
+    return rows
+
+
+def audit_corpus(result_roots: Iterable[Path], *, processes: int = 1) -> list[dict[str, Any]]:
+    """Re-run SEM-AUDIT-D over every stored state; rows keep root, scenario and turn order."""
+
+    if processes < 1:
+        raise RuntimeError("CORPUS_AUDIT_PROCESSES_INVALID")
+    chains = [chain for chain in corpus_chains(result_roots) if chain]
+    if processes == 1 or len(chains) < 2:
+        results = [audit_chain(chain) for chain in chains]
+    else:
+        with ProcessPoolExecutor(max_workers=min(processes, len(chains))) as executor:
+            results = list(executor.map(audit_chain, chains))
+    return [row for rows in results for row in rows]
+
+
+def write_table(rows: list[dict[str, Any]], output: Path) -> str:
+    """Parquet for ``.parquet``, Arrow IPC for ``.arrow``/``.feather``, compact JSONL otherwise."""
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temporary = output.with_suffix(output.suffix + ".tmp")
+    if output.suffix in {".parquet", ".arrow", ".feather"}:
+        if pyarrow is None:
+            raise RuntimeError("CORPUS_AUDIT_PYARROW_REQUIRED")
+        table = pyarrow.table({column: [row[column] for row in rows] for column in COLUMNS})
+        if output.suffix == ".parquet":
+            pyarrow.parquet.write_table(table, temporary)
+        else:
+            pyarrow.feather.write_feather(table, temporary)
+        format_name = output.suffix.lstrip(".")
+    else:
+        temporary.write_text("".join(compact_json(row) + "\n" for row in rows), encoding="utf-8")
+        format_name = "jsonl"
+    temporary.replace(output)
+    return format_name
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("result_roots", type=Path, nargs="+")
+    parser.add_argument("--output", type=Path, required=True)
+    parser.add_argument("--processes", type=int, default=1)
+    args = parser.parse_args()
+    rows = audit_corpus(args.result_roots, processes=args.processes)
+    format_name = write_table(rows, args.output)
+    print(json.dumps({
+        "format": format_name,
+        "findings": len(rows),
+        "findingClasses": dict(sorted(Counter(row["findingClass"] for row in rows).items())),
+    }, sort_keys=True))
+
+
+if __name__ == "__main__":
+    main()
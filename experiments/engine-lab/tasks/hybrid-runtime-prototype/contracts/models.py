@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+import itertools
+from functools import cache
+from typing import Any, Literal, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+import pydantic_core
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, model_validator
 
 
 EpistemicStatus = Literal[
@@ -20,11 +23,132 @@ EpistemicStatus = Literal[
 ]
 Polarity = Literal["AFFIRMED", "NEGATED", "UNCERTAIN", "CONDITIONAL"]
 Severity = Literal["INFO", "MINOR", "MAJOR", "CRITICAL"]
+# Validation context flag set by the checkpoint reader for files whose exact bytes already passed validation.
+TRUSTED_CHECKPOINT = "trustedCheckpoint"
+
+
+def _trusted(info: ValidationInfo) -> bool:
+    return bool(info.context and info.context.get(TRUSTED_CHECKPOINT))
+
+
+PROJECT_ADOPTED = "PROJECT_ADOPTED"
+_SCALARS = (bool, int, float, type(None))
+
+
+def _may_carry_text(annotation: Any) -> bool:
+    if annotation in _SCALARS:
+        return False
+    if get_origin(annotation) is Literal:
+        return any(PROJECT_ADOPTED in str(value).upper() for value in get_args(annotation))
+    arguments = get_args(annotation)
+    if arguments:
+        return any(_may_carry_text(argument) for argument in arguments)
+    return True
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _field_kind(annotation: Any) -> str | None:
+    if not _may_carry_text(annotation):
+        return None
+    if annotation is str or _is_model(annotation):
+        return "text" if annotation is str else "model"
+    arguments = get_args(annotation)
+    if get_origin(annotation) is list and len(arguments) == 1 and (arguments[0] is str or _is_model(arguments[0])):
+        return "texts" if arguments[0] is str else "models"
+    optional = [argument for argument in arguments if argument is not type(None)]
+    if len(optional) == 1 and len(arguments) == 2 and (optional[0] is str or _is_model(optional[0])):
+        return "optionalText" if optional[0] is str else "optionalModel"
+    return "any"
+
+
+_KINDS = ("text", "optionalText", "texts", "model", "optionalModel", "models", "any")
+
+
+@cache
+def _scan_plan(model: type[BaseModel]) -> tuple[tuple[str, ...], ...]:
+    """Fields that can spell the status, grouped by shape in ``_KINDS`` order.
+
+    Literal vocabularies, flags and numbers cannot spell it and are never visited.
+    """
+
+    kinds = {name: _field_kind(field.annotation) for name, field in model.model_fields.items()}
+    return tuple(tuple(name for name, found in kinds.items() if found == kind) for kind in _KINDS)
+
+
+def _gather(value: BaseModel, texts: list[str]) -> None:
+    """Append every string of the model that can spell the status to ``texts``."""
+
+    text, optional_text, text_lists, models, optional_models, model_lists, loose = _scan_plan(type(value))
+    fields = value.__dict__
+    for name in text:
+        texts.append(fields[name])
+    for name in optional_text:
+        if fields[name] is not None:
+            texts.append(fields[name])
+    for name in text_lists:
+        texts.extend(fields[name])
+    for name in models:
+        _gather(fields[name], texts)
+    for name in optional_models:
+        if fields[name] is not None:
+            _gather(fields[name], texts)
+    for name in model_lists:
+        for item in fields[name]:
+            _gather(item, texts)
+    for name in loose:
+        _gather_any(fields[name], texts)
+
+
+def _gather_any(value: Any, texts: list[str]) -> None:
+    if isinstance(value, str):
+        texts.append(value)
+    elif isinstance(value, BaseModel):
+        _gather(value, texts)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _gather_any(item, texts)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _gather_any(key, texts)
+            _gather_any(item, texts)
+    elif not isinstance(value, _SCALARS):
+        texts.append(pydantic_core.to_json(value).decode("utf-8"))
+
+
+def carries_project_adoption(value: BaseModel) -> bool:
+    """Whether ``value.model_dump_json().upper()`` would contain PROJECT_ADOPTED, without serializing it.
+
+    The status cannot span JSON tokens, so it can only appear inside one string
+    value or ``Any`` key; the scan gathers exactly those and upper-cases them once.
+    Nothing is memoized: these models are mutable and the pipeline edits some in place.
+    """
+
+    texts: list[str] = []
+    _gather(value, texts)
+    return PROJECT_ADOPTED in "\n".join(texts).upper()
+
+
+_ASSIGNMENTS = itertools.count(1)
+_generation = 0
+
+
+def assignment_generation() -> int:
+    """Moves on every attribute assignment to any contract model; list contents edited in place do not count."""
+
+    return _generation
 
 
 class StrictModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        global _generation
+        super().__setattr__(name, value)
+        _generation = next(_ASSIGNMENTS)
+
 
 class ConversationTurn(StrictModel):
     turnId: str
@@ -312,9 +436,10 @@ class AdjudicationOutput(StrictModel):
     ]
 
     @model_validator(mode="after")
-    def forbid_project_adoption(self) -> "AdjudicationOutput":
-        material = self.model_dump_json().upper()
-        if "PROJECT_ADOPTED" in material:
+    def forbid_project_adoption(self, info: ValidationInfo) -> "AdjudicationOutput":
+        if _trusted(info):
+            return self
+        if carries_project_adoption(self):
             raise ValueError("Adjudicator cannot emit PROJECT_ADOPTED")
         return self
 
@@ -344,8 +469,9 @@ class ConsolidatedCandidateState(StrictModel):
     latencyMs: int
 
     @model_validator(mode="after")
-    def forbid_project_adoption(self) -> "ConsolidatedCandidateState":
-        material = self.model_dump_json().upper()
-        if "PROJECT_ADOPTED" in material:
+    def forbid_project_adoption(self, info: ValidationInfo) -> "ConsolidatedCandidateState":
+        if _trusted(info):
+            return self
+        if carries_project_adoption(self):
             raise ValueError("Consolidated candidate cannot emit PROJECT_ADOPTED")
         return self
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import contextvars
 import importlib.metadata
+import threading
 import time
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from google.genai import types
 from pydantic_ai import Agent
@@ -20,8 +25,9 @@ from contracts.models import (
     RuntimeIdentity,
 )
 from interpreter.prompts import PRIMARY_PROMPT_VERSION, PRIMARY_SYSTEM_PROMPT
-from pipeline.ledger import MODEL, ProviderLedger, utc_now
+from pipeline.ledger import MODEL, ProviderLedger, operation_key, utc_now
 from pipeline.projection import build_candidate_state
+from pipeline.snapshot import documents, snapshot
 from pipeline.storage import atomic_write_json, logical_digest, read_json, stable_json
 
 
@@ -36,36 +42,142 @@ class PydanticProviderValue:
     error: str | None
 
 
+@dataclass
+class _RawCapture:
+    capture: Callable[[dict[str, Any]], None]
+    captured: bool = False
+
+
+_REQUEST_CAPTURE: contextvars.ContextVar[_RawCapture | None] = contextvars.ContextVar("raw_capture", default=None)
+
+
+@contextlib.contextmanager
+def bind_raw_capture(capture: Callable[[dict[str, Any]], None]) -> Iterator[None]:
+    """Route the raw provider response of every request made in this context to ``capture``."""
+
+    token = _REQUEST_CAPTURE.set(_RawCapture(capture))
+    try:
+        yield
+    finally:
+        _REQUEST_CAPTURE.reset(token)
+
+
 class RawFirstGoogleModel(GoogleModel):
-    """Capture the SDK response before PydanticAI processes or validates it."""
+    """Capture the SDK response before PydanticAI processes or validates it.
 
-    def __init__(self, *args: Any, raw_capture: Callable[[dict[str, Any]], None], **kwargs: Any):
+    A pooled model has no capture of its own; each request binds one with
+    ``bind_raw_capture``. A capture given at construction is the fallback.
+    """
+
+    def __init__(self, *args: Any, raw_capture: Callable[[dict[str, Any]], None] | None = None, **kwargs: Any):
         super().__init__(*args, **kwargs)
-        self._raw_capture = raw_capture
-        self._captured = False
+        self._default_capture = _RawCapture(raw_capture) if raw_capture is not None else None
+
+    def _bound_capture(self) -> _RawCapture:
+        bound = _REQUEST_CAPTURE.get() or self._default_capture
+        if bound is None:
+            raise RuntimeError("RAW_CAPTURE_NOT_BOUND")
+        return bound
 
     def _process_response(self, response: Any) -> Any:
-        self._raw_capture({
+        bound = self._bound_capture()
+        bound.capture({
             "kind": "PROVIDER_RESPONSE",
             "response": response.model_dump(mode="json", by_alias=True, exclude_none=False),
         })
-        self._captured = True
+        bound.captured = True
         return super()._process_response(response)
 
     async def request(self, *args: Any, **kwargs: Any) -> Any:
+        bound = self._bound_capture()
         try:
             return await super().request(*args, **kwargs)
         except BaseException as caught:
-            if not self._captured:
-                self._raw_capture({
+            if not bound.captured:
+                bound.capture({
                     "kind": "PROVIDER_EXCEPTION",
                     "exceptionType": caught.__class__.__name__,
                     "exception": str(caught)[:4000],
                 })
-                self._captured = True
+                bound.captured = True
             raise
 
 
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """The loop the next agent call will run on: the running one, else the thread's ``run_sync`` loop."""
+
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = None
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop
+
+
+@dataclass
+class _LoopClients:
+    model: RawFirstGoogleModel
+    agents: dict[tuple[type, str], Agent[None, Any]]
+
+
+class AgentPool:
+    """Reuses one provider, model and compiled agent per output contract.
+
+    HTTP connections belong to an event loop, so clients are pooled per loop: the
+    persistent ``run_sync`` loop of each worker thread, or the caller's running loop.
+    """
+
+    def __init__(self, *, apiKey: str):
+        self.apiKey = apiKey
+        self.created = 0
+        self._lock = threading.Lock()
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients] = weakref.WeakKeyDictionary()
+
+    def agent(self, outputType: type, systemPrompt: str) -> Agent[None, Any]:
+        loop = _event_loop()
+        with self._lock:
+            clients = self._clients.get(loop)
+            if clients is None:
+                model = RawFirstGoogleModel(
+                    MODEL,
+                    provider=GoogleProvider(
+                        api_key=self.apiKey,
+                        retry_options=types.HttpRetryOptions(attempts=1),
+                    ),
+                )
+                clients = self._clients[loop] = _LoopClients(model=model, agents={})
+            agent = clients.agents.get((outputType, systemPrompt))
+            if agent is None:
+                agent = clients.agents[(outputType, systemPrompt)] = Agent(
+                    clients.model,
+                    output_type=outputType,
+                    system_prompt=systemPrompt,
+                    model_settings={"timeout": 45},
+                    retries=0,
+                )
+                self.created += 1
+            return agent
+
+
+_POOLS: dict[str, AgentPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def shared_agent_pool(apiKey: str) -> AgentPool:
+    """One pool per credential, shared by the primary interpreter and the adjudicator."""
+
+    with _POOLS_LOCK:
+        if apiKey not in _POOLS:
+            _POOLS[apiKey] = AgentPool(apiKey=apiKey)
+        return _POOLS[apiKey]
+
+
 def render_conversation(turns: list[ConversationTurn]) -> str:
     return "\n".join(f"{turn.turnId} | {turn.role}: {turn.content}" for turn in turns)
 
@@ -74,9 +186,10 @@ class PydanticPrimaryInterpreter:
     runtimeId = "PYDANTIC_AI_DIRECT"
     runtimeVersion = "0.1.0-experimental"
 
-    def __init__(self, *, ledger: ProviderLedger, apiKey: str):
+    def __init__(self, *, ledger: ProviderLedger, apiKey: str, pool: AgentPool | None = None):
         self.ledger = ledger
         self.apiKey = apiKey
+        self.pool = pool or shared_agent_pool(apiKey)
         self.schemaDigest = logical_digest(PrimaryScientificInterpretation.model_json_schema())
         self.promptDigest = logical_digest({"version": PRIMARY_PROMPT_VERSION, "prompt": PRIMARY_SYSTEM_PROMPT})
         self.configurationDigest = logical_digest({
@@ -103,6 +216,101 @@ class PydanticPrimaryInterpreter:
             configurationDigest=self.configurationDigest,
         )
 
+    def _prepare(
+        self,
+        reservation: dict[str, Any],
+        *,
+        turns: list[ConversationTurn],
+        previousCandidateState: CandidateScientificState | None,
+        contextInputs: list[ContextInput],
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+    ) -> tuple[Agent[None, PrimaryScientificInterpretation], str, Path, Callable[[dict[str, Any]], None]]:
+        raw_path = rawDirectory / f"request-{reservation['requestNumber']:04d}-primary-{scenario.lower()}-{turn.lower()}.json"
+        request_payload = {
+            "conversation": documents(turns),
+            "previousCandidateState": snapshot(previousCandidateState).document if previousCandidateState else None,
+            "contextInputs": documents(contextInputs),
+        }
+        request_metadata = {
+            "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
+            "requestNumber": reservation["requestNumber"],
+            "operationKey": reservation["operationKey"],
+            "configuration": reservation["configuration"],
+            "scenario": scenario,
+            "turn": turn,
+            "role": "PRIMARY_INTERPRETER",
+            "provider": "GOOGLE_GEMINI",
+            "model": MODEL,
+            "temperature": None,
+            "promptVersion": PRIMARY_PROMPT_VERSION,
+            "promptDigest": self.promptDigest,
+            "schemaVersion": "PRIMARY_SCIENTIFIC_INTERPRETATION_0.1.0-experimental",
+            "schemaDigest": self.schemaDigest,
+            "requestPayload": request_payload,
+            "requestPayloadDigest": logical_digest(request_payload),
+            "providerStartedAt": utc_now(),
+            "rawPersistedAt": None,
+            "rawResponse": None,
+            "rawDigest": None,
+            "parseResult": "PENDING",
+            "validationErrors": [],
+            "validationCompletedAt": None,
+            "candidateStateRef": None,
+        }
+
+        def capture(raw: dict[str, Any]) -> None:
+            request_metadata["rawResponse"] = raw
+            request_metadata["rawPersistedAt"] = utc_now()
+            request_metadata["rawDigest"] = logical_digest(raw)
+            atomic_write_json(raw_path, request_metadata)
+
+        agent = self.pool.agent(PrimaryScientificInterpretation, PRIMARY_SYSTEM_PROMPT)
+        return agent, stable_json(request_payload), raw_path, capture
+
+    @staticmethod
+    def _failed(raw_path: Path, capture: Callable[[dict[str, Any]], None], caught: Exception) -> PydanticProviderValue:
+        if not raw_path.exists():
+            capture({
+                "kind": "CLIENT_SIDE_FAILURE_BEFORE_PROVIDER_RESPONSE",
+                "exceptionType": caught.__class__.__name__,
+                "exception": str(caught)[:4000],
+            })
+        stored = read_json(raw_path)
+        stored["parseResult"] = "STRUCTURED_CONTRACT_FAILURE"
+        stored["validationErrors"] = [{
+            "errorType": caught.__class__.__name__,
+            "message": str(caught)[:4000],
+        }]
+        stored["validationCompletedAt"] = utc_now()
+        atomic_write_json(raw_path, stored)
+        return PydanticProviderValue(
+            interpretation=None,
+            rawOutputRef=str(raw_path),
+            rawDigest=str(stored["rawDigest"]),
+            success=False,
+            finalDisposition="STRUCTURED_CONTRACT_FAILURE",
+            providerStatus="SUCCEEDED" if stored["rawResponse"]["kind"] == "PROVIDER_RESPONSE" else "FAILED",
+            error=f"{caught.__class__.__name__}: {caught}",
+        )
+
+    @staticmethod
+    def _succeeded(raw_path: Path, output: PrimaryScientificInterpretation) -> PydanticProviderValue:
+        stored = read_json(raw_path)
+        stored["parseResult"] = "VALID"
+        stored["validationCompletedAt"] = utc_now()
+        atomic_write_json(raw_path, stored)
+        return PydanticProviderValue(
+            interpretation=output,
+            rawOutputRef=str(raw_path),
+            rawDigest=str(stored["rawDigest"]),
+            success=True,
+            finalDisposition="SUCCESS",
+            providerStatus="SUCCEEDED",
+            error=None,
+        )
+
     def _call(
         self,
         *,
@@ -112,113 +320,27 @@ class PydanticPrimaryInterpreter:
         rawDirectory: Path,
         scenario: str,
         turn: str,
+        stageInputKey: str | None,
     ) -> PydanticProviderValue:
-        operation_key = f"HYBRID-RUNTIME-PROTOTYPE-01:{scenario}:{turn}:PRIMARY"
-
         def execute(reservation: dict[str, Any]) -> PydanticProviderValue:
-            raw_path = rawDirectory / f"request-{reservation['requestNumber']:04d}-primary-{scenario.lower()}-{turn.lower()}.json"
-            request_metadata = {
-                "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
-                "requestNumber": reservation["requestNumber"],
-                "operationKey": reservation["operationKey"],
-                "configuration": reservation["configuration"],
-                "scenario": scenario,
-                "turn": turn,
-                "role": "PRIMARY_INTERPRETER",
-                "provider": "GOOGLE_GEMINI",
-                "model": MODEL,
-                "temperature": None,
-                "promptVersion": PRIMARY_PROMPT_VERSION,
-                "promptDigest": self.promptDigest,
-                "schemaVersion": "PRIMARY_SCIENTIFIC_INTERPRETATION_0.1.0-experimental",
-                "schemaDigest": self.schemaDigest,
-                "requestPayload": {
-                    "conversation": [item.model_dump(mode="json") for item in turns],
-                    "previousCandidateState": previousCandidateState.model_dump(mode="json") if previousCandidateState else None,
-                    "contextInputs": [item.model_dump(mode="json") for item in contextInputs],
-                },
-                "requestPayloadDigest": logical_digest({
-                    "conversation": [item.model_dump(mode="json") for item in turns],
-                    "previousCandidateState": previousCandidateState.model_dump(mode="json") if previousCandidateState else None,
-                    "contextInputs": [item.model_dump(mode="json") for item in contextInputs],
-                }),
-                "providerStartedAt": utc_now(),
-                "rawPersistedAt": None,
-                "rawResponse": None,
-                "rawDigest": None,
-                "parseResult": "PENDING",
-                "validationErrors": [],
-                "validationCompletedAt": None,
-                "candidateStateRef": None,
-            }
-
-            def capture(raw: dict[str, Any]) -> None:
-                request_metadata["rawResponse"] = raw
-                request_metadata["rawPersistedAt"] = utc_now()
-                request_metadata["rawDigest"] = logical_digest(raw)
-                atomic_write_json(raw_path, request_metadata)
-
-            model = RawFirstGoogleModel(
-                MODEL,
-                provider=GoogleProvider(
-                    api_key=self.apiKey,
-                    retry_options=types.HttpRetryOptions(attempts=1),
-                ),
-                raw_capture=capture,
-            )
-            agent = Agent(
-                model,
-                output_type=PrimaryScientificInterpretation,
-                system_prompt=PRIMARY_SYSTEM_PROMPT,
-                model_settings={"timeout": 45},
-                retries=0,
+            agent, prompt, raw_path, capture = self._prepare(
+                reservation,
+                turns=turns,
+                previousCandidateState=previousCandidateState,
+                contextInputs=contextInputs,
+                rawDirectory=rawDirectory,
+                scenario=scenario,
+                turn=turn,
             )
             try:
-                result = agent.run_sync(stable_json({
-                    "conversation": [item.model_dump(mode="json") for item in turns],
-                    "previousCandidateState": previousCandidateState.model_dump(mode="json") if previousCandidateState else None,
-                    "contextInputs": [item.model_dump(mode="json") for item in contextInputs],
-                }))
-            except BaseException as caught:
-                if not raw_path.exists():
-                    capture({
-                        "kind": "CLIENT_SIDE_FAILURE_BEFORE_PROVIDER_RESPONSE",
-                        "exceptionType": caught.__class__.__name__,
-                        "exception": str(caught)[:4000],
-                    })
-                stored = read_json(raw_path)
-                stored["parseResult"] = "STRUCTURED_CONTRACT_FAILURE"
-                stored["validationErrors"] = [{
-                    "errorType": caught.__class__.__name__,
-                    "message": str(caught)[:4000],
-                }]
-                stored["validationCompletedAt"] = utc_now()
-                atomic_write_json(raw_path, stored)
-                return PydanticProviderValue(
-                    interpretation=None,
-                    rawOutputRef=str(raw_path),
-                    rawDigest=str(stored["rawDigest"]),
-                    success=False,
-                    finalDisposition="STRUCTURED_CONTRACT_FAILURE",
-                    providerStatus="SUCCEEDED" if stored["rawResponse"]["kind"] == "PROVIDER_RESPONSE" else "FAILED",
-                    error=f"{caught.__class__.__name__}: {caught}",
-                )
-            stored = read_json(raw_path)
-            stored["parseResult"] = "VALID"
-            stored["validationCompletedAt"] = utc_now()
-            atomic_write_json(raw_path, stored)
-            return PydanticProviderValue(
-                interpretation=result.output,
-                rawOutputRef=str(raw_path),
-                rawDigest=str(stored["rawDigest"]),
-                success=True,
-                finalDisposition="SUCCESS",
-                providerStatus="SUCCEEDED",
-                error=None,
-            )
+                with bind_raw_capture(capture):
+                    result = agent.run_sync(prompt)
+            except Exception as caught:
+                return self._failed(raw_path, capture, caught)
+            return self._succeeded(raw_path, result.output)
 
         return self.ledger.execute(
-            operationKey=operation_key,
+            operationKey=operation_key(scenario, turn, "PRIMARY", stageInputKey),
             configuration="PYDANTIC_PRIMARY",
             scenario=scenario,
             turn=turn,
@@ -226,26 +348,53 @@ class PydanticPrimaryInterpreter:
             function=execute,
         )
 
-    def interpret(
+    async def _call_async(
         self,
         *,
-        conversationId: str,
         turns: list[ConversationTurn],
         previousCandidateState: CandidateScientificState | None,
         contextInputs: list[ContextInput],
         rawDirectory: Path,
         scenario: str,
         turn: str,
-    ) -> InterpreterResult:
-        started = time.perf_counter()
-        value = self._call(
-            turns=turns,
-            previousCandidateState=previousCandidateState,
-            contextInputs=contextInputs,
-            rawDirectory=rawDirectory,
+        stageInputKey: str | None,
+    ) -> PydanticProviderValue:
+        async def execute(reservation: dict[str, Any]) -> PydanticProviderValue:
+            agent, prompt, raw_path, capture = self._prepare(
+                reservation,
+                turns=turns,
+                previousCandidateState=previousCandidateState,
+                contextInputs=contextInputs,
+                rawDirectory=rawDirectory,
+                scenario=scenario,
+                turn=turn,
+            )
+            try:
+                with bind_raw_capture(capture):
+                    result = await agent.run(prompt)
+            except Exception as caught:
+                return self._failed(raw_path, capture, caught)
+            return self._succeeded(raw_path, result.output)
+
+        return await self.ledger.execute_async(
+            operationKey=operation_key(scenario, turn, "PRIMARY", stageInputKey),
+            configuration="PYDANTIC_PRIMARY",
             scenario=scenario,
             turn=turn,
+            role="PRIMARY_INTERPRETER",
+            function=execute,
         )
+
+    def _result(
+        self,
+        value: PydanticProviderValue,
+        *,
+        conversationId: str,
+        turns: list[ConversationTurn],
+        previousCandidateState: CandidateScientificState | None,
+        contextInputs: list[ContextInput],
+        started: float,
+    ) -> InterpreterResult:
         interpretation = value.interpretation or PrimaryScientificInterpretation(normalizedUnderstanding="")
         candidate = build_candidate_state(
             conversationId=conversationId,
@@ -267,3 +416,65 @@ class PydanticPrimaryInterpreter:
             latencyMs=round((time.perf_counter() - started) * 1000),
             providerCalls=1,
         )
+
+    def interpret(
+        self,
+        *,
+        conversationId: str,
+        turns: list[ConversationTurn],
+        previousCandidateState: CandidateScientificState | None,
+        contextInputs: list[ContextInput],
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+        stageInputKey: str | None = None,
+    ) -> InterpreterResult:
+        started = time.perf_counter()
+        value = self._call(
+            turns=turns,
+            previousCandidateState=previousCandidateState,
+            contextInputs=contextInputs,
+            rawDirectory=rawDirectory,
+            scenario=scenario,
+            turn=turn,
+            stageInputKey=stageInputKey,
+        )
+        return self._result(
+            value,
+            conversationId=conversationId,
+            turns=turns,
+            previousCandidateState=previousCandidateState,
+            contextInputs=contextInputs,
+            started=started,
+        )
+
+    async def interpret_async(
+        self,
+        *,
+        conversationId: str,
+        turns: list[ConversationTurn],
+        previousCandidateState: CandidateScientificState | None,
+        contextInputs: list[ContextInput],
+        rawDirectory: Path,
+        scenario: str,
+        turn: str,
+        stageInputKey: str | None = None,
+    ) -> InterpreterResult:
+        started = time.perf_counter()
+        value = await self._call_async(
+            turns=turns,
+            previousCandidateState=previousCandidateState,
+            contextInputs=contextInputs,
+            rawDirectory=rawDirectory,
+            scenario=scenario,
+            turn=turn,
+            stageInputKey=stageInputKey,
+        )
+        return self._result(
+            value,
+            conversationId=conversationId,
+            turns=turns,
+            previousCandidateState=previousCandidateState,
+            contextInputs=contextInputs,
+            started=started,
+        )
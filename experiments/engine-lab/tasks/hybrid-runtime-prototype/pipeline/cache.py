@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from pipeline.storage import atomic_write_json, logical_digest, read_json
+
+
+CACHE_VERSION = "1"
+
+
+def stage_key(stage: str, inputs: dict[str, Any]) -> str:
+    return logical_digest({"cacheVersion": CACHE_VERSION, "stage": stage, "inputs": inputs})
+
+
+class StageCache:
+    """Content-addressed store of pipeline stage records, shareable across result roots.
+
+    Entries are immutable JSON files named by the digest of the stage inputs. Recency
+    is the file modification time, refreshed on every hit, so least-recently-used
+    eviction survives process restarts and concurrent campaigns sharing one root.
+    """
+
+    def __init__(self, root: Path, *, maxEntries: int | None = None, maxBytes: int | None = None):
+        self.root = root
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Path, int] | None = None
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.root / stage / key[:2] / f"{key}.json"
+
+    def _load_entries(self) -> OrderedDict[Path, int]:
+        if self._entries is None:
+            found = [
+                (path.stat().st_mtime_ns, path, path.stat().st_size)
+                for path in self.root.glob("*/*/*.json")
+            ] if self.root.exists() else []
+            self._entries = OrderedDict((path, size) for _, path, size in sorted(found))
+        return self._entries
+
+    def get(self, stage: str, key: str) -> dict[str, Any] | None:
+        path = self._path(stage, key)
+        with self._lock:
+            entries = self._load_entries()
+            if not path.exists():
+                entries.pop(path, None)
+                self.misses[stage] = self.misses.get(stage, 0) + 1
+                return None
+            os.utime(path)
+            entries[path] = path.stat().st_size
+            entries.move_to_end(path)
+            self.hits[stage] = self.hits.get(stage, 0) + 1
+        return read_json(path)
+
+    def put(self, stage: str, key: str, record: dict[str, Any]) -> None:
+        path = self._path(stage, key)
+        atomic_write_json(path, record)
+        with self._lock:
+            entries = self._load_entries()
+            entries[path] = path.stat().st_size
+            entries.move_to_end(path)
+            self._evict(entries)
+
+    def _evict(self, entries: OrderedDict[Path, int]) -> None:
+        while entries and (
+            (self.maxEntries is not None and len(entries) > self.maxEntries)
+            or (self.maxBytes is not None and sum(entries.values()) > self.maxBytes)
+        ):
+            path, _ = entries.popitem(last=False)
+            path.unlink(missing_ok=True)
+            self.evictions += 1
+
+    def statistics(self) -> dict[str, Any]:
+        with self._lock:
+            entries = self._load_entries()
+            return {
+                "hits": dict(self.hits),
+                "misses": dict(self.misses),
+                "evictions": self.evictions,
+                "entries": len(entries),
+                "bytes": sum(entries.values()),
+            }
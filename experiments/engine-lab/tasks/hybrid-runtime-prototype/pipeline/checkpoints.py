@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import threading
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+import contracts.models
+from contracts.models import (
+    TRUSTED_CHECKPOINT,
+    AdjudicationOutput,
+    AuditFinding,
+    CandidateScientificState,
+    ConsolidatedCandidateState,
+)
+from pipeline.storage import atomic_write_json, checkpoint_payload, file_digest, read_json
+
+
+MANIFEST_VERSION = "1"
+R = TypeVar("R", bound="RecordEnvelope")
+
+
+class RecordEnvelope(BaseModel):
+    """Typed view of a stage record; bookkeeping fields nobody reads back are ignored."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    stageInputKey: str | None = None
+
+
+class CandidateRecord(RecordEnvelope):
+    candidateState: CandidateScientificState
+    primaryProviderCalls: int = 0
+    primaryLatencyMs: int = 0
+
+
+class FindingsRecord(RecordEnvelope):
+    findings: list[AuditFinding] = Field(default_factory=list)
+    triggered: bool = False
+    triggerReasons: list[str] = Field(default_factory=list)
+    providerCalls: int = 0
+    latencyMs: int = 0
+    technicalFailure: bool = False
+
+
+class AdjudicationRecord(RecordEnvelope):
+    output: AdjudicationOutput | None = None
+    triggered: bool = False
+    triggerReasons: list[str] = Field(default_factory=list)
+    providerCalls: int = 0
+    latencyMs: int = 0
+    technicalFailure: bool = False
+
+
+class ConsolidatedRecord(RecordEnvelope):
+    p0CandidateStateId: str | None = None
+    p1CandidateStateId: str | None = None
+    p2CandidateStateId: str | None = None
+    p3PrimaryCandidateStateId: str | None = None
+    consolidated: ConsolidatedCandidateState
+
+
+@functools.cache
+def record_adapter(envelope: type[R]) -> TypeAdapter[R]:
+    return TypeAdapter(envelope)
+
+
+def contract_digest() -> str:
+    return file_digest(Path(contracts.models.__file__))
+
+
+class VerifiedManifest:
+    """Digests of checkpoint files that already passed full validation, per envelope.
+
+    A listed file is read on the trusted path: the schema is still enforced, but the
+    contract's whole-record PROJECT_ADOPTED validators are skipped, since these
+    exact bytes already passed them. Any byte change yields a new digest and a full
+    validation; a manifest written under another ``contracts/models.py`` is discarded.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.contractDigest = contract_digest()
+        self._lock = threading.Lock()
+        self._changed = False
+        stored = read_json(path) if path.exists() else {}
+        if stored.get("manifestVersion") != MANIFEST_VERSION or stored.get("contractDigest") != self.contractDigest:
+            stored = {}
+        self._verified = {name: set(digests) for name, digests in stored.get("verified", {}).items()}
+
+    def contains(self, envelope: str, digest: str) -> bool:
+        with self._lock:
+            return digest in self._verified.get(envelope, ())
+
+    def add(self, envelope: str, digest: str) -> None:
+        with self._lock:
+            digests = self._verified.setdefault(envelope, set())
+            if digest not in digests:
+                digests.add(digest)
+                self._changed = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._changed:
+                return
+            atomic_write_json(self.path, {
+                "manifestVersion": MANIFEST_VERSION,
+                "contractDigest": self.contractDigest,
+                "verified": {name: sorted(digests) for name, digests in sorted(self._verified.items())},
+            })
+            self._changed = False
+
+
+def read_record(path: Path, envelope: type[R], *, manifest: VerifiedManifest | None = None) -> R:
+    """Validate a checkpoint straight from its bytes into ``envelope``, without an intermediate dict."""
+
+    data = path.read_bytes()
+    adapter = record_adapter(envelope)
+    if manifest is None:
+        return adapter.validate_json(checkpoint_payload(data))
+    digest = hashlib.sha256(data).hexdigest()
+    if manifest.contains(envelope.__name__, digest):
+        return adapter.validate_json(checkpoint_payload(data), context={TRUSTED_CHECKPOINT: True})
+    record = adapter.validate_json(checkpoint_payload(data))
+    manifest.add(envelope.__name__, digest)
+    return record
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, Coroutine, TypeVar
 
 from adapters.protocols import ScientificInterpreterAdapter, SemanticAdjudicatorAdapter, SemanticAuditorAdapter
 from contracts.models import (
@@ -15,13 +16,37 @@ from contracts.models import (
     ContextInput,
     ConversationTurn,
     RuntimeIdentity,
+    carries_project_adoption,
+)
+from pipeline.cache import StageCache, stage_key
+from pipeline.checkpoints import (
+    AdjudicationRecord,
+    CandidateRecord,
+    FindingsRecord,
+    RecordEnvelope,
+    read_record,
+    record_adapter,
 )
 from pipeline.projection import build_candidate_state
-from pipeline.storage import atomic_write_json, file_digest, logical_digest, read_json
+from pipeline.snapshot import documents, snapshot
+from pipeline.storage import atomic_write_json, checkpoint_digest, logical_digest
 from pipeline.triggers import adjudication_trigger, semantic_audit_trigger
 
 
 PIPELINE_VERSION = "0.1.0-experimental"
+T = TypeVar("T")
+R = TypeVar("R", bound=RecordEnvelope)
+
+
+def _run_synchronously(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Drive a coroutine whose awaits all complete without suspending."""
+
+    try:
+        coroutine.send(None)
+    except StopIteration as finished:
+        return finished.value
+    coroutine.close()
+    raise RuntimeError("SYNCHRONOUS_PIPELINE_SUSPENDED")
 
 
 @dataclass(frozen=True)
@@ -48,12 +73,14 @@ class HybridRuntimePipeline:
         semanticAuditor: SemanticAuditorAdapter,
         adjudicator: SemanticAdjudicatorAdapter,
         resultRoot: Path,
+        cache: StageCache | None = None,
     ):
         self.primary = primary
         self.deterministicAuditor = deterministicAuditor
         self.semanticAuditor = semanticAuditor
         self.adjudicator = adjudicator
         self.resultRoot = resultRoot
+        self.cache = cache
 
     def _paths(self, scenario: str, turn: str) -> dict[str, Path]:
         stem = f"{scenario.lower()}-{turn.lower()}"
@@ -67,7 +94,7 @@ class HybridRuntimePipeline:
 
     @staticmethod
     def _unsafe_project_adoption(candidate: CandidateScientificState) -> bool:
-        return "PROJECT_ADOPTED" in candidate.model_dump_json().upper()
+        return carries_project_adoption(candidate)
 
     def _consolidate(
         self,
@@ -94,6 +121,7 @@ class HybridRuntimePipeline:
         ]
         resolutions = adjudication.resolutions if adjudication else []
         candidate: CandidateScientificState | None = primary.model_copy(deep=True)
+        screened = primary
         disposition = "CANDIDATE_ACCEPTABLE"
 
         if adjudicatorFailed:
@@ -120,12 +148,13 @@ class HybridRuntimePipeline:
                     previousState=previousState,
                     interpretation=adjudication.consolidatedInterpretation,
                     rawOutputRef=primary.source.rawOutputRef,
-                    rawDigest=file_digest(Path(primary.source.rawOutputRef)),
+                    rawDigest=checkpoint_digest(Path(primary.source.rawOutputRef)),
                     runtimeIdentity=identity,
                     contextInputs=primary.contextInputs,
                 )
                 candidate.auditStatus = "COMPLETE"
                 candidate.adjudicationStatus = "COMPLETE"
+                screened = candidate
             elif disposition in {"FAIL_CLOSED", "NOT_EVALUABLE"}:
                 candidate = None
         elif unresolved:
@@ -133,7 +162,8 @@ class HybridRuntimePipeline:
         elif primary.clarificationNeeds:
             disposition = "NEEDS_CLARIFICATION"
 
-        if candidate and self._unsafe_project_adoption(candidate):
+        # An untouched copy carries exactly what the primary carries.
+        if candidate and self._unsafe_project_adoption(screened):
             candidate = None
             disposition = "FAIL_CLOSED"
         open_decisions = candidate.openDecisions if candidate else primary.openDecisions
@@ -160,6 +190,54 @@ class HybridRuntimePipeline:
             latencyMs=latencyMs,
         )
 
+    @staticmethod
+    def _adapter_identity(adapter: Any) -> dict[str, str]:
+        return {
+            name: str(getattr(adapter, name, "NOT_EXPOSED"))
+            for name in ["runtimeId", "runtimeVersion", "promptDigest", "schemaDigest", "configurationDigest"]
+        }
+
+    @staticmethod
+    def _supports(adapter: Any, method: str, asynchronous: bool) -> bool:
+        return hasattr(adapter, method) or (asynchronous and hasattr(adapter, f"{method}_async"))
+
+    @staticmethod
+    async def _invoke(adapter: Any, method: str, asynchronous: bool, **kwargs: Any) -> Any:
+        """Call the asyncio-native adapter variant when running on a loop, else the blocking one."""
+
+        if not asynchronous:
+            return getattr(adapter, method)(**kwargs)
+        native = getattr(adapter, f"{method}_async", None)
+        if native is not None:
+            return await native(**kwargs)
+        return await asyncio.to_thread(getattr(adapter, method), **kwargs)
+
+    async def _checkpoint(
+        self,
+        path: Path,
+        stage: str,
+        inputs: dict[str, Any],
+        compute: Callable[[str], Awaitable[dict[str, Any]]],
+        envelope: type[R],
+    ) -> R:
+        """Reuse a stage record only when its input key matches; otherwise ``compute(key)`` builds it."""
+
+        key = stage_key(stage, {"pipelineVersion": PIPELINE_VERSION, **inputs})
+        if path.exists():
+            stored = read_record(path, envelope)
+            if stored.stageInputKey in {None, key}:
+                return stored
+        if self.cache is not None:
+            cached = self.cache.get(stage, key)
+            if cached is not None:
+                atomic_write_json(path, cached)
+                return record_adapter(envelope).validate_python(cached)
+        record = {**await compute(key), "stageInputKey": key}
+        atomic_write_json(path, record)
+        if self.cache is not None:
+            self.cache.put(stage, key, record)
+        return record_adapter(envelope).validate_python(record)
+
     def run_state(
         self,
         *,
@@ -170,19 +248,68 @@ class HybridRuntimePipeline:
         previousState: CandidateScientificState | None,
         contextInputs: list[ContextInput],
         experimentalFinalState: bool,
+    ) -> PipelineResult:
+        return _run_synchronously(self._run_state(
+            asynchronous=False,
+            scenario=scenario,
+            turn=turn,
+            conversationId=conversationId,
+            turns=turns,
+            previousState=previousState,
+            contextInputs=contextInputs,
+            experimentalFinalState=experimentalFinalState,
+        ))
+
+    async def run_state_async(
+        self,
+        *,
+        scenario: str,
+        turn: str,
+        conversationId: str,
+        turns: list[ConversationTurn],
+        previousState: CandidateScientificState | None,
+        contextInputs: list[ContextInput],
+        experimentalFinalState: bool,
+    ) -> PipelineResult:
+        """Same stages as ``run_state``; provider adapters are awaited on the running loop."""
+
+        return await self._run_state(
+            asynchronous=True,
+            scenario=scenario,
+            turn=turn,
+            conversationId=conversationId,
+            turns=turns,
+            previousState=previousState,
+            contextInputs=contextInputs,
+            experimentalFinalState=experimentalFinalState,
+        )
+
+    async def _run_state(
+        self,
+        *,
+        asynchronous: bool,
+        scenario: str,
+        turn: str,
+        conversationId: str,
+        turns: list[ConversationTurn],
+        previousState: CandidateScientificState | None,
+        contextInputs: list[ContextInput],
+        experimentalFinalState: bool,
     ) -> PipelineResult:
         paths = self._paths(scenario, turn)
         started = time.perf_counter()
         provider_calls = 0
         latency = 0
+        shared_inputs = {
+            "turns": documents(turns),
+            "previousStateId": previousState.identity.stateId if previousState else None,
+        }
 
-        if paths["candidate"].exists():
-            record = read_json(paths["candidate"])
-            primary = CandidateScientificState.model_validate(record["candidateState"])
-            primary_calls = int(record["primaryProviderCalls"])
-            primary_latency = int(record["primaryLatencyMs"])
-        else:
-            primary_result = self.primary.interpret(
+        async def primary_record(stageInputKey: str) -> dict[str, Any]:
+            result = await self._invoke(
+                self.primary,
+                "interpret",
+                asynchronous,
                 conversationId=conversationId,
                 turns=turns,
                 previousCandidateState=previousState,
@@ -190,65 +317,87 @@ class HybridRuntimePipeline:
                 rawDirectory=self.resultRoot / "raw",
                 scenario=scenario,
                 turn=turn,
+                stageInputKey=stageInputKey,
             )
-            primary = primary_result.candidate
-            primary_calls = primary_result.providerCalls
-            primary_latency = primary_result.latencyMs
-            atomic_write_json(paths["candidate"], {
+            return {
                 "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
                 "scenario": scenario,
                 "turn": turn,
                 "ablation": "P0_PYDANTIC_DIRECT",
-                "primaryOutputIdentity": primary.identity.stateId,
-                "rawOutputRef": primary.source.rawOutputRef,
-                "primaryProviderCalls": primary_calls,
-                "primaryLatencyMs": primary_latency,
-                "candidateState": primary.model_dump(mode="json"),
-            })
-        provider_calls += primary_calls
-        latency += primary_latency
-
-        if paths["deterministic"].exists():
-            record = read_json(paths["deterministic"])
-            deterministic = [AuditFinding.model_validate(item) for item in record["findings"]]
-        else:
-            before = primary.model_dump(mode="json")
-            deterministic = self.deterministicAuditor.audit(
+                "primaryOutputIdentity": result.candidate.identity.stateId,
+                "rawOutputRef": result.candidate.source.rawOutputRef,
+                "primaryProviderCalls": result.providerCalls,
+                "primaryLatencyMs": result.latencyMs,
+                "candidateState": snapshot(result.candidate).document,
+            }
+
+        candidate_stage = await self._checkpoint(paths["candidate"], "candidate", {
+            **shared_inputs,
+            "conversationId": conversationId,
+            "contextInputs": documents(contextInputs),
+            "adapter": self._adapter_identity(self.primary),
+        }, primary_record, CandidateRecord)
+        primary = candidate_stage.candidateState
+        primary_snapshot = snapshot(primary)
+        provider_calls += candidate_stage.primaryProviderCalls
+        latency += candidate_stage.primaryLatencyMs
+
+        async def deterministic_record(_: str) -> dict[str, Any]:
+            findings = self.deterministicAuditor.audit(
                 turns=turns,
                 previousState=previousState,
                 candidateState=primary,
                 confirmedDecisionIds=[],
             )
-            if primary.model_dump(mode="json") != before:
+            if not primary_snapshot.unchanged(primary):
                 raise RuntimeError("SEM_AUDIT_D_MUTATED_PRIMARY_CANDIDATE")
-            atomic_write_json(paths["deterministic"], {
+            return {
                 "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
                 "scenario": scenario,
                 "turn": turn,
                 "ablation": "P1_PYDANTIC_PLUS_AUDIT_D",
                 "primaryOutputIdentity": primary.identity.stateId,
                 "candidateMutated": False,
-                "findings": [item.model_dump(mode="json") for item in deterministic],
-            })
+                "findings": [item.model_dump(mode="json") for item in findings],
+            }
+
+        deterministic_stage = await self._checkpoint(paths["deterministic"], "deterministic", {
+            **shared_inputs,
+            "primaryStateId": primary.identity.stateId,
+            "adapter": self._adapter_identity(self.deterministicAuditor),
+        }, deterministic_record, FindingsRecord)
+        deterministic = deterministic_stage.findings
 
         audit_triggered, audit_reasons = semantic_audit_trigger(
             primary,
             deterministic,
             experimentalFinalState=experimentalFinalState,
         )
-        semantic: list[AuditFinding] = []
-        audit_unavailable = False
-        if paths["semantic"].exists():
-            record = read_json(paths["semantic"])
-            semantic = [AuditFinding.model_validate(item) for item in record["findings"]]
-            audit_calls = int(record.get("providerCalls", 0))
-            audit_latency = int(record.get("latencyMs", 0))
-            audit_unavailable = bool(record.get("technicalFailure"))
-        elif audit_triggered:
+
+        async def semantic_record(stageInputKey: str) -> dict[str, Any]:
+            if not audit_triggered:
+                return {
+                    "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
+                    "scenario": scenario,
+                    "turn": turn,
+                    "ablation": "P2_PYDANTIC_PLUS_AUDIT_D_PLUS_AUDIT_L",
+                    "primaryOutputIdentity": primary.identity.stateId,
+                    "triggered": False,
+                    "triggerReasons": [],
+                    "candidateMutated": False,
+                    "rawOutputRef": None,
+                    "providerCalls": 0,
+                    "latencyMs": 0,
+                    "technicalFailure": False,
+                    "finalDisposition": "NOT_REQUIRED",
+                    "findings": [],
+                }
             audit_started = time.perf_counter()
-            before = primary.model_dump(mode="json")
-            if hasattr(self.semanticAuditor, "audit_with_metadata"):
-                output = self.semanticAuditor.audit_with_metadata(
+            if self._supports(self.semanticAuditor, "audit_with_metadata", asynchronous):
+                output = await self._invoke(
+                    self.semanticAuditor,
+                    "audit_with_metadata",
+                    asynchronous,
                     turns=turns,
                     previousState=previousState,
                     candidateState=primary,
@@ -257,14 +406,18 @@ class HybridRuntimePipeline:
                     rawDirectory=self.resultRoot / "raw",
                     scenario=scenario,
                     turn=turn,
+                    stageInputKey=stageInputKey,
                 )
-                semantic = output.findings
+                findings = output.findings
                 audit_calls = 1
-                audit_unavailable = not output.success
+                unavailable = not output.success
                 raw_ref = output.rawOutputRef
                 final_disposition = output.finalDisposition
             else:
-                semantic = self.semanticAuditor.audit(
+                findings = await self._invoke(
+                    self.semanticAuditor,
+                    "audit",
+                    asynchronous,
                     turns=turns,
                     previousState=previousState,
                     candidateState=primary,
@@ -272,12 +425,12 @@ class HybridRuntimePipeline:
                     deterministicFindings=deterministic,
                 )
                 audit_calls = 0
+                unavailable = False
                 raw_ref = None
                 final_disposition = "LOCAL_TEST_ADAPTER"
-            if primary.model_dump(mode="json") != before:
+            if not primary_snapshot.unchanged(primary):
                 raise RuntimeError("SEM_AUDIT_L_MUTATED_PRIMARY_CANDIDATE")
-            audit_latency = round((time.perf_counter() - audit_started) * 1000)
-            atomic_write_json(paths["semantic"], {
+            return {
                 "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
                 "scenario": scenario,
                 "turn": turn,
@@ -288,44 +441,47 @@ class HybridRuntimePipeline:
                 "candidateMutated": False,
                 "rawOutputRef": raw_ref,
                 "providerCalls": audit_calls,
-                "latencyMs": audit_latency,
-                "technicalFailure": audit_unavailable,
+                "latencyMs": round((time.perf_counter() - audit_started) * 1000),
+                "technicalFailure": unavailable,
                 "finalDisposition": final_disposition,
-                "findings": [item.model_dump(mode="json") for item in semantic],
-            })
-        else:
-            audit_calls = 0
-            audit_latency = 0
-            atomic_write_json(paths["semantic"], {
-                "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
-                "scenario": scenario,
-                "turn": turn,
-                "ablation": "P2_PYDANTIC_PLUS_AUDIT_D_PLUS_AUDIT_L",
-                "primaryOutputIdentity": primary.identity.stateId,
-                "triggered": False,
-                "triggerReasons": [],
-                "candidateMutated": False,
-                "rawOutputRef": None,
-                "providerCalls": 0,
-                "latencyMs": 0,
-                "technicalFailure": False,
-                "finalDisposition": "NOT_REQUIRED",
-                "findings": [],
-            })
-        provider_calls += audit_calls
-        latency += audit_latency
+                "findings": [item.model_dump(mode="json") for item in findings],
+            }
+
+        semantic_stage = await self._checkpoint(paths["semantic"], "semantic", {
+            **shared_inputs,
+            "primaryStateId": primary.identity.stateId,
+            "deterministicFindingIds": [item.findingId for item in deterministic],
+            "triggered": audit_triggered,
+            "triggerReasons": audit_reasons,
+            "adapter": self._adapter_identity(self.semanticAuditor),
+        }, semantic_record, FindingsRecord)
+        semantic = semantic_stage.findings
+        audit_unavailable = semantic_stage.technicalFailure
+        provider_calls += semantic_stage.providerCalls
+        latency += semantic_stage.latencyMs
 
         adjudicator_triggered, adjudicator_reasons = adjudication_trigger(primary, deterministic, semantic)
-        adjudication: AdjudicationOutput | None = None
-        adjudicator_failed = False
-        if paths["adjudication"].exists():
-            record = read_json(paths["adjudication"])
-            adjudication = AdjudicationOutput.model_validate(record["output"]) if record.get("output") else None
-            adjudicator_calls = int(record.get("providerCalls", 0))
-            adjudicator_latency = int(record.get("latencyMs", 0))
-            adjudicator_failed = bool(record.get("technicalFailure"))
-        elif adjudicator_triggered and not audit_unavailable:
-            adjudication, raw_ref, adjudicator_latency, adjudicator_calls = self.adjudicator.adjudicate(
+
+        async def adjudication_record(stageInputKey: str) -> dict[str, Any]:
+            if not adjudicator_triggered or audit_unavailable:
+                return {
+                    "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
+                    "scenario": scenario,
+                    "turn": turn,
+                    "ablation": "P3_FULL_HYBRID_CANDIDATE",
+                    "primaryOutputIdentity": primary.identity.stateId,
+                    "triggered": False,
+                    "triggerReasons": adjudicator_reasons,
+                    "rawOutputRef": None,
+                    "providerCalls": 0,
+                    "latencyMs": 0,
+                    "technicalFailure": audit_unavailable,
+                    "output": None,
+                }
+            output, raw_ref, adjudicator_latency, adjudicator_calls = await self._invoke(
+                self.adjudicator,
+                "adjudicate",
+                asynchronous,
                 turns=turns,
                 previousState=previousState,
                 primaryCandidate=primary,
@@ -334,9 +490,9 @@ class HybridRuntimePipeline:
                 rawDirectory=self.resultRoot / "raw",
                 scenario=scenario,
                 turn=turn,
+                stageInputKey=stageInputKey,
             )
-            adjudicator_failed = adjudication.disposition == "FAIL_CLOSED" and adjudication.consolidatedInterpretation is None
-            atomic_write_json(paths["adjudication"], {
+            return {
                 "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
                 "scenario": scenario,
                 "turn": turn,
@@ -347,28 +503,23 @@ class HybridRuntimePipeline:
                 "rawOutputRef": raw_ref,
                 "providerCalls": adjudicator_calls,
                 "latencyMs": adjudicator_latency,
-                "technicalFailure": adjudicator_failed,
-                "output": adjudication.model_dump(mode="json"),
-            })
-        else:
-            adjudicator_calls = 0
-            adjudicator_latency = 0
-            atomic_write_json(paths["adjudication"], {
-                "experimentId": "HYBRID-RUNTIME-PROTOTYPE-01",
-                "scenario": scenario,
-                "turn": turn,
-                "ablation": "P3_FULL_HYBRID_CANDIDATE",
-                "primaryOutputIdentity": primary.identity.stateId,
-                "triggered": False,
-                "triggerReasons": adjudicator_reasons,
-                "rawOutputRef": None,
-                "providerCalls": 0,
-                "latencyMs": 0,
-                "technicalFailure": audit_unavailable,
-                "output": None,
-            })
-        provider_calls += adjudicator_calls
-        latency += adjudicator_latency
+                "technicalFailure": output.disposition == "FAIL_CLOSED" and output.consolidatedInterpretation is None,
+                "output": output.model_dump(mode="json"),
+            }
+
+        adjudication_stage = await self._checkpoint(paths["adjudication"], "adjudication", {
+            **shared_inputs,
+            "primaryStateId": primary.identity.stateId,
+            "deterministicFindingIds": [item.findingId for item in deterministic],
+            "semanticFindingIds": [item.findingId for item in semantic],
+            "auditUnavailable": audit_unavailable,
+            "triggered": adjudicator_triggered,
+            "adapter": self._adapter_identity(self.adjudicator),
+        }, adjudication_record, AdjudicationRecord)
+        adjudication = adjudication_stage.output
+        adjudicator_failed = adjudication_stage.triggered and adjudication_stage.technicalFailure
+        provider_calls += adjudication_stage.providerCalls
+        latency += adjudication_stage.latencyMs
 
         consolidated = self._consolidate(
             primary=primary,
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import json
+import threading
 import time
+from collections import Counter
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import Any, Awaitable, Callable, TypeVar
 
-from pipeline.storage import append_jsonl
+from pipeline.storage import PROVIDERS_DIR, load_shared
 
 
 MODEL = "gemini-3.5-flash-lite"
 MAX_NEW_PROVIDER_REQUESTS = 80
 MAX_STARTS_PER_ROLLING_60_SECONDS = 10
 MAX_TRANSIENT_RETRY = 1
+RATE_LIMIT_PATH = PROVIDERS_DIR / "rate_limit.py"
+JSONL_WRITER_PATH = PROVIDERS_DIR / "jsonl_writer.py"
 T = TypeVar("T")
 
 
+RollingWindowLimiter = load_shared(
+    "semantic_engine_comparison_rate_limit", RATE_LIMIT_PATH, "PROVIDER_RATE_LIMIT_LOAD_FAILED"
+).RollingWindowLimiter
+JsonlWriter = load_shared(
+    "semantic_engine_comparison_jsonl_writer", JSONL_WRITER_PATH, "PROVIDER_LEDGER_WRITER_LOAD_FAILED"
+).JsonlWriter
+
+
 def utc_now() -> str:
     return dt.datetime.now(dt.timezone.utc).isoformat().replace("+00:00", "Z")
 
@@ -35,41 +48,132 @@ class ProviderOperationError(RuntimeError):
         self.rawOutputRef = rawOutputRef
 
 
+def operation_key(scenario: str, turn: str, role: str, stageInputKey: str | None = None) -> str:
+    """Ledger key of one provider operation.
+
+    A stage recomputed for changed inputs is a new operation, so the key carries the
+    stage input key; the same inputs keep the same key and are never replayed.
+    """
+
+    key = f"HYBRID-RUNTIME-PROTOTYPE-01:{scenario}:{turn}:{role}"
+    return key if stageInputKey is None else f"{key}:{stageInputKey[:24]}"
+
+
+def _timestamp(value: Any) -> float | None:
+    try:
+        return dt.datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
 class ProviderLedger:
-    def __init__(self, path: Path):
+    """Append-only provider ledger shared by every adapter and scenario worker.
+
+    The file stays the only source of truth. An in-memory index is built once and
+    then advanced by tailing the bytes appended since the last read, whoever wrote
+    them. Reservation (replay check, pacing, budget check, numbering, append) runs
+    inside the limiter's admission slot, so parallel scenarios are admitted in
+    arrival order and cannot overrun the rate or budget.
+
+    Events go through one open ``JsonlWriter``: RESERVED is fsynced before the
+    provider call may start, other events use the writer's ``durability`` policy.
+
+    Adapters turn provider and validation failures (any ``Exception``) into a failed
+    value. Anything else reaching the ledger, such as ``asyncio.CancelledError`` when
+    the scheduler cancels sibling scenarios, completes the reservation as INTERRUPTED
+    with ``replayAllowed`` so a resumed run may issue the operation again.
+    """
+
+    def __init__(self, path: Path, *, limiter: Any | None = None, durability: str = "group"):
         self.path = path
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.path.touch(exist_ok=True)
+        self.writer = JsonlWriter(path, durability=durability)
+        self.limiter = limiter or RollingWindowLimiter(limit=MAX_STARTS_PER_ROLLING_60_SECONDS)
+        self._index_lock = threading.RLock()
+        self._reset_index()
+        self.limiter.add_observer(self._refresh)
+
+    def _reset_index(self) -> None:
+        self._offset = 0
+        self._events: list[dict[str, Any]] = []
+        self._reservations: list[dict[str, Any]] = []
+        self._terminal: set[str] = set()
+        self._role_counts: Counter[str] = Counter()
+        self._configuration_counts: Counter[str] = Counter()
+
+    def _index(self, event: dict[str, Any]) -> None:
+        self._events.append(event)
+        if event.get("event") == "RESERVED":
+            self._reservations.append(event)
+            self._role_counts[str(event.get("role"))] += 1
+            self._configuration_counts[str(event.get("configuration"))] += 1
+            stamp = _timestamp(event.get("reservedAt"))
+            if stamp is not None:
+                self.limiter.record(stamp, str(event.get("role")), token=f"{self.path}:{event.get('requestNumber')}")
+        elif event.get("event") == "COMPLETED" and event.get("replayAllowed") is False:
+            self._terminal.add(str(event["operationKey"]))
+
+    def _refresh(self) -> None:
+        with self._index_lock:
+            size = self.path.stat().st_size
+            if size < self._offset:
+                self._reset_index()
+            if size == self._offset:
+                return
+            with self.path.open("rb") as handle:
+                handle.seek(self._offset)
+                chunk = handle.read(size - self._offset)
+            # A trailing fragment without newline is an append still in flight.
+            complete = chunk[: chunk.rfind(b"\n") + 1]
+            for line in complete.decode("utf-8").splitlines():
+                if line.strip():
+                    self._index(json.loads(line))
+            self._offset += len(complete)
+
+    def _append(self, value: dict[str, Any]) -> None:
+        # Not under the index lock: concurrent appends must be able to share a group commit.
+        self.writer.append(value, sync=value.get("event") == "RESERVED")
+        self._refresh()
 
     def events(self) -> list[dict[str, Any]]:
-        return [json.loads(line) for line in self.path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        with self._index_lock:
+            self._refresh()
+            return list(self._events)
 
     def reservations(self) -> list[dict[str, Any]]:
-        return [event for event in self.events() if event.get("event") == "RESERVED"]
+        with self._index_lock:
+            self._refresh()
+            return list(self._reservations)
+
+    def reservation_count(self) -> int:
+        with self._index_lock:
+            self._refresh()
+            return len(self._reservations)
 
     def terminal_operations(self) -> set[str]:
-        return {
-            str(event["operationKey"])
-            for event in self.events()
-            if event.get("event") == "COMPLETED" and event.get("replayAllowed") is False
-        }
+        with self._index_lock:
+            self._refresh()
+            return set(self._terminal)
+
+    def is_terminal(self, operationKey: str) -> bool:
+        with self._index_lock:
+            self._refresh()
+            return operationKey in self._terminal
+
+    def counters(self) -> dict[str, dict[str, int]]:
+        with self._index_lock:
+            self._refresh()
+            return {
+                "role": dict(self._role_counts),
+                "configuration": dict(self._configuration_counts),
+            }
 
     def pace(self) -> None:
-        while True:
-            now = time.time()
-            recent: list[float] = []
-            for event in self.reservations():
-                try:
-                    stamp = dt.datetime.fromisoformat(str(event["reservedAt"]).replace("Z", "+00:00")).timestamp()
-                except (KeyError, ValueError):
-                    continue
-                if now - stamp < 60:
-                    recent.append(stamp)
-            if len(recent) < MAX_STARTS_PER_ROLLING_60_SECONDS:
-                return
-            time.sleep(max(0.1, 60.05 - (now - min(recent))))
+        with self.limiter.slot():
+            return
 
-    def reserve(
+    def _reserve_admitted(
         self,
         *,
         operationKey: str,
@@ -77,17 +181,16 @@ class ProviderLedger:
         scenario: str,
         turn: str,
         role: str,
-        retryOf: int | None = None,
+        retryOf: int | None,
     ) -> dict[str, Any]:
-        if operationKey in self.terminal_operations():
+        if self.is_terminal(operationKey):
             raise RuntimeError(f"TERMINAL_OPERATION_REPLAY_FORBIDDEN:{operationKey}")
-        self.pace()
-        reservations = self.reservations()
-        if len(reservations) >= MAX_NEW_PROVIDER_REQUESTS:
+        reserved = self.reservation_count()
+        if reserved >= MAX_NEW_PROVIDER_REQUESTS:
             raise RuntimeError("PROVIDER_BUDGET_80_HARD_STOP")
         value = {
             "event": "RESERVED",
-            "requestNumber": len(reservations) + 1,
+            "requestNumber": reserved + 1,
             "operationKey": operationKey,
             "configuration": configuration,
             "scenario": scenario,
@@ -98,11 +201,55 @@ class ProviderLedger:
             "model": MODEL,
             "temperature": None,
             "retryOf": retryOf,
-            "cumulativeCalls": len(reservations) + 1,
+            "cumulativeCalls": reserved + 1,
         }
-        append_jsonl(self.path, value)
+        self._append(value)
         return value
 
+    def reserve(
+        self,
+        *,
+        operationKey: str,
+        configuration: str,
+        scenario: str,
+        turn: str,
+        role: str,
+        retryOf: int | None = None,
+    ) -> dict[str, Any]:
+        if self.is_terminal(operationKey):
+            raise RuntimeError(f"TERMINAL_OPERATION_REPLAY_FORBIDDEN:{operationKey}")
+        with self.limiter.slot(role):
+            return self._reserve_admitted(
+                operationKey=operationKey,
+                configuration=configuration,
+                scenario=scenario,
+                turn=turn,
+                role=role,
+                retryOf=retryOf,
+            )
+
+    async def reserve_async(
+        self,
+        *,
+        operationKey: str,
+        configuration: str,
+        scenario: str,
+        turn: str,
+        role: str,
+        retryOf: int | None = None,
+    ) -> dict[str, Any]:
+        if self.is_terminal(operationKey):
+            raise RuntimeError(f"TERMINAL_OPERATION_REPLAY_FORBIDDEN:{operationKey}")
+        async with self.limiter.slot_async(role):
+            return self._reserve_admitted(
+                operationKey=operationKey,
+                configuration=configuration,
+                scenario=scenario,
+                turn=turn,
+                role=role,
+                retryOf=retryOf,
+            )
+
     def complete(
         self,
         reservation: dict[str, Any],
@@ -115,7 +262,7 @@ class ProviderLedger:
         error: str | None,
         replayAllowed: bool,
     ) -> None:
-        append_jsonl(self.path, {
+        self._append({
             "event": "COMPLETED",
             "requestNumber": reservation["requestNumber"],
             "operationKey": reservation["operationKey"],
@@ -139,6 +286,60 @@ class ProviderLedger:
             "error": (error or "")[:1600] or None,
         })
 
+    def _complete_failure(self, reservation: dict[str, Any], started: str, caught: BaseException, attempt: int) -> bool:
+        """Record a failed attempt and return whether one transport retry is allowed."""
+
+        if not isinstance(caught, Exception):
+            # Cancellation or interruption says nothing about the operation: it stays replayable.
+            self.complete(
+                reservation,
+                startedAt=started,
+                providerStatus="INTERRUPTED",
+                rawOutputRef=None,
+                success=False,
+                disposition="INTERRUPTED",
+                error=f"{caught.__class__.__name__}: {caught}",
+                replayAllowed=True,
+            )
+            return False
+        if isinstance(caught, ProviderOperationError):
+            terminal = not caught.transient or attempt >= MAX_TRANSIENT_RETRY
+            self.complete(
+                reservation,
+                startedAt=started,
+                providerStatus="FAILED",
+                rawOutputRef=getattr(caught, "rawOutputRef", None),
+                success=False,
+                disposition=caught.disposition,
+                error=str(caught),
+                replayAllowed=not terminal,
+            )
+            return caught.transient and attempt < MAX_TRANSIENT_RETRY
+        self.complete(
+            reservation,
+            startedAt=started,
+            providerStatus="FAILED",
+            rawOutputRef=None,
+            success=False,
+            disposition="UNCLASSIFIED_TECHNICAL_FAILURE",
+            error=f"{caught.__class__.__name__}: {caught}",
+            replayAllowed=False,
+        )
+        return False
+
+    def _complete_value(self, reservation: dict[str, Any], started: str, value: Any) -> None:
+        success = bool(getattr(value, "success", True))
+        self.complete(
+            reservation,
+            startedAt=started,
+            providerStatus=str(getattr(value, "providerStatus", "SUCCEEDED")),
+            rawOutputRef=getattr(value, "rawOutputRef", None),
+            success=success,
+            disposition=str(getattr(value, "finalDisposition", "SUCCESS" if success else "TECHNICAL_FAILURE")),
+            error=getattr(value, "error", None),
+            replayAllowed=False,
+        )
+
     def execute(
         self,
         *,
@@ -164,47 +365,45 @@ class ProviderLedger:
             started = utc_now()
             try:
                 value = function(reservation)
-            except ProviderOperationError as caught:
-                raw_ref = getattr(caught, "rawOutputRef", None)
-                terminal = not caught.transient or attempt >= MAX_TRANSIENT_RETRY
-                self.complete(
-                    reservation,
-                    startedAt=started,
-                    providerStatus="FAILED",
-                    rawOutputRef=raw_ref,
-                    success=False,
-                    disposition=caught.disposition,
-                    error=str(caught),
-                    replayAllowed=not terminal,
-                )
-                if caught.transient and attempt < MAX_TRANSIENT_RETRY:
+            except BaseException as caught:
+                if self._complete_failure(reservation, started, caught, attempt):
                     time.sleep(60)
                     continue
                 raise
+            self._complete_value(reservation, started, value)
+            return value
+        raise RuntimeError("UNREACHABLE_RETRY_STATE")
+
+    async def execute_async(
+        self,
+        *,
+        operationKey: str,
+        configuration: str,
+        scenario: str,
+        turn: str,
+        role: str,
+        function: Callable[[dict[str, Any]], Awaitable[T]],
+    ) -> T:
+        first_request: int | None = None
+        for attempt in range(MAX_TRANSIENT_RETRY + 1):
+            key = operationKey if attempt == 0 else f"{operationKey}:retry1"
+            reservation = await self.reserve_async(
+                operationKey=key,
+                configuration=configuration,
+                scenario=scenario,
+                turn=turn,
+                role=role,
+                retryOf=first_request,
+            )
+            first_request = first_request or int(reservation["requestNumber"])
+            started = utc_now()
+            try:
+                value = await function(reservation)
             except BaseException as caught:
-                self.complete(
-                    reservation,
-                    startedAt=started,
-                    providerStatus="FAILED",
-                    rawOutputRef=None,
-                    success=False,
-                    disposition="UNCLASSIFIED_TECHNICAL_FAILURE",
-                    error=f"{caught.__class__.__name__}: {caught}",
-                    replayAllowed=False,
-                )
+                if self._complete_failure(reservation, started, caught, attempt):
+                    await asyncio.sleep(60)
+                    continue
                 raise
-            success = bool(getattr(value, "success", True))
-            disposition = str(getattr(value, "finalDisposition", "SUCCESS" if success else "TECHNICAL_FAILURE"))
-            provider_status = str(getattr(value, "providerStatus", "SUCCEEDED"))
-            self.complete(
-                reservation,
-                startedAt=started,
-                providerStatus=provider_status,
-                rawOutputRef=getattr(value, "rawOutputRef", None),
-                success=success,
-                disposition=disposition,
-                error=getattr(value, "error", None),
-                replayAllowed=False,
-            )
+            self._complete_value(reservation, started, value)
             return value
         raise RuntimeError("UNREACHABLE_RETRY_STATE")
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable
+
+from contracts.models import CandidateScientificState, ContextInput, ConversationTurn
+from pipeline.core import HybridRuntimePipeline, PipelineResult
+
+
+@dataclass(frozen=True)
+class ScheduledState:
+    turn: str
+    turns: list[ConversationTurn]
+    experimentalFinalState: bool = False
+
+
+@dataclass(frozen=True)
+class ScenarioChain:
+    scenario: str
+    conversationId: str
+    states: list[ScheduledState]
+    contextInputs: list[ContextInput] = field(default_factory=list)
+
+
+class ScenarioScheduler:
+    """Runs independent scenario chains in parallel; turns inside one chain stay ordered.
+
+    Provider pacing and the global budget remain owned by the shared ledger, so the
+    worker count bounds wall-clock overlap only, never the number of provider starts.
+    """
+
+    def __init__(self, pipeline: HybridRuntimePipeline, *, workers: int = 1):
+        if workers < 1:
+            raise RuntimeError("SCHEDULER_WORKERS_INVALID")
+        self.pipeline = pipeline
+        self.workers = workers
+        self._callback_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _run_chain(
+        self,
+        chain: ScenarioChain,
+        onStateComplete: Callable[[str, str, PipelineResult], None] | None,
+    ) -> list[PipelineResult]:
+        results: list[PipelineResult] = []
+        previous: CandidateScientificState | None = None
+        for state in chain.states:
+            if self._stop.is_set():
+                break
+            result = self.pipeline.run_state(
+                scenario=chain.scenario,
+                turn=state.turn,
+                conversationId=chain.conversationId,
+                turns=state.turns,
+                previousState=previous,
+                contextInputs=chain.contextInputs,
+                experimentalFinalState=state.experimentalFinalState,
+            )
+            previous = result.consolidated.candidateState or result.primary
+            results.append(result)
+            if onStateComplete is not None:
+                with self._callback_lock:
+                    onStateComplete(chain.scenario, state.turn, result)
+        return results
+
+    async def _run_chain_async(
+        self,
+        chain: ScenarioChain,
+        onStateComplete: Callable[[str, str, PipelineResult], None] | None,
+        semaphore: asyncio.Semaphore,
+    ) -> list[PipelineResult]:
+        results: list[PipelineResult] = []
+        previous: CandidateScientificState | None = None
+        async with semaphore:
+            for state in chain.states:
+                result = await self.pipeline.run_state_async(
+                    scenario=chain.scenario,
+                    turn=state.turn,
+                    conversationId=chain.conversationId,
+                    turns=state.turns,
+                    previousState=previous,
+                    contextInputs=chain.contextInputs,
+                    experimentalFinalState=state.experimentalFinalState,
+                )
+                previous = result.consolidated.candidateState or result.primary
+                results.append(result)
+                if onStateComplete is not None:
+                    onStateComplete(chain.scenario, state.turn, result)
+        return results
+
+    async def run_async(
+        self,
+        chains: list[ScenarioChain],
+        *,
+        onStateComplete: Callable[[str, str, PipelineResult], None] | None = None,
+    ) -> dict[str, list[PipelineResult]]:
+        """Drive every chain on the running loop; a failing chain cancels the others."""
+
+        if len({chain.scenario for chain in chains}) != len(chains):
+            raise RuntimeError("SCHEDULER_DUPLICATE_SCENARIO")
+        semaphore = asyncio.Semaphore(self.workers)
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = {
+                    chain.scenario: group.create_task(self._run_chain_async(chain, onStateComplete, semaphore))
+                    for chain in chains
+                }
+        except ExceptionGroup as failure:
+            # Surface the first chain failure exactly as the threaded scheduler does.
+            raise failure.exceptions[0] from None
+        return {scenario: task.result() for scenario, task in tasks.items()}
+
+    def run(
+        self,
+        chains: list[ScenarioChain],
+        *,
+        onStateComplete: Callable[[str, str, PipelineResult], None] | None = None,
+    ) -> dict[str, list[PipelineResult]]:
+        if len({chain.scenario for chain in chains}) != len(chains):
+            raise RuntimeError("SCHEDULER_DUPLICATE_SCENARIO")
+        self._stop.clear()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hybrid-scenario") as executor:
+            futures = {chain.scenario: executor.submit(self._run_chain, chain, onStateComplete) for chain in chains}
+            done, _pending = wait(futures.values(), return_when=FIRST_EXCEPTION)
+            failed = [future for future in done if future.exception() is not None]
+            if failed:
+                # Chains already started stop after their current state; queued chains never start.
+                self._stop.set()
+                for future in futures.values():
+                    future.cancel()
+                wait(futures.values())
+                failed[0].result()
+        return {scenario: future.result() for scenario, future in futures.items()}
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import weakref
+from dataclasses import dataclass, replace
+from typing import Any, Iterable
+
+from contracts.models import StrictModel, assignment_generation
+from pipeline.storage import compact_json
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Serialized forms of one model value, computed once.
+
+    ``document`` is the ``model_dump(mode="json")`` value shared by every consumer and
+    must be treated as read-only. ``digest`` is the repository ``logical_digest`` of that
+    document; ``fingerprint`` hashes the native ``model_dump_json`` output. ``generation``
+    is the model assignment generation the snapshot was taken at.
+    """
+
+    document: Any
+    native: str
+    digest: str
+    fingerprint: str
+    generation: int
+
+    def unchanged(self, value: StrictModel) -> bool:
+        # No model was assigned since the snapshot: nothing to serialize.
+        if assignment_generation() == self.generation:
+            return True
+        return _fingerprint(value.model_dump_json()) == self.fingerprint
+
+
+def _fingerprint(native: str) -> str:
+    return hashlib.sha256(native.encode("utf-8")).hexdigest()
+
+
+_SNAPSHOTS: dict[int, Snapshot] = {}
+_LOCK = threading.Lock()
+
+
+def _forget(key: int) -> None:
+    with _LOCK:
+        _SNAPSHOTS.pop(key, None)
+
+
+def snapshot(value: StrictModel) -> Snapshot:
+    """Memoized per object until any contract model is assigned; a cached snapshot is then re-verified.
+
+    The pipeline still verifies that adapters leave the primary candidate untouched by
+    comparing ``Snapshot.unchanged`` after each audit.
+    """
+
+    key = id(value)
+    # Read before serializing, so an assignment during the dump moves the generation past it.
+    generation = assignment_generation()
+    with _LOCK:
+        cached = _SNAPSHOTS.get(key)
+    if cached is not None and cached.generation == generation:
+        return cached
+    native = value.model_dump_json()
+    fingerprint = _fingerprint(native)
+    if cached is not None and cached.fingerprint == fingerprint:
+        created = replace(cached, generation=generation)
+    else:
+        document = value.model_dump(mode="json")
+        created = Snapshot(
+            document=document,
+            native=native,
+            digest=hashlib.sha256(compact_json(document).encode("utf-8")).hexdigest(),
+            fingerprint=fingerprint,
+            generation=generation,
+        )
+    with _LOCK:
+        known = key in _SNAPSHOTS
+        _SNAPSHOTS[key] = created
+    if not known:
+        weakref.finalize(value, _forget, key)
+    return created
+
+
+def documents(values: Iterable[StrictModel]) -> list[Any]:
+    return [snapshot(value).document for value in values]
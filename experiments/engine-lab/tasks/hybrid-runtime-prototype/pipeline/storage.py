@@ -1,37 +1,117 @@
 from __future__ import annotations
 
 import hashlib
+import importlib.util
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Any
 
 
+PROVIDERS_DIR = Path(__file__).resolve().parents[5] / "experiments" / "semantic-engine-comparison" / "providers"
+CANONICAL_PATH = PROVIDERS_DIR / "canonical.py"
+CHECKPOINT_CODECS = ("json", "compact", "zstd")
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZSTD_LEVEL = 10
+_CHECKPOINT_CODEC = "json"
+
+
+def load_shared(name: str, path: Path, error: str) -> Any:
+    """Load a shared comparison module by path, once per process."""
+
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    if not spec or not spec.loader:
+        raise RuntimeError(error)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+canonical = load_shared("semantic_engine_comparison_canonical", CANONICAL_PATH, "CANONICAL_JSON_LOAD_FAILED")
+
+
 def stable_json(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+    return canonical.pretty_json(value)
 
 
 def compact_json(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return canonical.canonical_json(value)
 
 
 def logical_digest(value: Any) -> str:
-    return hashlib.sha256(compact_json(value).encode("utf-8")).hexdigest()
+    return canonical.canonical_digest(value)
 
 
 def file_digest(path: Path) -> str:
     return hashlib.sha256(path.read_bytes()).hexdigest()
 
 
-def atomic_write_json(path: Path, value: Any) -> None:
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("CHECKPOINT_CODEC_ZSTD_UNAVAILABLE") from None
+    return zstandard
+
+
+def configure_checkpoint_codec(name: str) -> None:
+    """Select how ``atomic_write_json`` encodes new files; readers detect every codec."""
+
+    global _CHECKPOINT_CODEC
+    if name not in CHECKPOINT_CODECS:
+        raise RuntimeError(f"CHECKPOINT_CODEC_INVALID:{name}")
+    if name == "zstd":
+        _zstandard()
+    _CHECKPOINT_CODEC = name
+
+
+def encode_checkpoint(value: Any, codec: str | None = None) -> bytes:
+    name = codec or _CHECKPOINT_CODEC
+    if name == "json":
+        return stable_json(value).encode("utf-8")
+    compact = compact_json(value).encode("utf-8")
+    if name == "compact":
+        return compact + b"\n"
+    if name == "zstd":
+        return _zstandard().ZstdCompressor(level=ZSTD_LEVEL).compress(compact)
+    raise RuntimeError(f"CHECKPOINT_CODEC_INVALID:{name}")
+
+
+def checkpoint_payload(data: bytes) -> bytes:
+    """The JSON bytes of a checkpoint, whatever codec stored it."""
+
+    if data.startswith(ZSTD_MAGIC):
+        return _zstandard().ZstdDecompressor().decompress(data)
+    return data
+
+
+def decode_checkpoint(data: bytes) -> Any:
+    return json.loads(checkpoint_payload(data))
+
+
+def atomic_write_json(path: Path, value: Any, *, codec: str | None = None) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     temporary = path.with_suffix(path.suffix + ".tmp")
-    temporary.write_text(stable_json(value), encoding="utf-8")
+    temporary.write_bytes(encode_checkpoint(value, codec))
     os.replace(temporary, path)
 
 
 def read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return decode_checkpoint(path.read_bytes())
+
+
+def checkpoint_digest(path: Path) -> str:
+    """Digest of a checkpoint's ``stable_json`` text, whatever codec stored it.
+
+    Equal to ``file_digest`` for files written with the default ``json`` codec, so
+    identities derived from checkpoints do not depend on the codec.
+    """
+
+    return hashlib.sha256(stable_json(read_json(path)).encode("utf-8")).hexdigest()
 
 
 def append_jsonl(path: Path, value: Any) -> None:
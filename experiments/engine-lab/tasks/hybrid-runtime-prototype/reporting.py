@@ -2,16 +2,30 @@ from __future__ import annotations
 
 import json
 import re
+import weakref
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from contracts.models import AuditFinding, CandidateScientificState, ConsolidatedCandidateState
+from contracts.models import AdjudicationResolution, AuditFinding, CandidateScientificState, carries_project_adoption
 from audit.deterministic_adapter import DeterministicSemanticAuditor
+from pipeline.checkpoints import (
+    AdjudicationRecord,
+    CandidateRecord,
+    ConsolidatedRecord,
+    FindingsRecord,
+    VerifiedManifest,
+    read_record,
+)
+from pipeline.snapshot import snapshot
 from pipeline.storage import atomic_write_json, read_json
 
 
 TURN_ORDER = ["T0", "T1", "T2"]
+REPORT_WORKERS = 8
 
 # Campaign-only visible expectations copied from the mission. They are not runtime rules.
 EXPECTATIONS: dict[str, list[tuple[int, str, list[str]]]] = {
@@ -73,29 +87,83 @@ EXPECTATIONS: dict[str, list[tuple[int, str, list[str]]]] = {
 }
 
 
+_FLATTENED: dict[int, str] = {}
+
+
 def flatten(candidate: CandidateScientificState | None) -> str:
+    """Case-folded sorted JSON of a candidate, built once per candidate object."""
+
     if candidate is None:
         return ""
-    return json.dumps(candidate.model_dump(mode="json"), ensure_ascii=False, sort_keys=True).casefold()
+    key = id(candidate)
+    material = _FLATTENED.get(key)
+    if material is None:
+        material = json.dumps(snapshot(candidate).document, ensure_ascii=False, sort_keys=True).casefold()
+        _FLATTENED[key] = material
+        weakref.finalize(candidate, _FLATTENED.pop, key, None)
+    return material
+
+
+@lru_cache(maxsize=256)
+def _alternation(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile("|".join(f"(?P<p{slot}>{pattern})" for slot, pattern in enumerate(patterns)), re.IGNORECASE)
+
+
+class ExpectationIndex:
+    """All expectation patterns of one scenario, matched as one alternation.
+
+    A scan reports every pattern that matched through ``lastgroup``. Matches do not
+    overlap, so a pattern hidden inside another pattern's match is picked up by a
+    further scan over the still-unmatched patterns only; a scan that finds nothing
+    proves none of them matches. Patterns must not use numbered backreferences.
+    """
+
+    def __init__(self, expectations: list[tuple[int, str, list[str]]]):
+        self.expectations = list(expectations)
+        self.patterns = tuple(dict.fromkeys(pattern for _, _, patterns in expectations for pattern in patterns))
+
+    def matched(self, material: str) -> set[str]:
+        found: set[str] = set()
+        remaining = self.patterns
+        while remaining:
+            fresh: set[str] = set()
+            for match in _alternation(remaining).finditer(material):
+                fresh.add(remaining[int(match.lastgroup[1:])])
+                if len(fresh) == len(remaining):
+                    break
+            if not fresh:
+                break
+            found |= fresh
+            remaining = tuple(pattern for pattern in remaining if pattern not in found)
+        return found
+
+    def results(self, turn_index: int, material: str) -> list[dict[str, Any]]:
+        found = self.matched(material)
+        values: list[dict[str, Any]] = []
+        for introduced, label, patterns in self.expectations:
+            if introduced > turn_index:
+                continue
+            matches = [pattern in found for pattern in patterns]
+            values.append({"expectation": label, "met": all(matches), "evidencePatterns": patterns, "patternMatches": matches})
+        return values
+
+
+def build_expectation_index(expectations: dict[str, list[tuple[int, str, list[str]]]]) -> dict[str, ExpectationIndex]:
+    return {scenario: ExpectationIndex(values) for scenario, values in expectations.items()}
+
+
+EXPECTATION_INDEX = build_expectation_index(EXPECTATIONS)
 
 
 def expectation_results(scenario: str, turn_index: int, candidate: CandidateScientificState | None) -> list[dict[str, Any]]:
-    material = flatten(candidate)
-    values: list[dict[str, Any]] = []
-    for introduced, label, patterns in EXPECTATIONS[scenario]:
-        if introduced > turn_index:
-            continue
-        matches = [bool(re.search(pattern, material, flags=re.IGNORECASE)) for pattern in patterns]
-        values.append({"expectation": label, "met": all(matches), "evidencePatterns": patterns, "patternMatches": matches})
-    return values
+    return EXPECTATION_INDEX[scenario].results(turn_index, flatten(candidate))
 
 
 def intrinsic_violations(candidate: CandidateScientificState | None) -> list[str]:
     if candidate is None:
         return ["NOT_EVALUABLE"]
     values: list[str] = []
-    material = candidate.model_dump_json().upper()
-    if "PROJECT_ADOPTED" in material:
+    if carries_project_adoption(candidate):
         values.append("PROJECT_ADOPTION_EMITTED")
     for relation in candidate.relations:
         if relation.sourceElementId == relation.targetElementId:
@@ -117,27 +185,37 @@ def intrinsic_violations(candidate: CandidateScientificState | None) -> list[str
     return values
 
 
-def stage_metrics(
-    values: list[tuple[str, str, int, CandidateScientificState | None, list[AuditFinding]]],
-) -> dict[str, Any]:
+@dataclass(frozen=True)
+class StageValue:
+    """One state as seen by one ablation; expectations and violations are computed per candidate, not per stage."""
+
+    scenario: str
+    turn: str
+    candidate: CandidateScientificState | None
+    expectations: list[dict[str, Any]]
+    intrinsic: list[str]
+    findings: list[AuditFinding]
+
+
+def stage_metrics(values: list[StageValue]) -> dict[str, Any]:
     applicable = 0
     met = 0
     critical: list[dict[str, str]] = []
     evaluable = 0
-    for scenario, turn, index, candidate, findings in values:
-        if candidate and candidate.technicalStatus == "STRUCTURED_CONTRACT_VALID":
+    for value in values:
+        if value.candidate and value.candidate.technicalStatus == "STRUCTURED_CONTRACT_VALID":
             evaluable += 1
-        expectations = expectation_results(scenario, index, candidate)
-        applicable += len(expectations)
-        met += sum(1 for item in expectations if item["met"])
-        for item in expectations:
-            if not item["met"]:
-                critical.append({"scenario": scenario, "turn": turn, "violation": f"VISIBLE_EXPECTATION_NOT_RECONSTRUCTIBLE:{item['expectation']}"})
-        for violation in intrinsic_violations(candidate):
-            critical.append({"scenario": scenario, "turn": turn, "violation": violation})
-        for finding in findings:
+        applicable += len(value.expectations)
+        for item in value.expectations:
+            if item["met"]:
+                met += 1
+            else:
+                critical.append({"scenario": value.scenario, "turn": value.turn, "violation": f"VISIBLE_EXPECTATION_NOT_RECONSTRUCTIBLE:{item['expectation']}"})
+        for violation in value.intrinsic:
+            critical.append({"scenario": value.scenario, "turn": value.turn, "violation": violation})
+        for finding in value.findings:
             if finding.severity == "CRITICAL" and finding.status in {"OPEN", "ACKNOWLEDGED"}:
-                critical.append({"scenario": scenario, "turn": turn, "violation": f"OPEN_FINDING:{finding.findingClass}"})
+                critical.append({"scenario": value.scenario, "turn": value.turn, "violation": f"OPEN_FINDING:{finding.findingClass}"})
     return {
         "states": len(values),
         "evaluableStates": evaluable,
@@ -167,62 +245,115 @@ def ledger_metrics(result_root: Path) -> dict[str, Any]:
     }
 
 
-def load_rows(result_root: Path) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
+def _load_state(
+    result_root: Path, scenario: str, index: int, turn: str, manifest: VerifiedManifest | None,
+) -> dict[str, Any]:
+    stem = f"{scenario.lower()}-{turn.lower()}"
+    p0_record = read_record(result_root / "candidate-states" / f"{stem}.json", CandidateRecord, manifest=manifest)
+    d_record = read_record(result_root / "deterministic-findings" / f"{stem}.json", FindingsRecord, manifest=manifest)
+    l_record = read_record(result_root / "semantic-audit-findings" / f"{stem}.json", FindingsRecord, manifest=manifest)
+    a_record = read_record(result_root / "adjudication-records" / f"{stem}.json", AdjudicationRecord, manifest=manifest)
+    c_record = read_record(result_root / "consolidated-states" / f"{stem}.json", ConsolidatedRecord, manifest=manifest)
+    primary = p0_record.candidateState
+    consolidated = c_record.consolidated
+    p3 = consolidated.candidateState
+    return {
+        "scenario": scenario,
+        "turn": turn,
+        "turnIndex": index,
+        "primary": primary,
+        "deterministic": d_record.findings,
+        "semantic": l_record.findings,
+        "auditRecord": l_record,
+        "adjudicationRecord": a_record,
+        "consolidatedRecord": c_record,
+        "consolidated": consolidated,
+        "p0Expectations": expectation_results(scenario, index, primary),
+        "p3Expectations": expectation_results(scenario, index, p3),
+        "p0Intrinsic": intrinsic_violations(primary),
+        "p3Intrinsic": intrinsic_violations(p3),
+    }
+
+
+def _audit_p3_chain(auditor: DeterministicSemanticAuditor, rows: list[dict[str, Any]]) -> None:
+    previous: CandidateScientificState | None = None
+    for row in rows:
+        p3 = row["consolidated"].candidateState
+        row["p3Findings"] = auditor.audit(
+            turns=p3.source.turns,
+            previousState=previous,
+            candidateState=p3,
+            confirmedDecisionIds=[],
+        ) if p3 else []
+        previous = p3 or row["primary"]
+
+
+def load_rows(
+    result_root: Path, *, workers: int = REPORT_WORKERS, manifest: VerifiedManifest | None = None,
+) -> list[dict[str, Any]]:
+    """Load and validate every state in parallel, then re-audit each scenario's P3 chain in order.
+
+    With a ``manifest``, files already verified are read on its trusted path and newly
+    verified ones are recorded in it.
+    """
+
+    states = [
+        (f"I{scenario_index:02d}", index, turn)
+        for scenario_index in range(1, 9)
+        for index, turn in enumerate(TURN_ORDER)
+    ]
     auditor = DeterministicSemanticAuditor()
-    previous_p3: dict[str, CandidateScientificState | None] = {}
-    for scenario_index in range(1, 9):
-        scenario = f"I{scenario_index:02d}"
-        for index, turn in enumerate(TURN_ORDER):
-            stem = f"{scenario.lower()}-{turn.lower()}"
-            p0_record = read_json(result_root / "candidate-states" / f"{stem}.json")
-            d_record = read_json(result_root / "deterministic-findings" / f"{stem}.json")
-            l_record = read_json(result_root / "semantic-audit-findings" / f"{stem}.json")
-            a_record = read_json(result_root / "adjudication-records" / f"{stem}.json")
-            c_record = read_json(result_root / "consolidated-states" / f"{stem}.json")
-            primary = CandidateScientificState.model_validate(p0_record["candidateState"])
-            d_findings = [AuditFinding.model_validate(item) for item in d_record["findings"]]
-            l_findings = [AuditFinding.model_validate(item) for item in l_record["findings"]]
-            consolidated = ConsolidatedCandidateState.model_validate(c_record["consolidated"])
-            p3 = consolidated.candidateState
-            p3_findings = []
-            if p3:
-                p3_findings = auditor.audit(
-                    turns=p3.source.turns,
-                    previousState=previous_p3.get(scenario),
-                    candidateState=p3,
-                    confirmedDecisionIds=[],
-                )
-            previous_p3[scenario] = p3 or primary
-            rows.append({
-                "scenario": scenario,
-                "turn": turn,
-                "turnIndex": index,
-                "primary": primary,
-                "deterministic": d_findings,
-                "semantic": l_findings,
-                "auditRecord": l_record,
-                "adjudicationRecord": a_record,
-                "consolidated": consolidated,
-                "p3Findings": p3_findings,
-            })
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hybrid-report") as executor:
+        rows = list(executor.map(lambda state: _load_state(result_root, *state, manifest), states))
+        chains: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            chains.setdefault(row["scenario"], []).append(row)
+        list(executor.map(lambda chain: _audit_p3_chain(auditor, chain), chains.values()))
+    if manifest is not None:
+        manifest.save()
     return rows
 
 
 def build_metrics(rows: list[dict[str, Any]], result_root: Path) -> dict[str, Any]:
-    p0_values = [(r["scenario"], r["turn"], r["turnIndex"], r["primary"], []) for r in rows]
-    p1_values = [(r["scenario"], r["turn"], r["turnIndex"], r["primary"], r["deterministic"]) for r in rows]
-    p2_values = [(r["scenario"], r["turn"], r["turnIndex"], r["primary"], [*r["deterministic"], *r["semantic"]]) for r in rows]
-    p3_values = [(r["scenario"], r["turn"], r["turnIndex"], r["consolidated"].candidateState, r["p3Findings"]) for r in rows]
+    stages: dict[str, list[StageValue]] = {"P0": [], "P1": [], "P2": [], "P3": []}
+    semantic_findings: list[AuditFinding] = []
+    resolutions: list[AdjudicationResolution] = []
+    audit_calls = adjudicator_calls = audit_triggered = adjudicator_triggered = 0
+    audit_no_value = adjudicator_no_value = unresolved_states = total_latency = 0
+    structured_failures = audit_failures = adjudicator_failures = not_evaluable = deterministic_findings = 0
+    for r in rows:
+        primary = r["primary"]
+        base = {"scenario": r["scenario"], "turn": r["turn"], "candidate": primary, "expectations": r["p0Expectations"], "intrinsic": r["p0Intrinsic"]}
+        stages["P0"].append(StageValue(**base, findings=[]))
+        stages["P1"].append(StageValue(**base, findings=r["deterministic"]))
+        stages["P2"].append(StageValue(**base, findings=[*r["deterministic"], *r["semantic"]]))
+        stages["P3"].append(StageValue(
+            scenario=r["scenario"], turn=r["turn"], candidate=r["consolidated"].candidateState,
+            expectations=r["p3Expectations"], intrinsic=r["p3Intrinsic"], findings=r["p3Findings"],
+        ))
+        audit_record = r["auditRecord"]
+        adjudication_record = r["adjudicationRecord"]
+        adjudication_resolutions = adjudication_record.output.resolutions if adjudication_record.output else []
+        semantic_findings.extend(r["semantic"])
+        resolutions.extend(adjudication_resolutions)
+        deterministic_findings += len(r["deterministic"])
+        audit_calls += audit_record.providerCalls
+        adjudicator_calls += adjudication_record.providerCalls
+        audit_triggered += audit_record.triggered
+        adjudicator_triggered += adjudication_record.triggered
+        audit_no_value += bool(audit_record.providerCalls and not r["semantic"])
+        adjudicator_no_value += bool(adjudication_record.providerCalls and not adjudication_resolutions)
+        unresolved_states += bool(r["consolidated"].unresolvedFindingIds)
+        total_latency += r["consolidated"].latencyMs
+        structured_failures += primary.technicalStatus == "STRUCTURED_CONTRACT_FAILURE"
+        audit_failures += audit_record.technicalFailure
+        adjudicator_failures += adjudication_record.technicalFailure
+        not_evaluable += r["consolidated"].disposition in {"NOT_EVALUABLE", "FAIL_CLOSED"}
     operations = ledger_metrics(result_root)
-    audit_calls = sum(int(r["auditRecord"].get("providerCalls", 0)) for r in rows)
-    adjudicator_calls = sum(int(r["adjudicationRecord"].get("providerCalls", 0)) for r in rows)
-    semantic_findings = [item for row in rows for item in row["semantic"]]
-    resolutions = [item for row in rows for item in (row["adjudicationRecord"].get("output") or {}).get("resolutions", [])]
-    p0 = stage_metrics(p0_values)
-    p1 = stage_metrics(p1_values)
-    p2 = stage_metrics(p2_values)
-    p3 = stage_metrics(p3_values)
+    p0 = stage_metrics(stages["P0"])
+    p1 = stage_metrics(stages["P1"])
+    p2 = stage_metrics(stages["P2"])
+    p3 = stage_metrics(stages["P3"])
     p0_keys = {(item["scenario"], item["turn"], item["violation"]) for item in p0["criticalViolations"]}
     p3_keys = {(item["scenario"], item["turn"], item["violation"]) for item in p3["criticalViolations"]}
     return {
@@ -230,42 +361,42 @@ def build_metrics(rows: list[dict[str, Any]], result_root: Path) -> dict[str, An
         "stateCount": 24,
         "stages": {
             "P0_PYDANTIC_DIRECT": p0,
-            "P1_PYDANTIC_PLUS_AUDIT_D": {**p1, "findings": sum(len(r["deterministic"]) for r in rows)},
+            "P1_PYDANTIC_PLUS_AUDIT_D": {**p1, "findings": deterministic_findings},
             "P2_PYDANTIC_PLUS_AUDIT_D_PLUS_AUDIT_L": {**p2, "semanticFindings": len(semantic_findings)},
             "P3_FULL_HYBRID_CANDIDATE": p3,
         },
         "conditionalStages": {
             "auditL": {
-                "triggeredStates": sum(1 for r in rows if r["auditRecord"]["triggered"]),
+                "triggeredStates": audit_triggered,
                 "calls": audit_calls,
-                "triggerRate": sum(1 for r in rows if r["auditRecord"]["triggered"]) / 24,
+                "triggerRate": audit_triggered / 24,
                 "findingsConfirmed": sum(1 for item in semantic_findings if item.auditJudgment == "CONFIRMED"),
                 "findingsRejected": sum(1 for item in semantic_findings if item.auditJudgment == "REJECTED"),
                 "newFindings": sum(1 for item in semantic_findings if item.auditJudgment == "NEW"),
-                "noValueCalls": sum(1 for r in rows if r["auditRecord"].get("providerCalls") and not r["semantic"]),
+                "noValueCalls": audit_no_value,
             },
             "adjudicator": {
-                "triggeredStates": sum(1 for r in rows if r["adjudicationRecord"]["triggered"]),
+                "triggeredStates": adjudicator_triggered,
                 "calls": adjudicator_calls,
-                "triggerRate": sum(1 for r in rows if r["adjudicationRecord"]["triggered"]) / 24,
+                "triggerRate": adjudicator_triggered / 24,
                 "resolutions": len(resolutions),
-                "noValueCalls": sum(1 for r in rows if r["adjudicationRecord"].get("providerCalls") and not (r["adjudicationRecord"].get("output") or {}).get("resolutions")),
+                "noValueCalls": adjudicator_no_value,
             },
             "criticalViolationsRemovedByP3": len(p0_keys - p3_keys),
             "criticalViolationsIntroducedByP3": len(p3_keys - p0_keys),
-            "unresolvedStates": sum(1 for r in rows if r["consolidated"].unresolvedFindingIds),
+            "unresolvedStates": unresolved_states,
         },
         "operations": operations,
         "latency": {
-            "totalStateLatencyMs": sum(r["consolidated"].latencyMs for r in rows),
-            "meanStateLatencyMs": sum(r["consolidated"].latencyMs for r in rows) / 24,
+            "totalStateLatencyMs": total_latency,
+            "meanStateLatencyMs": total_latency / 24,
             "callsPerState": operations["providerCalls"] / 24,
         },
         "technicalStatus": {
-            "structuredContractFailures": sum(1 for r in rows if r["primary"].technicalStatus == "STRUCTURED_CONTRACT_FAILURE"),
-            "auditLTechnicalFailures": sum(1 for r in rows if r["auditRecord"].get("technicalFailure")),
-            "adjudicatorTechnicalFailures": sum(1 for r in rows if r["adjudicationRecord"].get("technicalFailure")),
-            "notEvaluableP3": sum(1 for r in rows if r["consolidated"].disposition in {"NOT_EVALUABLE", "FAIL_CLOSED"}),
+            "structuredContractFailures": structured_failures,
+            "auditLTechnicalFailures": audit_failures,
+            "adjudicatorTechnicalFailures": adjudicator_failures,
+            "notEvaluableP3": not_evaluable,
         },
     }
 
@@ -320,19 +451,19 @@ def human_review(scenario: dict[str, Any], rows: list[dict[str, Any]], result_ro
             "",
             "### P2 — SEM-AUDIT-L",
             "",
-            f"Triggered: `{row['auditRecord']['triggered']}`  ",
-            f"Reasons: `{', '.join(row['auditRecord']['triggerReasons']) or 'NONE'}`",
+            f"Triggered: `{row['auditRecord'].triggered}`  ",
+            f"Reasons: `{', '.join(row['auditRecord'].triggerReasons) or 'NONE'}`",
             "",
             json_block([item.model_dump(mode="json") for item in row["semantic"]]),
             "",
             "### P3 — ADJUDICATED CANDIDATE",
             "",
-            f"Triggered: `{row['adjudicationRecord']['triggered']}`  ",
+            f"Triggered: `{row['adjudicationRecord'].triggered}`  ",
             f"Disposition: `{row['consolidated'].disposition}`",
             "",
             "Resolutions:",
             "",
-            json_block((row["adjudicationRecord"].get("output") or {}).get("resolutions", [])),
+            json_block([item.model_dump(mode="json") for item in row["adjudicationRecord"].output.resolutions] if row["adjudicationRecord"].output else []),
             "",
             "Final candidate state:",
             "",
@@ -348,17 +479,16 @@ def human_review(scenario: dict[str, Any], rows: list[dict[str, Any]], result_ro
             "",
             "Concrete visible-expectation check:",
             "",
-            json_block({
-                "P0": expectation_results(row["scenario"], row["turnIndex"], row["primary"]),
-                "P3": expectation_results(row["scenario"], row["turnIndex"], row["consolidated"].candidateState),
-            }),
+            json_block({"P0": row["p0Expectations"], "P3": row["p3Expectations"]}),
             "",
         ])
     return "\n".join(content)
 
 
-def produce_reports(repository_root: Path, result_root: Path, scenario_pack: Path) -> None:
-    rows = load_rows(result_root)
+def produce_reports(
+    repository_root: Path, result_root: Path, scenario_pack: Path, *, manifest: VerifiedManifest | None = None,
+) -> None:
+    rows = load_rows(result_root, manifest=manifest)
     metrics = build_metrics(rows, result_root)
     terminal = decision(metrics)
     metrics["decision"] = terminal
@@ -370,7 +500,7 @@ def produce_reports(repository_root: Path, result_root: Path, scenario_pack: Pat
         "evidence": {
             "sharedPrimaryOutputAcrossAblations": all(
                 len({
-                    read_json(result_root / "consolidated-states" / f"{row['scenario'].lower()}-{row['turn'].lower()}.json")[key]
+                    getattr(row["consolidatedRecord"], key)
                     for key in ["p0CandidateStateId", "p1CandidateStateId", "p2CandidateStateId", "p3PrimaryCandidateStateId"]
                 }) == 1 for row in rows
             ),
@@ -23,9 +23,11 @@ sys.path.insert(0, str(TASK_ROOT))
 from adjudication.pydantic_adjudicator import PydanticTypedAdjudicator  # noqa: E402
 from audit.deterministic_adapter import DeterministicSemanticAuditor  # noqa: E402
 from audit.semantic_audit_l import SemanticAuditL  # noqa: E402
-from contracts.models import CandidateScientificState, ConversationTurn  # noqa: E402
+from contracts.models import ConversationTurn  # noqa: E402
 from interpreter.pydantic_primary import PydanticPrimaryInterpreter  # noqa: E402
-from pipeline.core import HybridRuntimePipeline  # noqa: E402
+from pipeline.cache import StageCache  # noqa: E402
+from pipeline.checkpoints import CandidateRecord, VerifiedManifest, read_record  # noqa: E402
+from pipeline.core import HybridRuntimePipeline, PipelineResult  # noqa: E402
 from pipeline.ledger import (  # noqa: E402
     MAX_NEW_PROVIDER_REQUESTS,
     MAX_STARTS_PER_ROLLING_60_SECONDS,
@@ -33,7 +35,15 @@ from pipeline.ledger import (  # noqa: E402
     ProviderLedger,
     utc_now,
 )
-from pipeline.storage import atomic_write_json, file_digest, logical_digest, read_json  # noqa: E402
+from pipeline.scheduler import ScenarioChain, ScenarioScheduler, ScheduledState  # noqa: E402
+from pipeline.storage import (  # noqa: E402
+    CHECKPOINT_CODECS,
+    atomic_write_json,
+    configure_checkpoint_codec,
+    file_digest,
+    logical_digest,
+    read_json,
+)
 
 
 def load_environment() -> None:
@@ -93,12 +103,17 @@ def source_files() -> list[Path]:
         REPOSITORY_ROOT / "experiments" / "engine-lab" / "tasks" / "semantic-audit" / "semantic_audit.py",
         REPOSITORY_ROOT / "experiments" / "engine-lab" / "tasks" / "semantic-audit" / "guards.py",
         REPOSITORY_ROOT / "experiments" / "engine-lab" / "contracts" / "semantic-audit-finding.schema.json",
+        REPOSITORY_ROOT / "experiments" / "semantic-engine-comparison" / "providers" / "rate_limit.py",
+        REPOSITORY_ROOT / "experiments" / "semantic-engine-comparison" / "providers" / "jsonl_writer.py",
+        REPOSITORY_ROOT / "experiments" / "semantic-engine-comparison" / "providers" / "canonical.py",
+        REPOSITORY_ROOT / "experiments" / "semantic-engine-comparison" / "providers" / "node_worker.py",
+        REPOSITORY_ROOT / "experiments" / "semantic-engine-comparison" / "providers" / "node_worker.mjs",
         SCENARIO_PACK,
     ])
     return sorted(set(files))
 
 
-def provider_budget() -> dict[str, Any]:
+def provider_budget(workers: int = 1) -> dict[str, Any]:
     plan = {
         "calculationBasis": "ACTUAL_IMPLEMENTED_HARNESS_MAXIMUM",
         "visibleScenarios": 8,
@@ -113,7 +128,8 @@ def provider_budget() -> dict[str, Any]:
         "transientRetryReserve": 8,
         "absoluteMaximum": 80,
         "maximumStartsPerRolling60Seconds": 10,
-        "concurrency": 1,
+        "concurrency": workers,
+        "concurrencyScope": "INDEPENDENT_SCENARIO_CHAINS_TURNS_ORDERED_SHARED_LEDGER",
         "maximumTransientRetryPerOperation": 1,
         "semanticRetry": 0,
         "checkpointRules": [
@@ -139,10 +155,7 @@ def runtime_identities(primary: PydanticPrimaryInterpreter, semantic: SemanticAu
                 "runtimeVersion": "0.1.0",
                 "provider": "LOCAL_DETERMINISTIC",
                 "model": None,
-                "sourceDigest": logical_digest({
-                    "audit": file_digest(REPOSITORY_ROOT / "experiments" / "engine-lab" / "tasks" / "semantic-audit" / "semantic_audit.py"),
-                    "guards": file_digest(REPOSITORY_ROOT / "experiments" / "engine-lab" / "tasks" / "semantic-audit" / "guards.py"),
-                }),
+                "sourceDigest": DeterministicSemanticAuditor.configurationDigest,
             },
             {
                 "runtimeId": semantic.runtimeId,
@@ -151,10 +164,7 @@ def runtime_identities(primary: PydanticPrimaryInterpreter, semantic: SemanticAu
                 "model": MODEL,
                 "temperature": None,
                 "promptSource": "NOXIA_SEM_SINGLE_PROMPT_PLUS_FINDINGS_ONLY_ADAPTER",
-                "promptIdentityDigest": logical_digest({
-                    "semPromptSource": file_digest(REPOSITORY_ROOT / "api" / "prompts" / "scientific-semantic-reconstruction-prompt.ts"),
-                    "adapterRunner": file_digest(TASK_ROOT / "audit" / "sem_audit_l_runner.ts"),
-                }),
+                "promptIdentityDigest": semantic.promptDigest,
                 "schemaDigest": semantic.schemaDigest,
             },
             {
@@ -177,16 +187,16 @@ def runtime_identities(primary: PydanticPrimaryInterpreter, semantic: SemanticAu
     }
 
 
-def build_components(key: str) -> tuple[PydanticPrimaryInterpreter, SemanticAuditL, PydanticTypedAdjudicator]:
+def build_components(key: str, workers: int = 1) -> tuple[PydanticPrimaryInterpreter, SemanticAuditL, PydanticTypedAdjudicator]:
     ledger = ProviderLedger(LEDGER_PATH)
     return (
         PydanticPrimaryInterpreter(ledger=ledger, apiKey=key),
-        SemanticAuditL(ledger=ledger, apiKey=key, repositoryRoot=REPOSITORY_ROOT),
+        SemanticAuditL(ledger=ledger, apiKey=key, repositoryRoot=REPOSITORY_ROOT, runnerPoolSize=workers),
         PydanticTypedAdjudicator(ledger=ledger, apiKey=key),
     )
 
 
-def freeze() -> dict[str, Any]:
+def freeze(workers: int = 1) -> dict[str, Any]:
     RESULT_ROOT.mkdir(parents=True, exist_ok=True)
     for directory in [
         "raw", "candidate-states", "deterministic-findings", "semantic-audit-findings",
@@ -210,7 +220,7 @@ def freeze() -> dict[str, Any]:
         "provider": "GOOGLE_GEMINI",
         "model": MODEL,
         "temperature": None,
-        "providerBudget": provider_budget(),
+        "providerBudget": provider_budget(workers),
         "corpus": {
             "source": str(SCENARIO_PACK.relative_to(REPOSITORY_ROOT)),
             "digest": file_digest(SCENARIO_PACK),
@@ -255,39 +265,52 @@ def verify_freeze() -> dict[str, Any]:
     return manifest
 
 
-def run() -> None:
-    verify_freeze()
+def scenario_chains() -> list[ScenarioChain]:
+    return [
+        ScenarioChain(
+            scenario=scenario["scenarioId"],
+            conversationId=f"HYBRID-{scenario['scenarioId']}",
+            states=[
+                ScheduledState(turn=turn, turns=turns_for(scenario, index), experimentalFinalState=turn == "T2")
+                for index, turn in enumerate(["T0", "T1", "T2"])
+            ],
+        )
+        for scenario in scenario_values()
+    ]
+
+
+def run(workers: int = 1, cacheRoot: Path | None = None) -> None:
+    manifest = verify_freeze()
+    if workers > int(manifest["providerBudget"].get("concurrency", 1)):
+        raise RuntimeError("CONCURRENCY_EXCEEDS_FROZEN_PROVIDER_BUDGET")
     key = api_key()
-    primary, semantic, adjudicator = build_components(key)
+    primary, semantic, adjudicator = build_components(key, workers)
     pipeline = HybridRuntimePipeline(
         primary=primary,
         deterministicAuditor=DeterministicSemanticAuditor(),
         semanticAuditor=semantic,
         adjudicator=adjudicator,
         resultRoot=RESULT_ROOT,
+        cache=StageCache(cacheRoot) if cacheRoot else None,
     )
-    for scenario in scenario_values():
-        previous: CandidateScientificState | None = None
-        for index, turn in enumerate(["T0", "T1", "T2"]):
-            result = pipeline.run_state(
-                scenario=scenario["scenarioId"],
-                turn=turn,
-                conversationId=f"HYBRID-{scenario['scenarioId']}",
-                turns=turns_for(scenario, index),
-                previousState=previous,
-                contextInputs=[],
-                experimentalFinalState=turn == "T2",
-            )
-            previous = result.consolidated.candidateState or result.primary
-            calls = len(ProviderLedger(LEDGER_PATH).reservations())
-            print(
-                f"{scenario['scenarioId']} {turn} COMPLETE auditL={result.auditLTriggered} "
-                f"adjudicator={result.adjudicatorTriggered} calls={calls}",
-                flush=True,
-            )
-
-
-def validate() -> None:
+
+    def report(scenario: str, turn: str, result: PipelineResult) -> None:
+        calls = primary.ledger.reservation_count()
+        print(
+            f"{scenario} {turn} COMPLETE auditL={result.auditLTriggered} "
+            f"adjudicator={result.adjudicatorTriggered} calls={calls}",
+            flush=True,
+        )
+
+    try:
+        ScenarioScheduler(pipeline, workers=workers).run(scenario_chains(), onStateComplete=report)
+    finally:
+        semantic.close()
+    if pipeline.cache is not None:
+        print(json.dumps({"stageCache": pipeline.cache.statistics()}, sort_keys=True), flush=True)
+
+
+def validate(manifest: VerifiedManifest | None = None) -> None:
     verify_freeze()
     candidate_files = sorted((RESULT_ROOT / "candidate-states").glob("*.json"))
     consolidated_files = sorted((RESULT_ROOT / "consolidated-states").glob("*.json"))
@@ -296,7 +319,9 @@ def validate() -> None:
     if len(consolidated_files) not in {0, 24}:
         raise RuntimeError(f"CONSOLIDATED_CHECKPOINT_COUNT_INVALID:{len(consolidated_files)}")
     for path in candidate_files:
-        CandidateScientificState.model_validate(read_json(path)["candidateState"])
+        read_record(path, CandidateRecord, manifest=manifest)
+    if manifest is not None:
+        manifest.save()
     reservations = ProviderLedger(LEDGER_PATH).reservations()
     if len(reservations) > MAX_NEW_PROVIDER_REQUESTS:
         raise RuntimeError("PROVIDER_BUDGET_EXCEEDED")
@@ -314,18 +339,24 @@ def validate() -> None:
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("command", choices=["freeze", "verify-freeze", "run", "report", "validate"])
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--cache-root", type=Path, default=None)
+    parser.add_argument("--checkpoint-codec", choices=CHECKPOINT_CODECS, default="json")
+    parser.add_argument("--verified-manifest", type=Path, default=None)
     args = parser.parse_args()
+    manifest = VerifiedManifest(args.verified_manifest) if args.verified_manifest else None
     if args.command == "freeze":
-        print(json.dumps(freeze()["providerBudget"], indent=2, sort_keys=True))
+        print(json.dumps(freeze(args.workers)["providerBudget"], indent=2, sort_keys=True))
     elif args.command == "verify-freeze":
         print(verify_freeze()["freezeDigest"])
     elif args.command == "run":
-        run()
+        configure_checkpoint_codec(args.checkpoint_codec)
+        run(args.workers, args.cache_root)
     elif args.command == "report":
         from reporting import produce_reports
-        produce_reports(REPOSITORY_ROOT, RESULT_ROOT, SCENARIO_PACK)
+        produce_reports(REPOSITORY_ROOT, RESULT_ROOT, SCENARIO_PACK, manifest=manifest)
     else:
-        validate()
+        validate(manifest)
 
 
 if __name__ == "__main__":
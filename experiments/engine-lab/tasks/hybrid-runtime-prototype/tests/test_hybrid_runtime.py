@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import copy
+import importlib.util
 import json
+import re
 import sys
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import patch
@@ -17,13 +22,21 @@ TASK_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(TASK_ROOT))
 
 from adapters.protocols import InterpreterResult  # noqa: E402
-from audit.deterministic_adapter import DeterministicSemanticAuditor  # noqa: E402
+from audit_corpus import audit_corpus, write_table  # noqa: E402
+from audit.deterministic_adapter import (  # noqa: E402
+    AUDIT,
+    AUDIT_INCREMENTAL,
+    DeterministicSemanticAuditor,
+    ItemView,
+    audit_payload,
+)
 from contracts.models import (  # noqa: E402
     AdjudicationOutput,
     AdjudicationResolution,
     Ambiguity,
     CandidateScientificState,
     ClarificationNeed,
+    ConsolidatedCandidateState,
     ContextInput,
     ConversationTurn,
     OpenDecision,
@@ -31,11 +44,25 @@ from contracts.models import (  # noqa: E402
     RuntimeIdentity,
     ScientificElement,
     ScientificRelation,
+    carries_project_adoption,
 )
-from interpreter.pydantic_primary import RawFirstGoogleModel  # noqa: E402
+from interpreter.pydantic_primary import AgentPool, RawFirstGoogleModel, bind_raw_capture  # noqa: E402
+from pipeline.cache import StageCache  # noqa: E402
+from pipeline.checkpoints import CandidateRecord, ConsolidatedRecord, VerifiedManifest, read_record  # noqa: E402
 from pipeline.core import HybridRuntimePipeline  # noqa: E402
+from pipeline.ledger import ProviderLedger, operation_key  # noqa: E402
 from pipeline.projection import build_candidate_state  # noqa: E402
-from pipeline.storage import atomic_write_json, read_json  # noqa: E402
+from pipeline.scheduler import ScenarioChain, ScenarioScheduler, ScheduledState  # noqa: E402
+from pipeline.snapshot import snapshot  # noqa: E402
+from pipeline.storage import (  # noqa: E402
+    atomic_write_json,
+    checkpoint_digest,
+    configure_checkpoint_codec,
+    file_digest,
+    logical_digest,
+    read_json,
+)
+from reporting import EXPECTATIONS, ExpectationIndex, expectation_results, flatten, load_rows  # noqa: E402
 
 
 def element(
@@ -109,6 +136,76 @@ class FakePrimary:
         return InterpreterResult(candidate=self.value.model_copy(deep=True), rawOutputRef=self.value.source.rawOutputRef, latencyMs=1, providerCalls=0)
 
 
+class ConcurrentPrimary(FakePrimary):
+    def __init__(self, value: CandidateScientificState):
+        super().__init__(value)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls: list[tuple[str, str, str | None]] = []
+
+    def interpret(self, **kwargs: object) -> InterpreterResult:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            previous = kwargs["previousCandidateState"]
+            self.calls.append((str(kwargs["scenario"]), str(kwargs["turn"]), previous.identity.stateId if previous else None))
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return super().interpret(**kwargs)
+
+
+class AsyncPrimary(ConcurrentPrimary):
+    async def interpret_async(self, **kwargs: object) -> InterpreterResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        previous = kwargs["previousCandidateState"]
+        self.calls.append((str(kwargs["scenario"]), str(kwargs["turn"]), previous.identity.stateId if previous else None))
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return FakePrimary.interpret(self, **kwargs)
+
+    def interpret(self, **_: object) -> InterpreterResult:
+        raise AssertionError("blocking interpreter should not be used on the event loop")
+
+
+class CountingPrimary(FakePrimary):
+    promptDigest = "prompt-v1"
+
+    def __init__(self, value: CandidateScientificState):
+        super().__init__(value)
+        self.calls = 0
+
+    def interpret(self, **kwargs: object) -> InterpreterResult:
+        self.calls += 1
+        return super().interpret(**kwargs)
+
+
+class LedgerPrimary(FakePrimary):
+    promptDigest = "prompt-v1"
+
+    def __init__(self, value: CandidateScientificState, ledger: ProviderLedger):
+        super().__init__(value)
+        self.ledger = ledger
+
+    def interpret(self, **kwargs: object) -> InterpreterResult:
+        return self.ledger.execute(
+            operationKey=operation_key(str(kwargs["scenario"]), str(kwargs["turn"]), "PRIMARY", kwargs.get("stageInputKey")),
+            configuration="TEST",
+            scenario=str(kwargs["scenario"]),
+            turn=str(kwargs["turn"]),
+            role="PRIMARY_INTERPRETER",
+            function=lambda reservation: super(LedgerPrimary, self).interpret(**kwargs),
+        )
+
+
+class MutatingAuditor:
+    def audit(self, *, candidateState: CandidateScientificState, **_: object) -> list:
+        candidateState.objects[0].content = "changed"
+        return []
+
+
 class UnusedAdjudicator:
     def adjudicate(self, **_: object):
         raise AssertionError("adjudicator should not be called")
@@ -301,6 +398,516 @@ class HybridRuntimeContractTests(unittest.TestCase):
         self.assertNotIn("semantic-validation/sem-003/blind", material)
         self.assertNotIn("sealed-reference", material)
 
+    def test_hyb_c19_scheduler_runs_scenarios_in_parallel_with_ordered_turns(self) -> None:
+        current = candidate(self.root)
+        primary = ConcurrentPrimary(current)
+        pipeline = HybridRuntimePipeline(
+            primary=primary,
+            deterministicAuditor=EmptyAuditor(),
+            semanticAuditor=EmptyAuditor(),
+            adjudicator=UnusedAdjudicator(),
+            resultRoot=self.root / "results",
+        )
+        chains = [
+            ScenarioChain(
+                scenario=f"S{index}",
+                conversationId=f"conversation-{index}",
+                states=[ScheduledState(turn=turn, turns=current.source.turns) for turn in ["T0", "T1", "T2"]],
+            )
+            for index in range(4)
+        ]
+        completed: list[tuple[str, str]] = []
+        results = ScenarioScheduler(pipeline, workers=4).run(
+            chains, onStateComplete=lambda scenario, turn, _: completed.append((scenario, turn))
+        )
+        self.assertGreater(primary.peak, 1)
+        self.assertEqual([f"S{index}" for index in range(4)], list(results))
+        for index in range(4):
+            calls = [item for item in primary.calls if item[0] == f"S{index}"]
+            self.assertEqual(["T0", "T1", "T2"], [item[1] for item in calls])
+            self.assertIsNone(calls[0][2])
+            self.assertEqual([current.identity.stateId] * 2, [item[2] for item in calls[1:]])
+        self.assertEqual(12, len(completed))
+
+    def test_hyb_c20_parallel_reservations_keep_unique_numbers_and_budget(self) -> None:
+        ledger = ProviderLedger(self.root / "ledger.jsonl")
+        numbers: list[int] = []
+
+        def reserve(index: int) -> None:
+            value = ledger.reserve(
+                operationKey=f"op-{index}", configuration="TEST", scenario=f"S{index}", turn="T0", role="PRIMARY",
+            )
+            numbers.append(int(value["requestNumber"]))
+
+        threads = [threading.Thread(target=reserve, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(list(range(1, 9)), sorted(numbers))
+        self.assertEqual(8, len(ledger.reservations()))
+
+    def test_hyb_c21_ledger_index_tails_appended_bytes_only(self) -> None:
+        path = self.root / "ledger.jsonl"
+        ledger = ProviderLedger(path)
+        first = ledger.reserve(operationKey="op-1", configuration="A", scenario="S", turn="T0", role="PRIMARY")
+        ledger.complete(
+            first, startedAt=first["reservedAt"], providerStatus="SUCCEEDED", rawOutputRef=None, success=True,
+            disposition="SUCCESS", error=None, replayAllowed=False,
+        )
+        other = ProviderLedger(path)
+        other.reserve(operationKey="op-2", configuration="B", scenario="S", turn="T1", role="AUDIT_L")
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write('{"event":"RESERVED","operationKey":"partial"')
+        self.assertEqual(2, ledger.reservation_count())
+        self.assertEqual({"op-1"}, ledger.terminal_operations())
+        self.assertEqual({"PRIMARY": 1, "AUDIT_L": 1}, ledger.counters()["role"])
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(',"role":"PRIMARY","configuration":"A","reservedAt":"2026-08-14T00:00:00Z"}\n')
+        self.assertEqual(3, ledger.reservation_count())
+        self.assertEqual(ledger.events(), [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()])
+        with self.assertRaisesRegex(RuntimeError, "TERMINAL_OPERATION_REPLAY_FORBIDDEN"):
+            other.reserve(operationKey="op-1", configuration="A", scenario="S", turn="T0", role="PRIMARY")
+
+    def test_hyb_c34_concurrent_completions_share_group_commits(self) -> None:
+        ledger = ProviderLedger(self.root / "ledger.jsonl")
+        ledger.writer.group_window = 0.05
+        reservations = [
+            ledger.reserve(operationKey=f"op-{index}", configuration="TEST", scenario=f"S{index}", turn="T0", role="PRIMARY")
+            for index in range(8)
+        ]
+        reserved_fsyncs = ledger.writer.fsyncs
+        barrier = threading.Barrier(len(reservations))
+
+        def complete(reservation: dict) -> None:
+            barrier.wait()
+            ledger.complete(
+                reservation, startedAt=reservation["reservedAt"], providerStatus="SUCCEEDED", rawOutputRef=None,
+                success=True, disposition="SUCCESS", error=None, replayAllowed=False,
+            )
+
+        threads = [threading.Thread(target=complete, args=(reservation,)) for reservation in reservations]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual({f"op-{index}" for index in range(8)}, ledger.terminal_operations())
+        self.assertLess(ledger.writer.fsyncs - reserved_fsyncs, len(reservations))
+
+    def test_hyb_c35_cancelled_provider_call_stays_replayable(self) -> None:
+        ledger = ProviderLedger(self.root / "ledger.jsonl")
+        started = asyncio.Event()
+
+        async def pending(reservation: dict) -> dict:
+            started.set()
+            await asyncio.sleep(60)
+            return {}
+
+        async def failing() -> None:
+            await started.wait()
+            raise RuntimeError("SIBLING_SCENARIO_FAILED")
+
+        async def run() -> None:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(ledger.execute_async(
+                    operationKey="op", configuration="TEST", scenario="S1", turn="T0", role="PRIMARY", function=pending,
+                ))
+                group.create_task(failing())
+
+        with self.assertRaises(ExceptionGroup):
+            asyncio.run(run())
+        interrupted = ledger.events()[-1]
+        self.assertEqual(("COMPLETED", "INTERRUPTED", True), (
+            interrupted["event"], interrupted["finalDisposition"], interrupted["replayAllowed"],
+        ))
+        self.assertEqual(set(), ledger.terminal_operations())
+
+        async def done(reservation: dict) -> dict:
+            return {}
+
+        asyncio.run(ledger.execute_async(
+            operationKey="op", configuration="TEST", scenario="S1", turn="T0", role="PRIMARY", function=done,
+        ))
+        self.assertEqual({"op"}, ledger.terminal_operations())
+        self.assertEqual(2, ledger.reservation_count())
+
+    def test_hyb_c36_recomputed_provider_stage_is_a_new_operation(self) -> None:
+        current = candidate(self.root)
+        ledger = ProviderLedger(self.root / "ledger.jsonl")
+        primary = LedgerPrimary(current, ledger)
+
+        def run() -> None:
+            HybridRuntimePipeline(
+                primary=primary,
+                deterministicAuditor=EmptyAuditor(),
+                semanticAuditor=EmptyAuditor(),
+                adjudicator=UnusedAdjudicator(),
+                resultRoot=self.root / "results",
+            ).run_state(
+                scenario="VISIBLE", turn="T0", conversationId="conversation", turns=current.source.turns,
+                previousState=None, contextInputs=[], experimentalFinalState=False,
+            )
+
+        run()
+        run()
+        self.assertEqual(1, ledger.reservation_count())
+        primary.promptDigest = "prompt-v2"
+        run()
+        self.assertEqual(2, len(ledger.terminal_operations()))
+        # A completed call whose checkpoint was lost is still never replayed.
+        (self.root / "results" / "candidate-states" / "visible-t0.json").unlink()
+        with self.assertRaisesRegex(RuntimeError, "TERMINAL_OPERATION_REPLAY_FORBIDDEN"):
+            run()
+
+    def test_hyb_c22_stage_cache_reuses_only_matching_inputs_across_roots(self) -> None:
+        current = candidate(self.root)
+        primary = CountingPrimary(current)
+        cache = StageCache(self.root / "cache")
+
+        def run(root: str):
+            return HybridRuntimePipeline(
+                primary=primary,
+                deterministicAuditor=EmptyAuditor(),
+                semanticAuditor=EmptyAuditor(),
+                adjudicator=UnusedAdjudicator(),
+                resultRoot=self.root / root,
+                cache=cache,
+            ).run_state(
+                scenario="VISIBLE", turn="T0", conversationId="conversation", turns=current.source.turns,
+                previousState=None, contextInputs=[], experimentalFinalState=False,
+            )
+
+        run("first")
+        run("second")
+        self.assertEqual(1, primary.calls)
+        self.assertTrue((self.root / "second" / "candidate-states" / "visible-t0.json").exists())
+        self.assertEqual(4, sum(cache.statistics()["hits"].values()))
+        primary.promptDigest = "prompt-v2"
+        run("first")
+        self.assertEqual(2, primary.calls)
+
+    def test_hyb_c23_stage_cache_evicts_least_recently_used(self) -> None:
+        cache = StageCache(self.root / "cache", maxEntries=2)
+        cache.put("candidate", "a" * 64, {"value": 1})
+        cache.put("candidate", "b" * 64, {"value": 2})
+        self.assertEqual({"value": 1}, cache.get("candidate", "a" * 64))
+        cache.put("candidate", "c" * 64, {"value": 3})
+        self.assertIsNone(cache.get("candidate", "b" * 64))
+        self.assertEqual({"value": 1}, cache.get("candidate", "a" * 64))
+        statistics = cache.statistics()
+        self.assertEqual((2, 1), (statistics["entries"], statistics["evictions"]))
+
+    def test_hyb_c24_async_run_state_awaits_native_adapters_on_one_loop(self) -> None:
+        current = candidate(self.root)
+        primary = AsyncPrimary(current)
+        pipeline = HybridRuntimePipeline(
+            primary=primary,
+            deterministicAuditor=EmptyAuditor(),
+            semanticAuditor=EmptyAuditor(),
+            adjudicator=UnusedAdjudicator(),
+            resultRoot=self.root / "results",
+        )
+        chains = [
+            ScenarioChain(
+                scenario=f"S{index}",
+                conversationId=f"conversation-{index}",
+                states=[ScheduledState(turn=turn, turns=current.source.turns) for turn in ["T0", "T1"]],
+            )
+            for index in range(6)
+        ]
+        results = asyncio.run(ScenarioScheduler(pipeline, workers=6).run_async(chains))
+        self.assertEqual(6, primary.peak)
+        self.assertEqual({2}, {len(values) for values in results.values()})
+        for index in range(6):
+            calls = [item for item in primary.calls if item[0] == f"S{index}"]
+            self.assertEqual([("T0", None), ("T1", current.identity.stateId)], [(item[1], item[2]) for item in calls])
+
+    def test_hyb_c25_pooled_agent_routes_raw_capture_per_request(self) -> None:
+        pool = AgentPool(apiKey="not-used")
+        primary = pool.agent(PrimaryScientificInterpretation, "primary")
+        self.assertIs(primary, pool.agent(PrimaryScientificInterpretation, "primary"))
+        adjudicator = pool.agent(AdjudicationOutput, "adjudicator")
+        self.assertIs(primary.model, adjudicator.model)
+        self.assertEqual(2, pool.created)
+        captured: dict[str, list[str]] = {"A": [], "B": []}
+
+        async def request(name: str) -> None:
+            with bind_raw_capture(lambda raw: captured[name].append(raw["kind"])):
+                await asyncio.sleep(0.01)
+                primary.model._process_response(FakeResponse())
+
+        async def scenario() -> None:
+            await asyncio.gather(request("A"), request("B"))
+
+        with patch.object(GoogleModel, "_process_response", return_value="ok"):
+            asyncio.run(scenario())
+            with self.assertRaisesRegex(RuntimeError, "RAW_CAPTURE_NOT_BOUND"):
+                primary.model._process_response(FakeResponse())
+        self.assertEqual({"A": ["PROVIDER_RESPONSE"], "B": ["PROVIDER_RESPONSE"]}, captured)
+
+    def test_hyb_c26_corpus_audit_rebuilds_chains_across_processes(self) -> None:
+        first = candidate(self.root)
+        second = first.model_copy(deep=True)
+        second.identity.stateId = "second"
+        second.relations.append(ScientificRelation(
+            relationId="self", sourceElementId="x", targetElementId="x", relationType="ASSOCIATED_WITH",
+            sourceTurnIds=["T0"], sourceText="association", polarity="AFFIRMED", ownership="USER",
+            epistemicStatus="EXPLICIT_USER_STATED", activeState=True,
+        ))
+        second.explicitStatements.clear()
+        second.objects.clear()
+        result_root = self.root / "result"
+        for scenario in ["A", "B"]:
+            for turn, state in [("T0", first), ("T1", second)]:
+                atomic_write_json(result_root / "candidate-states" / f"{scenario}-{turn}.json", {
+                    "scenario": scenario, "turn": turn, "candidateState": state.model_dump(mode="json"),
+                })
+        serial = audit_corpus([result_root])
+        self.assertEqual(serial, audit_corpus([result_root], processes=2))
+        expected = [finding.findingId for finding in self.audit(second, first)]
+        self.assertTrue(expected)
+        self.assertEqual(expected * 2, [row["findingId"] for row in serial if row["turn"] == "T1"])
+        previous_ids = [row["previousStateId"] for row in serial if row["scenario"] == "A" and row["turn"] == "T1"]
+        self.assertEqual([first.identity.stateId] * len(expected), previous_ids)
+        output = self.root / "findings.jsonl"
+        self.assertEqual("jsonl", write_table(serial, output))
+        self.assertEqual(serial, [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()])
+
+    def test_hyb_c27_state_snapshot_is_serialized_once_and_detects_mutation(self) -> None:
+        current = candidate(self.root)
+        value = snapshot(current)
+        self.assertIs(value, snapshot(current))
+        self.assertEqual(current.model_dump(mode="json"), value.document)
+        self.assertTrue(value.unchanged(current))
+        with patch.object(CandidateScientificState, "model_dump", side_effect=AssertionError("dumped twice")):
+            self.assertEqual(value.digest, snapshot(current).digest)
+        with patch.object(CandidateScientificState, "model_dump_json", side_effect=AssertionError("dumped")):
+            self.assertTrue(value.unchanged(current))
+        current.objects[0].content = "edited in place"
+        self.assertFalse(value.unchanged(current))
+        self.assertEqual("edited in place", snapshot(current).document["objects"][0]["content"])
+        self.assertNotEqual(value.digest, snapshot(current).digest)
+        pipeline = HybridRuntimePipeline(
+            primary=FakePrimary(current),
+            deterministicAuditor=MutatingAuditor(),
+            semanticAuditor=EmptyAuditor(),
+            adjudicator=UnusedAdjudicator(),
+            resultRoot=self.root / "results",
+        )
+        with self.assertRaisesRegex(RuntimeError, "SEM_AUDIT_D_MUTATED_PRIMARY_CANDIDATE"):
+            pipeline.run_state(
+                scenario="VISIBLE", turn="T0", conversationId="conversation", turns=current.source.turns,
+                previousState=None, contextInputs=[], experimentalFinalState=False,
+            )
+
+    def test_hyb_c28_checkpoint_codecs_are_detected_and_keep_digests(self) -> None:
+        value = candidate(self.root).model_dump(mode="json")
+        reference = self.root / "json.json"
+        atomic_write_json(reference, value)
+        codecs = ["compact", *(["zstd"] if importlib.util.find_spec("zstandard") else [])]
+        for codec in codecs:
+            path = self.root / f"{codec}.json"
+            atomic_write_json(path, value, codec=codec)
+            self.assertLess(path.stat().st_size, reference.stat().st_size)
+            self.assertEqual(value, read_json(path))
+            self.assertEqual(file_digest(reference), checkpoint_digest(path))
+        self.assertEqual(file_digest(reference), checkpoint_digest(reference))
+        self.assertEqual(logical_digest(value), logical_digest(read_json(self.root / "compact.json")))
+        with self.assertRaisesRegex(RuntimeError, "CHECKPOINT_CODEC_INVALID"):
+            configure_checkpoint_codec("pickle")
+
+    def test_hyb_c29_parallel_report_rows_match_serial_reaudit(self) -> None:
+        first = candidate(self.root)
+        second = first.model_copy(deep=True)
+        second.identity.stateId = "second"
+        second.explicitStatements.clear()
+        result_root = self.root / "result"
+        for scenario in EXPECTATIONS:
+            for turn, state in [("T0", first), ("T1", second), ("T2", second)]:
+                stem = f"{scenario.lower()}-{turn.lower()}"
+                atomic_write_json(result_root / "candidate-states" / f"{stem}.json", {"candidateState": state.model_dump(mode="json")})
+                atomic_write_json(result_root / "deterministic-findings" / f"{stem}.json", {"findings": []})
+                atomic_write_json(result_root / "semantic-audit-findings" / f"{stem}.json", {"findings": [], "triggered": False})
+                atomic_write_json(result_root / "adjudication-records" / f"{stem}.json", {"triggered": False})
+                atomic_write_json(result_root / "consolidated-states" / f"{stem}.json", {"consolidated": ConsolidatedCandidateState(
+                    consolidatedStateId=f"{stem}-consolidated", primaryCandidateStateId=state.identity.stateId,
+                    rawOutputRef=state.source.rawOutputRef, disposition="CANDIDATE_ACCEPTABLE",
+                    candidateState=state, providerCalls=1, latencyMs=1,
+                ).model_dump(mode="json")})
+
+        def summary(rows: list[dict]) -> list[tuple]:
+            return [
+                (row["scenario"], row["turn"], [item.findingId for item in row["p3Findings"]], row["p3Expectations"], row["p3Intrinsic"])
+                for row in rows
+            ]
+
+        serial = load_rows(result_root, workers=1)
+        self.assertEqual(24, len(serial))
+        self.assertEqual(summary(serial), summary(load_rows(result_root, workers=4)))
+        expected = [finding.findingId for finding in self.audit(second, first)]
+        self.assertEqual(expected, [item.findingId for item in serial[1]["p3Findings"]])
+        material = json.dumps(second.model_dump(mode="json"), ensure_ascii=False, sort_keys=True).casefold()
+        self.assertEqual(material, flatten(second))
+        for scenario, values in EXPECTATIONS.items():
+            self.assertEqual(
+                [[bool(re.search(pattern, material, flags=re.IGNORECASE)) for pattern in patterns] for _, _, patterns in values],
+                [item["patternMatches"] for item in expectation_results(scenario, 2, second)],
+            )
+
+    def test_hyb_c30_expectation_index_matches_each_pattern_search(self) -> None:
+        overlapping = ExpectationIndex([
+            (0, "greedy", [r"ne.*pas", r"pas"]),
+            (0, "inside", [r"rien", r"tout"]),
+            (1, "later", [r"absent"]),
+        ])
+        self.assertEqual({"ne.*pas", "pas", "rien", "tout"}, overlapping.matched("ne rien changer pas du tout"))
+        self.assertEqual(["greedy", "inside"], [item["expectation"] for item in overlapping.results(0, "ne pas")])
+        self.assertEqual([True, False, False], [item["met"] for item in overlapping.results(1, "ne pas")])
+        materials = [
+            "",
+            "critère principal: taille d'infarctus, mvo secondaire, strain rejeté ; ne veux pas",
+            "association non causale, pas de prédiction ; concentration iodée mesurée, présence d'iode distincte",
+            "t1 natif partout, ecv deux centres exploratoire si disponible ; candidat principal non adopté à lyon",
+            "dsc asl comparaison paired les deux ; asl seul secondaire ; mesure principale inconnue 3 mois",
+        ]
+        for scenario, values in EXPECTATIONS.items():
+            for material in materials:
+                folded = material.casefold()
+                self.assertEqual(
+                    [[bool(re.search(pattern, folded, flags=re.IGNORECASE)) for pattern in patterns] for _, _, patterns in values],
+                    [item["patternMatches"] for item in ExpectationIndex(values).results(2, folded)],
+                )
+
+    def test_hyb_c31_typed_checkpoints_and_verified_manifest_fast_path(self) -> None:
+        state = candidate(self.root)
+        path = self.root / "candidate.json"
+        atomic_write_json(path, {"experimentId": "X", "candidateState": state.model_dump(mode="json"), "primaryProviderCalls": 2})
+        record = read_record(path, CandidateRecord)
+        self.assertEqual(state, record.candidateState)
+        self.assertEqual((2, 0, None), (record.primaryProviderCalls, record.primaryLatencyMs, record.stageInputKey))
+
+        document = ConsolidatedCandidateState(
+            consolidatedStateId="consolidated", primaryCandidateStateId=state.identity.stateId,
+            rawOutputRef=state.source.rawOutputRef, disposition="CANDIDATE_ACCEPTABLE",
+            candidateState=state, providerCalls=1, latencyMs=1,
+        ).model_dump(mode="json")
+        document["candidateState"]["objects"][0]["adoptionStatus"] = "PROJECT_ADOPTED"
+        adopted = self.root / "consolidated.json"
+        atomic_write_json(adopted, {"consolidated": document})
+        with self.assertRaises(ValidationError):
+            read_record(adopted, ConsolidatedRecord)
+
+        manifest = VerifiedManifest(self.root / "verified.json")
+        read_record(path, CandidateRecord, manifest=manifest)
+        manifest.add("ConsolidatedRecord", file_digest(adopted))
+        manifest.save()
+        reopened = VerifiedManifest(self.root / "verified.json")
+        self.assertTrue(reopened.contains("CandidateRecord", file_digest(path)))
+        trusted = read_record(adopted, ConsolidatedRecord, manifest=reopened)
+        self.assertEqual("PROJECT_ADOPTED", trusted.consolidated.candidateState.objects[0].adoptionStatus)
+        document["latencyMs"] = 2
+        atomic_write_json(adopted, {"consolidated": document})
+        with self.assertRaises(ValidationError):
+            read_record(adopted, ConsolidatedRecord, manifest=reopened)
+
+    def test_hyb_c32_structural_adoption_scan_matches_serialized_scan(self) -> None:
+        def resolution(**overrides: object) -> AdjudicationResolution:
+            value = {
+                "resolutionId": "r1", "action": "KEEP_UNKNOWN", "epistemicStatus": "UNKNOWN",
+                "ownership": "USER", "rationale": "kept", **overrides,
+            }
+            return AdjudicationResolution.model_validate(value)
+
+        base = candidate(self.root)
+        free_text = base.model_copy(deep=True)
+        free_text.objects[0].content = "déjà project_adopted ailleurs"
+        adopted = base.model_copy(deep=True)
+        adopted.objects[0].adoptionStatus = "PROJECT_ADOPTED"
+        split = base.model_copy(deep=True)
+        split.objects[0].content, split.objects[0].sourceText = "PROJECT_", "ADOPTED"
+        values = [
+            base, free_text, adopted, split,
+            resolution(),
+            resolution(previousValue={"Project_Adopted": 1}),
+            resolution(resultingValue=[{"status": ["x", "project_adopted"]}]),
+            resolution(previousValue=element("nested", "association"), resultingValue=(1, 2.5, None, True)),
+        ]
+        for value in values:
+            with self.subTest(value=type(value).__name__):
+                self.assertEqual("PROJECT_ADOPTED" in value.model_dump_json().upper(), carries_project_adoption(value))
+        self.assertEqual([False, True, True, False], [carries_project_adoption(value) for value in values[:4]])
+        self.assertIs(split, ConsolidatedCandidateState(
+            consolidatedStateId="c", primaryCandidateStateId="p", rawOutputRef="r", disposition="CANDIDATE_ACCEPTABLE",
+            candidateState=split, adjudicationResolutions=[values[4]], providerCalls=0, latencyMs=0,
+        ).candidateState)
+        with self.assertRaisesRegex(ValidationError, "Consolidated candidate cannot emit PROJECT_ADOPTED"):
+            ConsolidatedCandidateState(
+                consolidatedStateId="c", primaryCandidateStateId="p", rawOutputRef="r", disposition="CANDIDATE_ACCEPTABLE",
+                candidateState=free_text, providerCalls=0, latencyMs=0,
+            )
+        mutated = base.model_copy(deep=True)
+        self.assertFalse(carries_project_adoption(mutated))
+        mutated.objects[0].adoptionStatus = "PROJECT_ADOPTED"
+        self.assertTrue(carries_project_adoption(mutated))
+        with self.assertRaisesRegex(ValidationError, "Consolidated candidate cannot emit PROJECT_ADOPTED"):
+            ConsolidatedCandidateState(
+                consolidatedStateId="c", primaryCandidateStateId="p", rawOutputRef="r", disposition="CANDIDATE_ACCEPTABLE",
+                candidateState=mutated, providerCalls=0, latencyMs=0,
+            )
+
+    def test_hyb_c33_audit_views_match_materialized_payload_without_copies(self) -> None:
+        current = candidate(self.root)
+        current.objects[0].sourceTurnIds = []
+        current.objects[0].originStatus, current.objects[0].adoptionStatus = "CANDIDATE", "ADOPTED"
+        current.relations = [ScientificRelation(
+            relationId="r", sourceElementId="object", targetElementId="object", relationType="associated_with",
+            sourceTurnIds=["T0"], sourceText="association", polarity="AFFIRMED", ownership="USER",
+            epistemicStatus="EXPLICIT_USER_STATED", activeState=True,
+        )]
+        materialized = audit_payload(current)
+        empty = {"items": [], "relations": [], "ambiguities": [], "clarifications": [], "corrections": []}
+        reference = AUDIT({
+            "previousState": empty,
+            "candidateState": {**empty, **{key: materialized[key] for key in empty if key in materialized}},
+            "confirmedDecisionIds": [],
+            "constraints": [],
+            "rawProviderOutput": {"persisted": True},
+        })
+        captured: list[dict] = []
+        def capture(payload: dict, *, previous: object) -> object:
+            captured.append(payload)
+            return AUDIT_INCREMENTAL(payload, previous=previous)
+
+        with patch("audit.deterministic_adapter.AUDIT_INCREMENTAL", side_effect=capture):
+            findings = DeterministicSemanticAuditor().audit(
+                turns=current.source.turns, previousState=None, candidateState=current, confirmedDecisionIds=[],
+            )
+        self.assertEqual([item["findingId"] for item in reference], [item.findingId for item in findings])
+        self.assertEqual(
+            {"PROVENANCE_GAP", "CANDIDATE_PROMOTED_TO_ADOPTED", "SELF_REFERENTIAL_RELATION"},
+            {item.findingClass for item in findings},
+        )
+        views = captured[0]["candidateState"]["items"]
+        self.assertIs(current.objects[0], views[0].model)
+        self.assertEqual(materialized["items"][0], views[0])
+        self.assertEqual(ItemView(current.objects[0].model_copy(deep=True)), views[0])
+        with self.assertRaises(TypeError):
+            captured[0]["candidateState"]["items"][0]["label"] = "changed"
+        with self.assertRaises(TypeError):
+            captured[0]["constraints"] += ({},)
+
+        auditor = DeterministicSemanticAuditor()
+        clean = candidate(self.root)
+        self.assertEqual([], auditor.audit(turns=clean.source.turns, previousState=None, candidateState=clean, confirmedDecisionIds=[]))
+        clean.objects[0].sourceTurnIds = []
+        clean.objects[0].originStatus, clean.objects[0].adoptionStatus = "CANDIDATE", "ADOPTED"
+        self.assertEqual(
+            ["PROVENANCE_GAP", "CANDIDATE_PROMOTED_TO_ADOPTED"],
+            [item.findingClass for item in auditor.audit(
+                turns=clean.source.turns, previousState=None, candidateState=clean, confirmedDecisionIds=[],
+            )],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
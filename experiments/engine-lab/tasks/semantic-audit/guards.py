@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterable
+from collections import deque
+from functools import cached_property
+from typing import Any, Callable, Iterable, Mapping
 
 
 CANDIDATE_STATUSES = {
@@ -24,6 +26,9 @@ PRIMARY_ROLES = {"PRIMARY_ENDPOINT", "PRIMARY_OUTCOME", "PRIMARY_CRITERION"}
 CAUSAL_RELATIONS = {"CAUSES", "PREDICTS", "DETERMINES", "PREVENTS"}
 NON_CAUSAL_RELATIONS = {"ASSOCIATED_WITH", "RELATED_TO_CANDIDATE", "CORRELATES_WITH"}
 INACTIVE_STATUSES = {"REJECTED", "REJECTED_BY_USER", "SUPERSEDED"}
+BLOCKING_CONSTRAINTS = {"NON_CAUSAL", "EXPLICIT_NEGATION"}
+PARTIAL_SCOPES = {"PARTIAL", "LOCAL", "SUBSET"}
+SYSTEMATIC_CLAIMS = {"SYSTEMATIC", "UNIVERSAL", "ALL_SITES"}
 
 METHOD_CLASSES = {"METHOD", "MEASUREMENT_DEFINITION"}
 MEASURE_CLASSES = {"MEASURE", "QUANTITATIVE_IMAGE", "MEASUREMENT_VALUE"}
@@ -58,8 +63,8 @@ def is_local_practice_promoted(value: dict[str, Any], confirmed_decisions: set[s
 
 
 def is_partial_availability_promoted(value: dict[str, Any], confirmed_decisions: set[str]) -> bool:
-    partial = value.get("availabilityScope") in {"PARTIAL", "LOCAL", "SUBSET"}
-    systematic = value.get("availabilityClaim") in {"SYSTEMATIC", "UNIVERSAL", "ALL_SITES"}
+    partial = value.get("availabilityScope") in PARTIAL_SCOPES
+    systematic = value.get("availabilityClaim") in SYSTEMATIC_CLAIMS
     return partial and systematic and not decision_is_confirmed(value, confirmed_decisions)
 
 
@@ -78,17 +83,162 @@ def relation_is_positive_causal(relation: dict[str, Any]) -> bool:
     return relation.get("relationType") in CAUSAL_RELATIONS and relation.get("polarity", "AFFIRMED") == "AFFIRMED"
 
 
+ConstraintIndex = Mapping[tuple[Any, Any], dict[str, Any]]
+
+
+def index_constraints(constraints: Iterable[dict[str, Any]]) -> dict[tuple[Any, Any], dict[str, Any]]:
+    """Blocking constraints keyed by (subjectId, targetId); the first one per pair wins, as in a scan."""
+
+    index: dict[tuple[Any, Any], dict[str, Any]] = {}
+    for constraint in constraints:
+        if constraint.get("type") in BLOCKING_CONSTRAINTS:
+            index.setdefault((constraint.get("subjectId"), constraint.get("targetId")), constraint)
+    return index
+
+
 def matching_constraint(
-    relation: dict[str, Any], constraints: Iterable[dict[str, Any]]
+    relation: dict[str, Any], constraints: Iterable[dict[str, Any]] | ConstraintIndex
 ) -> dict[str, Any] | None:
-    relation_pair = (relation.get("sourceId"), relation.get("targetId"))
-    for constraint in constraints:
-        if constraint.get("type") not in {"NON_CAUSAL", "EXPLICIT_NEGATION"}:
-            continue
-        constraint_pair = (constraint.get("subjectId"), constraint.get("targetId"))
-        if relation_pair == constraint_pair:
-            return constraint
-    return None
+    index = constraints if isinstance(constraints, Mapping) else index_constraints(constraints)
+    return index.get((relation.get("sourceId"), relation.get("targetId")))
+
+
+class RelationGraph:
+    """Adjacency index over the relations of one state, built once per state.
+
+    Nodes are element IDs; self-references and relations without both endpoints are
+    left to the per-relation guards. Strongly connected components are found in one
+    iterative Tarjan pass, which emits each component after every component it
+    reaches, so its reachable set (a bitset over components) is the OR of already
+    known sets: one word-parallel OR per relation between components. The bitsets are
+    filled on the first ``reaches`` call only, after which ``reaches`` is a bit test;
+    ``path`` walks the adjacency only when a caller reports a hit.
+    """
+
+    def __init__(
+        self,
+        relations: Iterable[Mapping[str, Any]],
+        include: Callable[[Mapping[str, Any]], bool] | None = None,
+    ) -> None:
+        self.successors: dict[Any, list[tuple[Any, Mapping[str, Any]]]] = {}
+        for relation in relations:
+            source, target = relation.get("sourceId"), relation.get("targetId")
+            if not source or not target or source == target or (include is not None and not include(relation)):
+                continue
+            self.successors.setdefault(source, []).append((target, relation))
+            self.successors.setdefault(target, [])
+        self.component: dict[Any, int] = {}
+        self.members: list[list[Any]] = []
+        self._condense()
+
+    def _condense(self) -> None:
+        index: dict[Any, int] = {}
+        low: dict[Any, int] = {}
+        stack: list[Any] = []
+        on_stack: set[Any] = set()
+
+        def visit(node: Any) -> None:
+            index[node] = low[node] = len(index)
+            stack.append(node)
+            on_stack.add(node)
+
+        for root in self.successors:
+            if root in index:
+                continue
+            visit(root)
+            work = [(root, iter(self.successors[root]))]
+            while work:
+                node, edges = work[-1]
+                for target, _ in edges:
+                    if target not in index:
+                        visit(target)
+                        work.append((target, iter(self.successors[target])))
+                        break
+                    if target in on_stack:
+                        low[node] = min(low[node], index[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index[node]:
+                        self._close(node, stack, on_stack)
+
+    def _close(self, node: Any, stack: list[Any], on_stack: set[Any]) -> None:
+        component = len(self.members)
+        members: list[Any] = []
+        while True:
+            member = stack.pop()
+            on_stack.discard(member)
+            self.component[member] = component
+            members.append(member)
+            if member == node:
+                break
+        self.members.append(members)
+
+    @cached_property
+    def _reach(self) -> list[int]:
+        # Components are in emission order, so every component a member points out of is already filled.
+        reach: list[int] = []
+        for component, members in enumerate(self.members):
+            value = 1 << component
+            for member in members:
+                for target, _ in self.successors[member]:
+                    if self.component[target] != component:
+                        value |= reach[self.component[target]]
+            reach.append(value)
+        return reach
+
+    def reaches(self, source: Any, target: Any) -> bool:
+        """True when a directed path of at least one relation leads from ``source`` to ``target``."""
+
+        if source not in self.component or target not in self.component:
+            return False
+        if source == target:
+            return len(self.members[self.component[source]]) > 1
+        return bool(self._reach[self.component[source]] >> self.component[target] & 1)
+
+    def path(self, source: Any, target: Any) -> list[Mapping[str, Any]] | None:
+        """Relations of a shortest path from ``source`` to ``target``, or ``None``."""
+
+        if source == target or not self.reaches(source, target):
+            return None
+        goal = self.component[target]
+        parents: dict[Any, tuple[Any, Mapping[str, Any]]] = {}
+        queue = deque([source])
+        seen = {source}
+        while queue:
+            node = queue.popleft()
+            for successor, relation in self.successors[node]:
+                if successor in seen or not self._reach[self.component[successor]] >> goal & 1:
+                    continue
+                seen.add(successor)
+                parents[successor] = (node, relation)
+                if successor == target:
+                    chain: list[Mapping[str, Any]] = []
+                    while successor != source:
+                        successor, relation = parents[successor]
+                        chain.append(relation)
+                    return chain[::-1]
+                queue.append(successor)
+        return None
+
+    def cycles(self) -> list[tuple[list[Any], list[Mapping[str, Any]]]]:
+        """Every component of more than one element, with the relations inside it, in stable order."""
+
+        result: list[tuple[list[Any], list[Mapping[str, Any]]]] = []
+        for component, members in enumerate(self.members):
+            if len(members) < 2:
+                continue
+            ordered = sorted(members, key=str)
+            inside = [
+                relation
+                for member in ordered
+                for target, relation in self.successors[member]
+                if self.component[target] == component
+            ]
+            result.append((ordered, inside))
+        return result
 
 
 def conceptual_collapse(previous_class: str | None, current_class: str | None) -> str | None:
@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
-import copy
 import hashlib
+import importlib.util
 import json
-from typing import Any
+import sys
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple
 
 from guards import (
     NON_CAUSAL_RELATIONS,
+    RelationGraph,
     conceptual_collapse,
     correction_changes_meaning,
     clarification_is_stale,
     decision_is_confirmed,
     has_provenance,
+    index_constraints,
     is_active_historical_state,
     is_candidate_promoted,
     is_local_practice_promoted,
@@ -24,28 +29,60 @@ from guards import (
     unknown_promoted_without_source,
 )
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+CANONICAL_PATH = Path(__file__).resolve().parents[3] / "semantic-engine-comparison" / "providers" / "canonical.py"
+
+
+def _load_canonical() -> Any:
+    # Same module name as the hybrid runtime, so one process shares one copy.
+    name = "semantic_engine_comparison_canonical"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, CANONICAL_PATH)
+    if not spec or not spec.loader:
+        raise RuntimeError("CANONICAL_JSON_LOAD_FAILED")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_canonical = _load_canonical()
+
+
+def _plain(value: Any) -> Any:
+    # Encoding hook for read-only mapping views handed in instead of dicts.
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 
 def _finding(
     finding_class: str,
     severity: str,
-    value: dict[str, Any] | None,
+    value: Mapping[str, Any] | None,
     pointer: str,
     expected_boundary: str,
     rationale: str,
     owner: str,
-    source_override: dict[str, Any] | None = None,
+    source_override: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
+    # ``candidateValue`` is the audited value itself, not a copy: it is only read, and
+    # encoded once for the finding identity.
     source = source_override or value or {}
-    candidate_value: Any = copy.deepcopy(value)
+    candidate_value: Any = value
     identity = {
         "findingClass": finding_class,
         "candidatePointer": pointer,
         "candidateValue": candidate_value,
         "expectedBoundary": expected_boundary,
     }
-    digest = hashlib.sha256(
-        json.dumps(identity, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    ).hexdigest()[:16]
+    digest = _canonical.canonical_digest(identity, default=_plain)[:16]
     return {
         "findingId": f"SAF-{digest}",
         "findingClass": finding_class,
@@ -74,8 +111,26 @@ def _relation_key(relation: dict[str, Any]) -> tuple[Any, Any]:
     return relation.get("sourceId"), relation.get("targetId")
 
 
-def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
-    """Return findings only; the input object is never mutated."""
+def _unit_keys(prefix: str, names: Iterable[Any]) -> Iterator[str]:
+    # Repeated names are numbered by occurrence, so inserting or removing one element
+    # leaves the keys of every other element unchanged.
+    seen: dict[Any, int] = {}
+    for name in names:
+        count = seen[name] = seen.get(name, 0) + 1
+        yield f"{prefix}:{name}" if count == 1 else f"{prefix}:{name}#{count}"
+
+
+Check = Callable[[], list[dict[str, Any]]]
+
+
+def _audit_units(payload: dict[str, Any]) -> list[tuple[str, tuple[Any, ...], Check]]:
+    """Split the audit into independent units in report order.
+
+    Each unit is ``(key, inputs, check)``; ``check`` depends on nothing but ``inputs``
+    apart from the list position its findings point at.
+    Keys name what a unit audits (a semantic identity, a relation pair, a record ID),
+    never a list position.
+    """
 
     previous_state = payload.get("previousState") or {}
     candidate_state = payload.get("candidateState") or {}
@@ -83,13 +138,17 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
     candidate_items = candidate_state.get("items") or []
     previous_relations = previous_state.get("relations") or []
     candidate_relations = candidate_state.get("relations") or []
-    constraints = payload.get("constraints") or []
+    constraints = index_constraints(payload.get("constraints") or [])
     confirmed_decisions = set(payload.get("confirmedDecisionIds") or [])
-    findings: list[dict[str, Any]] = []
+    decisions = tuple(sorted(confirmed_decisions, key=str))
+    units: list[tuple[str, tuple[Any, ...], Check]] = []
 
     raw_record = payload.get("rawProviderOutput") or {}
-    if raw_record.get("persisted") is not True:
-        findings.append(
+
+    def raw_check() -> list[dict[str, Any]]:
+        if raw_record.get("persisted") is True:
+            return []
+        return [
             _finding(
                 "RAW_OUTPUT_NOT_PERSISTED",
                 "ERROR",
@@ -99,10 +158,12 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
                 "The evidence chain is incomplete; this is a technical traceability failure, not a scientific-understanding judgment.",
                 "EXPERIMENT_OPERATOR",
             )
-        )
+        ]
 
-    for index, item in enumerate(candidate_items):
-        pointer = f"/candidateState/items/{index}"
+    units.append(("/rawProviderOutput", (raw_record,), raw_check))
+
+    def item_check(item: dict[str, Any], pointer: str) -> list[dict[str, Any]]:
+        findings: list[dict[str, Any]] = []
         if not has_provenance(item):
             findings.append(
                 _finding(
@@ -153,9 +214,15 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
                     "RESEARCH_PROJECT",
                 )
             )
+        return findings
 
-    for index, relation in enumerate(candidate_relations):
-        pointer = f"/candidateState/relations/{index}"
+    item_keys = _unit_keys("item", (item.get("semanticIdentity") or item.get("itemId") for item in candidate_items))
+    for index, (key, item) in enumerate(zip(item_keys, candidate_items)):
+        pointer = f"/candidateState/items/{index}"
+        units.append((key, (item, decisions), partial(item_check, item, pointer)))
+
+    def relation_check(relation: dict[str, Any], conflict: dict[str, Any] | None, pointer: str) -> list[dict[str, Any]]:
+        findings: list[dict[str, Any]] = []
         if is_self_referential(relation):
             findings.append(
                 _finding(
@@ -180,7 +247,6 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
                     "SEMANTIC_RECONSTRUCTION",
                 )
             )
-        conflict = matching_constraint(relation, constraints)
         if relation_is_positive_causal(relation) and conflict:
             findings.append(
                 _finding(
@@ -194,14 +260,73 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
                     source_override=conflict,
                 )
             )
+        return findings
 
-    previous_by_identity = _by_semantic_identity(previous_items)
-    candidate_by_identity = _by_semantic_identity(candidate_items)
-    for semantic_identity, previous in previous_by_identity.items():
-        candidate = candidate_by_identity.get(semantic_identity)
-        previous_pointer = f"semanticIdentity:{semantic_identity}"
-        if previous.get("active") is True and previous.get("epistemicStatus") == "EXPLICIT_USER_STATED" and not candidate:
+    relation_keys = _unit_keys(
+        "candidateRelation", ("{}->{}".format(*_relation_key(relation)) for relation in candidate_relations)
+    )
+    for index, (key, relation) in enumerate(zip(relation_keys, candidate_relations)):
+        pointer = f"/candidateState/relations/{index}"
+        conflict = matching_constraint(relation, constraints)
+        units.append((key, (relation, conflict), partial(relation_check, relation, conflict, pointer)))
+
+    def causal_graph_check(
+        relations: tuple[dict[str, Any], ...],
+        blocked: tuple[tuple[tuple[Any, Any], dict[str, Any]], ...],
+        established: tuple[tuple[Any, Any], ...],
+    ) -> list[dict[str, Any]]:
+        findings: list[dict[str, Any]] = []
+        graph = RelationGraph(relations, relation_is_positive_causal)
+        # Pairs with a direct positive causal relation are already reported by relation_check.
+        direct_causal = {_relation_key(relation) for relation in relations if relation_is_positive_causal(relation)}
+        for (subject, target), constraint in blocked:
+            if not subject or not target or (subject, target) in direct_causal:
+                continue
+            chain = graph.path(subject, target)
+            if chain:
+                findings.append(
+                    _finding(
+                        "CAUSAL_PROMOTION",
+                        "CRITICAL",
+                        {"sourceId": subject, "targetId": target, "relations": chain},
+                        f"causalChain:{subject}->{target}",
+                        "An explicit non-causal or negative constraint cannot become a positive causal relation through intermediate elements.",
+                        "A chain of positive causal relations connects endpoints that an explicit constraint keeps non-causal.",
+                        "SEMANTIC_RECONSTRUCTION",
+                        source_override=constraint,
+                    )
+                )
+        established_pairs = set(established)
+        for members, inside in graph.cycles():
+            # A cycle inverts a direction only where it runs against a previous relation.
+            inverted = [relation for relation in inside if _relation_key(relation)[::-1] in established_pairs]
+            if not inverted:
+                continue
             findings.append(
+                _finding(
+                    "RELATION_DIRECTION_ERROR",
+                    "ERROR",
+                    {"elementIds": members, "relations": inside},
+                    "causalCycle:" + ",".join(map(str, members)),
+                    "Positive causal relations keep one direction between elements unless a sourced correction establishes a feedback loop.",
+                    "The candidate's positive causal relations form a cycle that inverts an established direction.",
+                    "SEMANTIC_RECONSTRUCTION",
+                    source_override=inverted[0],
+                )
+            )
+        return findings
+
+    # Graph guards depend on every relation, so they form one unit rebuilt only when the
+    # relations, the constraints or the established pairs change.
+    established = tuple(map(_relation_key, previous_relations))
+    graph_inputs = (tuple(candidate_relations), tuple(constraints.items()), established)
+    units.append(("graph:causal", graph_inputs, partial(causal_graph_check, *graph_inputs)))
+
+    def identity_check(
+        previous: dict[str, Any], candidate: dict[str, Any] | None, previous_pointer: str
+    ) -> list[dict[str, Any]]:
+        if previous.get("active") is True and previous.get("epistemicStatus") == "EXPLICIT_USER_STATED" and not candidate:
+            return [
                 _finding(
                     "EXPLICIT_OMISSION",
                     "CRITICAL",
@@ -211,10 +336,10 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
                     "An explicit prior-state obligation is absent from candidate state.",
                     "SEMANTIC_RECONSTRUCTION",
                 )
-            )
-            continue
+            ]
         if not candidate:
-            continue
+            return []
+        findings: list[dict[str, Any]] = []
         collapse_class = conceptual_collapse(previous.get("conceptClass"), candidate.get("conceptClass"))
         if collapse_class:
             findings.append(
@@ -252,15 +377,27 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
                     "RESEARCH_PROJECT",
                 )
             )
+        return findings
 
-    previous_relation_by_pair = {_relation_key(relation): relation for relation in previous_relations}
-    candidate_relation_by_pair = {_relation_key(relation): relation for relation in candidate_relations}
-    for pair, previous in previous_relation_by_pair.items():
-        candidate = candidate_relation_by_pair.get(pair)
-        reversed_candidate = candidate_relation_by_pair.get((pair[1], pair[0]))
-        pointer = f"relation:{pair[0]}->{pair[1]}"
+    previous_by_identity = _by_semantic_identity(previous_items)
+    candidate_by_identity = _by_semantic_identity(candidate_items)
+    for semantic_identity, previous in previous_by_identity.items():
+        candidate = candidate_by_identity.get(semantic_identity)
+        previous_pointer = f"semanticIdentity:{semantic_identity}"
+        units.append((
+            previous_pointer,
+            (previous, candidate, decisions),
+            partial(identity_check, previous, candidate, previous_pointer),
+        ))
+
+    def pair_check(
+        previous: dict[str, Any],
+        candidate: dict[str, Any] | None,
+        reversed_candidate: dict[str, Any] | None,
+        pointer: str,
+    ) -> list[dict[str, Any]]:
         if not candidate and reversed_candidate:
-            findings.append(
+            return [
                 _finding(
                     "RELATION_DIRECTION_ERROR",
                     "CRITICAL",
@@ -270,55 +407,131 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
                     "The candidate contains the same endpoints in the opposite direction.",
                     "SEMANTIC_RECONSTRUCTION",
                 )
+            ]
+        if not candidate or previous.get("relationType") == candidate.get("relationType"):
+            return []
+        finding_class = (
+            "CAUSAL_PROMOTION"
+            if previous.get("relationType") in NON_CAUSAL_RELATIONS and relation_is_positive_causal(candidate)
+            else "RELATION_MISMATCH"
+        )
+        return [
+            _finding(
+                finding_class,
+                "CRITICAL" if finding_class == "CAUSAL_PROMOTION" else "ERROR",
+                candidate,
+                pointer,
+                "Relation type and scientific force are preserved unless new evidence or a sourced correction supports change.",
+                "The candidate changed the established relation semantics.",
+                "SEMANTIC_RECONSTRUCTION",
             )
-            continue
-        if not candidate:
-            continue
-        if previous.get("relationType") != candidate.get("relationType"):
-            finding_class = (
-                "CAUSAL_PROMOTION"
-                if previous.get("relationType") in NON_CAUSAL_RELATIONS and relation_is_positive_causal(candidate)
-                else "RELATION_MISMATCH"
-            )
-            findings.append(
-                _finding(
-                    finding_class,
-                    "CRITICAL" if finding_class == "CAUSAL_PROMOTION" else "ERROR",
-                    candidate,
-                    pointer,
-                    "Relation type and scientific force are preserved unless new evidence or a sourced correction supports change.",
-                    "The candidate changed the established relation semantics.",
-                    "SEMANTIC_RECONSTRUCTION",
+        ]
+
+    previous_relation_by_pair = {_relation_key(relation): relation for relation in previous_relations}
+    candidate_relation_by_pair = {_relation_key(relation): relation for relation in candidate_relations}
+    for pair, previous in previous_relation_by_pair.items():
+        candidate = candidate_relation_by_pair.get(pair)
+        reversed_candidate = candidate_relation_by_pair.get((pair[1], pair[0]))
+        pointer = f"relation:{pair[0]}->{pair[1]}"
+        units.append((
+            pointer,
+            (previous, candidate, reversed_candidate),
+            partial(pair_check, previous, candidate, reversed_candidate, pointer),
+        ))
+
+    def direction_graph_check(
+        missing: tuple[dict[str, Any], ...], relations: tuple[dict[str, Any], ...]
+    ) -> list[dict[str, Any]]:
+        findings: list[dict[str, Any]] = []
+        graph = RelationGraph(relations) if missing else None
+        for previous in missing:
+            source, target = _relation_key(previous)
+            # A reversal through intermediate elements counts only while no path keeps the original direction.
+            path = None if graph.reaches(source, target) else graph.path(target, source)
+            if path:
+                findings.append(
+                    _finding(
+                        "RELATION_DIRECTION_ERROR",
+                        "CRITICAL",
+                        {"sourceId": target, "targetId": source, "relations": path},
+                        f"relation:{source}->{target}",
+                        "Direction of an established relation is preserved unless a sourced correction changes it.",
+                        "The candidate connects the same endpoints in the opposite direction through intermediate elements.",
+                        "SEMANTIC_RECONSTRUCTION",
+                        source_override=path[0],
+                    )
                 )
+        return findings
+
+    missing = tuple(
+        previous
+        for (source, target), previous in previous_relation_by_pair.items()
+        if (source, target) not in candidate_relation_by_pair and (target, source) not in candidate_relation_by_pair
+    )
+    direction_inputs = (missing, tuple(candidate_relations) if missing else ())
+    units.append(("graph:direction", direction_inputs, partial(direction_graph_check, *direction_inputs)))
+
+    def correction_check(correction: dict[str, Any], pointer: str) -> list[dict[str, Any]]:
+        if correction.get("disposition") not in {"SUPERSEDED", "REJECTED"} or correction_changes_meaning(correction):
+            return []
+        return [
+            _finding(
+                "SUPERSESSION_ERROR",
+                "ERROR",
+                correction,
+                pointer,
+                "A correction or supersession exists only when scientific meaning actually changes.",
+                "The recorded correction has identical before/after semantic identity.",
+                "RESEARCH_PROJECT",
             )
+        ]
 
-    for index, correction in enumerate(candidate_state.get("corrections") or []):
-        if correction.get("disposition") in {"SUPERSEDED", "REJECTED"} and not correction_changes_meaning(correction):
-            findings.append(
-                _finding(
-                    "SUPERSESSION_ERROR",
-                    "ERROR",
-                    correction,
-                    f"/candidateState/corrections/{index}",
-                    "A correction or supersession exists only when scientific meaning actually changes.",
-                    "The recorded correction has identical before/after semantic identity.",
-                    "RESEARCH_PROJECT",
-                )
+    corrections = candidate_state.get("corrections") or []
+    correction_keys = _unit_keys("correction", (correction.get("correctionId") for correction in corrections))
+    for index, (key, correction) in enumerate(zip(correction_keys, corrections)):
+        pointer = f"/candidateState/corrections/{index}"
+        units.append((key, (correction,), partial(correction_check, correction, pointer)))
+
+    def clarification_check(clarification: dict[str, Any], pointer: str) -> list[dict[str, Any]]:
+        if not clarification_is_stale(clarification):
+            return []
+        return [
+            _finding(
+                "HISTORICAL_STATE_REMAINS_ACTIVE",
+                "WARNING",
+                clarification,
+                pointer,
+                "A clarification with a recorded answer is closed or explicitly justified as reopened.",
+                "The candidate keeps an answered clarification open without justification.",
+                "QRY",
             )
+        ]
 
-    for index, clarification in enumerate(candidate_state.get("clarifications") or []):
-        if clarification_is_stale(clarification):
-            findings.append(
-                _finding(
-                    "HISTORICAL_STATE_REMAINS_ACTIVE",
-                    "WARNING",
-                    clarification,
-                    f"/candidateState/clarifications/{index}",
-                    "A clarification with a recorded answer is closed or explicitly justified as reopened.",
-                    "The candidate keeps an answered clarification open without justification.",
-                    "QRY",
-                )
+    clarifications = candidate_state.get("clarifications") or []
+    clarification_keys = _unit_keys(
+        "clarification", (clarification.get("clarificationId") for clarification in clarifications)
+    )
+    for index, (key, clarification) in enumerate(zip(clarification_keys, clarifications)):
+        pointer = f"/candidateState/clarifications/{index}"
+        units.append((key, (clarification,), partial(clarification_check, clarification, pointer)))
+
+    def ambiguity_check(ambiguity: dict[str, Any], candidate: dict[str, Any] | None, pointer: str) -> list[dict[str, Any]]:
+        closed_without_decision = candidate and candidate.get("status") == "RESOLVED" and not decision_is_confirmed(
+            candidate, confirmed_decisions
+        )
+        if candidate is not None and not closed_without_decision:
+            return []
+        return [
+            _finding(
+                "AMBIGUITY_SILENTLY_CLOSED",
+                "CRITICAL",
+                candidate or ambiguity,
+                pointer,
+                "An open ambiguity remains visible until evidence or an authorized decision resolves it.",
+                "The candidate removed or resolved an open ambiguity without a confirmed decision.",
+                "QRY",
             )
+        ]
 
     previous_ambiguities = {
         ambiguity.get("ambiguityId"): ambiguity
@@ -334,20 +547,65 @@ def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
         if ambiguity.get("status") != "OPEN":
             continue
         candidate = candidate_ambiguities.get(ambiguity_id)
-        closed_without_decision = candidate and candidate.get("status") == "RESOLVED" and not decision_is_confirmed(
-            candidate, confirmed_decisions
-        )
-        if candidate is None or closed_without_decision:
-            findings.append(
-                _finding(
-                    "AMBIGUITY_SILENTLY_CLOSED",
-                    "CRITICAL",
-                    candidate or ambiguity,
-                    f"ambiguity:{ambiguity_id}",
-                    "An open ambiguity remains visible until evidence or an authorized decision resolves it.",
-                    "The candidate removed or resolved an open ambiguity without a confirmed decision.",
-                    "QRY",
-                )
-            )
+        pointer = f"ambiguity:{ambiguity_id}"
+        units.append((
+            pointer,
+            (ambiguity, candidate, decisions),
+            partial(ambiguity_check, ambiguity, candidate, pointer),
+        ))
+
+    return units
 
+
+def audit_semantic_integrity(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return findings only; the input object is never mutated.
+
+    Findings share their ``candidateValue`` with the input and must be treated as read-only.
+    """
+
+    findings: list[dict[str, Any]] = []
+    for _, _, check in _audit_units(payload):
+        findings.extend(check())
     return findings
+
+
+def _fingerprint(inputs: tuple[Any, ...]) -> bytes | None:
+    # A cache key within one process, not an identifier: keys keep their given order, so
+    # reordered keys only cost a re-check. None when the inputs do not encode.
+    try:
+        if orjson:
+            data = orjson.dumps(inputs, default=_plain)
+        else:
+            data = json.dumps(inputs, default=_plain, separators=(",", ":")).encode()
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class AuditRecord(NamedTuple):
+    """Findings of one audit and the input fingerprint of each unit that found nothing."""
+
+    findings: list[dict[str, Any]]
+    digests: dict[str, bytes]
+
+
+def audit_semantic_integrity_incremental(
+    payload: dict[str, Any], *, previous: AuditRecord | None = None
+) -> AuditRecord:
+    """Same findings as ``audit_semantic_integrity(payload)``, re-checking only changed units."""
+
+    recorded = previous.digests if previous else {}
+    findings: list[dict[str, Any]] = []
+    digests: dict[str, bytes] = {}
+    for key, inputs, check in _audit_units(payload):
+        digest = _fingerprint(inputs)
+        if digest is not None and recorded.get(key) == digest:
+            digests[key] = digest
+            continue
+        # Units with findings always re-run, so their findings reference current values.
+        fresh = check()
+        if fresh:
+            findings.extend(fresh)
+        elif digest is not None:
+            digests[key] = digest
+    return AuditRecord(findings=findings, digests=digests)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import random
 import sys
 import unittest
 from pathlib import Path
@@ -12,6 +13,7 @@ spec = importlib.util.spec_from_file_location("semantic_audit_guard_matrix", TAS
 semantic_audit = importlib.util.module_from_spec(spec)
 assert spec and spec.loader
 spec.loader.exec_module(semantic_audit)
+import guards  # noqa: E402
 
 
 def payload() -> dict:
@@ -29,6 +31,17 @@ def finding_classes(value: dict) -> set[str]:
     return {finding["findingClass"] for finding in semantic_audit.audit_semantic_integrity(value)}
 
 
+def relation(source: str, target: str, relation_type: str = "CAUSES") -> dict:
+    return {
+        "relationId": f"{source}-{target}",
+        "sourceId": source,
+        "targetId": target,
+        "relationType": relation_type,
+        "sourceTurnIds": ["T0"],
+        "sourceText": "source",
+    }
+
+
 def item(identity: str, concept_class: str, epistemic_status: str = "EXPLICIT_USER_STATED") -> dict:
     return {
         "itemId": identity,
@@ -101,6 +114,79 @@ class DeterministicGuardMatrixTests(unittest.TestCase):
         value["candidateState"]["items"] = [candidate]
         self.assertIn("UNSUPPORTED_INVENTION", finding_classes(value))
 
+    def test_g13_item_guards_and_constraint_index(self) -> None:
+        confirmed = {"D1"}
+        self.assertFalse(guards.is_candidate_promoted({"originStatus": "CANDIDATE", "role": "PRIMARY_ENDPOINT", "decisionId": "D1"}, confirmed))
+        self.assertTrue(guards.is_candidate_promoted({"previousEpistemicStatus": "CANDIDATE", "epistemicStatus": "CONFIRMED"}, confirmed))
+        self.assertTrue(guards.is_local_practice_promoted({"ownership": "LOCAL_PRACTICE", "adoptionStatus": "ADOPTED"}, confirmed))
+        self.assertTrue(guards.is_partial_availability_promoted(
+            {"availabilityScope": "SUBSET", "availabilityClaim": "ALL_SITES", "decisionId": "D2"}, confirmed
+        ))
+        historical = {"lifecycleStatus": "SUPERSEDED", "active": True, "sourceTurnIds": ["T0"], "sourceText": ""}
+        self.assertTrue(guards.is_active_historical_state(historical))
+        self.assertFalse(guards.has_provenance(historical))
+
+        constraints = [
+            {"type": "RELATED", "subjectId": "a", "targetId": "b"},
+            {"type": "NON_CAUSAL", "subjectId": "a", "targetId": "b", "sourceText": "first"},
+            {"type": "EXPLICIT_NEGATION", "subjectId": "a", "targetId": "b", "sourceText": "second"},
+        ]
+        index = guards.index_constraints(constraints)
+        relation = {"sourceId": "a", "targetId": "b"}
+        self.assertIs(constraints[1], guards.matching_constraint(relation, index))
+        self.assertIs(constraints[1], guards.matching_constraint(relation, constraints))
+        self.assertIsNone(guards.matching_constraint({"sourceId": "b", "targetId": "a"}, index))
+
+    def test_g14_relation_graph_reachability_and_transitive_guards(self) -> None:
+        generator = random.Random(14)
+        for _ in range(50):
+            nodes = [f"n{index}" for index in range(generator.randint(1, 12))]
+            relations = [relation(generator.choice(nodes), generator.choice(nodes)) for _ in range(generator.randint(0, 20))]
+            graph = guards.RelationGraph(relations)
+            for source in nodes:
+                seen: set[str] = set()
+                frontier = [source]
+                while frontier:
+                    node = frontier.pop()
+                    for value in relations:
+                        if value["sourceId"] == node and value["targetId"] != node and value["targetId"] not in seen:
+                            seen.add(value["targetId"])
+                            frontier.append(value["targetId"])
+                for target in nodes:
+                    self.assertEqual(target in seen, graph.reaches(source, target))
+                    chain = graph.path(source, target)
+                    if chain:
+                        self.assertEqual((source, target), (chain[0]["sourceId"], chain[-1]["targetId"]))
+                        self.assertTrue(all(a["targetId"] == b["sourceId"] for a, b in zip(chain, chain[1:])))
+
+        value = payload()
+        value["candidateState"]["relations"] = [
+            relation("a", "b", "ASSOCIATED_WITH"), relation("a", "m"), relation("m", "b", "PREDICTS"),
+        ]
+        value["constraints"] = [{"type": "NON_CAUSAL", "subjectId": "a", "targetId": "b", "sourceTurnIds": ["T0"], "sourceText": "pas causal"}]
+        findings = semantic_audit.audit_semantic_integrity(value)
+        self.assertEqual([("CAUSAL_PROMOTION", "causalChain:a->b")], [(f["findingClass"], f["candidatePointer"]) for f in findings])
+        self.assertEqual(["a-m", "m-b"], [item["relationId"] for item in findings[0]["candidateValue"]["relations"]])
+        value["candidateState"]["relations"][1]["polarity"] = "NEGATED"
+        self.assertEqual(set(), finding_classes(value))
+
+        value = payload()
+        value["candidateState"]["relations"] = [relation("a", "b"), relation("b", "c"), relation("c", "a")]
+        self.assertEqual([], semantic_audit.audit_semantic_integrity(value))
+        value["previousState"]["relations"] = [relation("b", "c"), relation("c", "b")]
+        value["candidateState"]["relations"].append(relation("c", "b"))
+        findings = semantic_audit.audit_semantic_integrity(value)
+        self.assertEqual(["causalCycle:a,b,c"], [f["candidatePointer"] for f in findings])
+
+        value = payload()
+        value["previousState"]["relations"] = [relation("a", "b", "ASSOCIATED_WITH")]
+        value["candidateState"]["relations"] = [relation("b", "m", "ASSOCIATED_WITH"), relation("m", "a", "ASSOCIATED_WITH")]
+        findings = semantic_audit.audit_semantic_integrity(value)
+        self.assertEqual([("RELATION_DIRECTION_ERROR", "relation:a->b")], [(f["findingClass"], f["candidatePointer"]) for f in findings])
+        value["candidateState"]["relations"].append(relation("a", "c", "ASSOCIATED_WITH"))
+        value["candidateState"]["relations"].append(relation("c", "b", "ASSOCIATED_WITH"))
+        self.assertEqual(set(), finding_classes(value))
+
 
 if __name__ == "__main__":
     unittest.main()
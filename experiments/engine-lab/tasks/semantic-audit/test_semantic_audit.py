@@ -7,6 +7,7 @@ import re
 import sys
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from jsonschema import Draft202012Validator
 
@@ -21,6 +22,7 @@ semantic_audit = importlib.util.module_from_spec(spec)
 assert spec and spec.loader
 spec.loader.exec_module(semantic_audit)
 audit_semantic_integrity = semantic_audit.audit_semantic_integrity
+audit_semantic_integrity_incremental = semantic_audit.audit_semantic_integrity_incremental
 
 
 def load_variant(filename: str, fixture_id: str) -> dict:
@@ -193,6 +195,123 @@ class SemanticAuditContractTests(unittest.TestCase):
         self.assertTrue(all(finding["status"] == "OPEN" for finding in findings))
         self.assert_valid_findings(findings)
 
+    def test_aud_c13_incremental_audit_matches_full_run(self) -> None:
+        for path in sorted(FIXTURE_DIR.glob("*.json")):
+            variants = json.loads(path.read_text(encoding="utf-8"))["variants"]
+            for previous in variants:
+                record = audit_semantic_integrity_incremental(previous["input"])
+                self.assertEqual(audit_semantic_integrity(previous["input"]), record.findings)
+                for current in variants:
+                    with self.subTest(previous=previous["fixtureId"], current=current["fixtureId"]):
+                        before = copy.deepcopy(current["input"])
+                        incremental = audit_semantic_integrity_incremental(current["input"], previous=record).findings
+                        self.assertEqual(audit_semantic_integrity(current["input"]), incremental)
+                        self.assertEqual(before, current["input"])
+
+        payload = minimal_payload()
+        payload["candidateState"]["items"] = [
+            {"itemId": "A", "semanticIdentity": "a", "label": "measure", "sourceTurnIds": []},
+            {"itemId": "B", "semanticIdentity": "b", "label": "method", "sourceTurnIds": ["T0"], "sourceText": "source"},
+        ]
+        record = audit_semantic_integrity_incremental(payload)
+        payload["candidateState"]["items"][1]["sourceTurnIds"] = []
+        reused = audit_semantic_integrity_incremental(payload, previous=record).findings
+        self.assertEqual(audit_semantic_integrity(payload), reused)
+        self.assertEqual(["/candidateState/items/0", "/candidateState/items/1"], [f["candidatePointer"] for f in reused])
+
+    def test_aud_c15_incremental_work_is_bounded_by_the_change(self) -> None:
+        payload = minimal_payload()
+        payload["candidateState"]["items"] = [
+            {"itemId": f"I{index}", "semanticIdentity": f"s{index}", "label": "x", "sourceTurnIds": ["T0"], "sourceText": "source"}
+            for index in range(2000)
+        ]
+        payload["previousState"]["items"] = copy.deepcopy(payload["candidateState"]["items"])
+        payload["candidateState"]["relations"] = [
+            {"relationId": f"R{index}", "sourceId": f"I{index}", "targetId": f"I{index + 1}", "relationType": "CAUSES",
+             "sourceTurnIds": ["T0"], "sourceText": "source"}
+            for index in range(500)
+        ]
+        record = audit_semantic_integrity_incremental(payload)
+        payload["candidateState"]["items"][7]["originStatus"] = "CANDIDATE"
+        payload["candidateState"]["items"][7]["adoptionStatus"] = "ADOPTED"
+        counted = {"items": 0, "graphs": 0}
+        promoted, graph = semantic_audit.is_candidate_promoted, semantic_audit.RelationGraph
+
+        def count_item(*args: object) -> bool:
+            counted["items"] += 1
+            return promoted(*args)
+
+        def count_graph(*args: object) -> object:
+            counted["graphs"] += 1
+            return graph(*args)
+
+        def counted_audit(previous: object) -> object:
+            counted.update(items=0, graphs=0)
+            with patch.object(semantic_audit, "is_candidate_promoted", count_item), patch.object(semantic_audit, "RelationGraph", count_graph):
+                return audit_semantic_integrity_incremental(payload, previous=previous)
+
+        changed = counted_audit(record)
+        self.assertEqual({"items": 1, "graphs": 0}, counted)
+        self.assertEqual(["CANDIDATE_PROMOTED_TO_ADOPTED"], [finding["findingClass"] for finding in changed.findings])
+        self.assertEqual(audit_semantic_integrity(payload), changed.findings)
+
+        # Inserting at the front shifts every index; only the new item and the item with a finding run.
+        payload["candidateState"]["items"].insert(
+            0, {"itemId": "new", "semanticIdentity": "new", "label": "x", "sourceTurnIds": ["T0"], "sourceText": "source"}
+        )
+        inserted = counted_audit(changed)
+        self.assertEqual({"items": 2, "graphs": 0}, counted)
+        self.assertEqual(audit_semantic_integrity(payload), inserted.findings)
+        self.assertEqual(["/candidateState/items/8"], [finding["candidatePointer"] for finding in inserted.findings])
+
+    def test_aud_c14_relation_graph_findings_follow_contract_and_increment(self) -> None:
+        def relation(source: str, target: str, relation_type: str = "CAUSES") -> dict:
+            return {
+                "relationId": f"{source}-{target}", "sourceId": source, "targetId": target,
+                "relationType": relation_type, "sourceTurnIds": ["T0"], "sourceText": "source",
+            }
+
+        payload = minimal_payload()
+        payload["previousState"]["relations"] = [relation("x", "y", "ASSOCIATED_WITH"), relation("a", "b", "ASSOCIATED_WITH")]
+        payload["candidateState"]["relations"] = [
+            relation("a", "b", "ASSOCIATED_WITH"), relation("a", "m"), relation("m", "b"), relation("b", "a"),
+            relation("y", "z", "ASSOCIATED_WITH"), relation("z", "x", "ASSOCIATED_WITH"),
+        ]
+        payload["constraints"] = [{"type": "NON_CAUSAL", "subjectId": "a", "targetId": "b", "sourceTurnIds": ["T0"], "sourceText": "source"}]
+        before = copy.deepcopy(payload)
+        findings = audit_semantic_integrity(payload)
+        self.assertEqual(before, payload)
+        self.assert_valid_findings(findings)
+        self.assertEqual(
+            {"causalChain:a->b", "causalCycle:a,b,m", "relation:x->y"},
+            {finding["candidatePointer"] for finding in findings},
+        )
+        changed = copy.deepcopy(payload)
+        changed["candidateState"]["relations"][3]["relationType"] = "ASSOCIATED_WITH"
+        record = audit_semantic_integrity_incremental(payload)
+        incremental = audit_semantic_integrity_incremental(changed, previous=record).findings
+        self.assertEqual(audit_semantic_integrity(changed), incremental)
+        self.assertNotIn("causalCycle:a,b,m", {finding["candidatePointer"] for finding in incremental})
+
+    def test_aud_c16_causal_cycle_is_reported_only_against_an_established_direction(self) -> None:
+        def relation(source: str, target: str) -> dict:
+            return {
+                "relationId": f"{source}-{target}", "sourceId": source, "targetId": target,
+                "relationType": "CAUSES", "sourceTurnIds": ["T0"], "sourceText": "source",
+            }
+
+        payload = minimal_payload()
+        payload["candidateState"]["relations"] = [relation("a", "b"), relation("b", "c"), relation("c", "a")]
+        self.assertEqual([], audit_semantic_integrity(payload))
+        record = audit_semantic_integrity_incremental(payload)
+        self.assertEqual([], record.findings)
+
+        payload["previousState"]["relations"] = [relation("a", "c")]
+        findings = audit_semantic_integrity(payload)
+        self.assertEqual(["causalCycle:a,b,c", "relation:a->c"], [finding["candidatePointer"] for finding in findings])
+        self.assertEqual({"RELATION_DIRECTION_ERROR"}, {finding["findingClass"] for finding in findings})
+        self.assertEqual(findings, audit_semantic_integrity_incremental(payload, previous=record).findings)
+
 
 if __name__ == "__main__":
     unittest.main()
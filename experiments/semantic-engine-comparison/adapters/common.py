@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import hashlib
-import json
-
 from contracts.projection import (
     ComparativeCaseInput,
     NormalizedCandidateSemanticRepresentation,
@@ -10,11 +7,7 @@ from contracts.projection import (
     NormalizedSemanticRelation,
     ScientificUnderstandingProjection,
 )
-
-
-def canonical_digest(value: object) -> str:
-    material = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(material).hexdigest()
+from providers.canonical import canonical_digest  # noqa: F401 - re-exported for the adapters
 
 
 def normalize_projection(
@@ -3,6 +3,7 @@ import { readFileSync } from "node:fs";
 import { GeminiScientificSemanticProvider } from "../../../src/features/scientific-semantic-reconstruction/provider.js";
 import { processScientificSemanticHttp } from "../../../src/features/scientific-semantic-reconstruction/server.js";
 import { SCIENTIFIC_SEMANTIC_SCHEMA_VERSION } from "../../../src/features/scientific-semantic-reconstruction/types.js";
+import { isServing, serveLines } from "../providers/node_worker.mjs";
 
 type ComparativeCaseInput = {
   schemaVersion: "1.0.0";
@@ -36,12 +37,16 @@ export const executeCurrentSem = async (input: ComparativeCaseInput, apiKey: str
   return response.body;
 };
 
-const runFromStdin = async () => {
-  const input = JSON.parse(readFileSync(0, "utf8")) as ComparativeCaseInput;
+const run = async (input: ComparativeCaseInput) => {
   const output = await executeCurrentSem(input, process.env.GEMINI_API_KEY ?? "");
   process.stdout.write(`${JSON.stringify(output)}\n`);
 };
 
+const runFromStdin = async () => {
+  await run(JSON.parse(readFileSync(0, "utf8")) as ComparativeCaseInput);
+};
+
 if (process.argv[1]?.endsWith("sem_current.ts") && process.env.SEM003C1_VALIDATE_ONLY !== "1") {
-  void runFromStdin();
+  if (isServing()) serveLines(run);
+  else void runFromStdin();
 }
@@ -1,7 +1,15 @@
 import { readFileSync } from "node:fs";
 
 import { evaluateScientificUnderstanding } from "../../../semantic-validation/sem-003/evaluator/core/evaluator.mjs";
+import { isServing, serveLines } from "../providers/node_worker.mjs";
 
-const input = JSON.parse(readFileSync(0, "utf8"));
-const result = evaluateScientificUnderstanding(input);
-process.stdout.write(`${JSON.stringify(result)}\n`);
+const run = async (input) => {
+  const result = evaluateScientificUnderstanding(input);
+  process.stdout.write(`${JSON.stringify(result)}\n`);
+};
+
+if (isServing()) {
+  serveLines(run);
+} else {
+  await run(JSON.parse(readFileSync(0, "utf8")));
+}
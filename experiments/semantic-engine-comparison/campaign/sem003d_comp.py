@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import dataclasses
 import datetime as dt
 import enum
@@ -11,8 +12,10 @@ import os
 from pathlib import Path
 import re
 import statistics
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 import sys
+import threading
 import time
 from typing import Any
 
@@ -49,6 +52,10 @@ from contracts.projection import (  # noqa: E402
     ConversationTurn,
     NormalizedCandidateSemanticRepresentation,
 )
+from providers.canonical import pretty_json  # noqa: E402
+from providers.node_worker import close_shared_pools, shared_pool  # noqa: E402
+from providers.rate_limit import RollingWindowLimiter  # noqa: E402
+from providers.work_queue import WorkQueue  # noqa: E402
 
 
 CAMPAIGN_ID = "SEM003D-COMP-COMMON-BLIND-01"
@@ -66,6 +73,15 @@ TERMINAL_STATUSES = {
     "FRAMEWORK_FAILURE",
 }
 MIN_RUN_START_INTERVAL_SECONDS = 6.0
+RUNTIME_STATE_PATH = RESULT_ROOT / "runtime-state.json"
+RUN_START_LIMITER = RollingWindowLimiter(limit=1, window=MIN_RUN_START_INTERVAL_SECONDS, margin=0.0)
+SEM_RUNNER_POOL_SIZE = 1
+EVALUATION_WORKERS = 4
+GENERATION_WORKERS = 1
+RUN_QUEUE_PATH = RESULT_ROOT / "run-queue.sqlite3"
+RUN_LEASE_SECONDS = 300.0
+# Outside RUN_ROOT so abandoned partial outputs never enter the generation freeze digest.
+ABANDONED_RUN_ROOT = RESULT_ROOT / "abandoned-runs"
 
 BASELINES = [
     {
@@ -154,7 +170,7 @@ def read_json(path: Path) -> dict[str, Any]:
 
 
 def stable_json(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+    return pretty_json(value)
 
 
 def write_json(path: Path, value: Any) -> None:
@@ -394,15 +410,21 @@ def assert_precommit() -> dict[str, Any]:
     return recorded
 
 
+def observe_runtime_state() -> None:
+    if RUNTIME_STATE_PATH.exists():
+        last = float(read_json(RUNTIME_STATE_PATH).get("lastRunStartEpoch", 0))
+        RUN_START_LIMITER.record(last, token=f"runtime-state:{last!r}")
+
+
+RUN_START_LIMITER.add_observer(observe_runtime_state)
+
+
 def wait_for_pacing() -> None:
-    state_path = RESULT_ROOT / "runtime-state.json"
-    if state_path.exists():
-        state = read_json(state_path)
-        last = float(state.get("lastRunStartEpoch", 0))
-        delay = MIN_RUN_START_INTERVAL_SECONDS - (time.time() - last)
-        if delay > 0:
-            time.sleep(delay)
-    write_json(state_path, {"lastRunStartEpoch": time.time(), "updatedAt": utc_now()})
+    # runtime-state.json keeps the interval across process restarts.
+    with RUN_START_LIMITER.slot():
+        started = time.time()
+        RUN_START_LIMITER.record(started, token=f"runtime-state:{started!r}")
+        write_json(RUNTIME_STATE_PATH, {"lastRunStartEpoch": started, "updatedAt": utc_now()})
 
 
 def classify_error(caught: BaseException) -> str:
@@ -441,20 +463,39 @@ def sem_provider_call_count(response: dict[str, Any]) -> int | None:
     return None
 
 
+def configure_sem_pool(size: int) -> None:
+    global SEM_RUNNER_POOL_SIZE
+    if size < 1:
+        raise RuntimeError("SEM_RUNNER_POOL_SIZE_INVALID")
+    SEM_RUNNER_POOL_SIZE = size
+
+
+def configure_evaluation_workers(size: int) -> None:
+    global EVALUATION_WORKERS
+    if size < 1:
+        raise RuntimeError("EVALUATION_WORKERS_INVALID")
+    EVALUATION_WORKERS = size
+
+
+def configure_generation_workers(size: int) -> None:
+    global GENERATION_WORKERS
+    if size < 1:
+        raise RuntimeError("GENERATION_WORKERS_INVALID")
+    GENERATION_WORKERS = size
+
+
 def execute_sem(case: ComparativeCaseInput) -> tuple[Any, int | None, str]:
     executable = REPOSITORY_ROOT / "node_modules" / ".bin" / "vite-node"
-    completed = subprocess.run(
+    pool = shared_pool(
         [str(executable), "experiments/semantic-engine-comparison/baselines/sem_current.ts"],
         cwd=REPOSITORY_ROOT,
-        input=json.dumps(case.model_dump(mode="json"), ensure_ascii=False),
-        text=True,
-        capture_output=True,
-        check=False,
+        size=SEM_RUNNER_POOL_SIZE,
         env=os.environ.copy(),
     )
+    completed = pool.call(case.model_dump(mode="json"))
     stderr = sanitize(completed.stderr)
-    if completed.returncode != 0:
-        raise RuntimeError(stderr or f"SEM subprocess exit {completed.returncode}")
+    if completed.exit_code != 0:
+        raise RuntimeError(stderr or f"SEM subprocess exit {completed.exit_code}")
     lines = [line for line in completed.stdout.splitlines() if line.strip()]
     if not lines:
         raise ValueError("SEM returned no JSON output")
@@ -490,7 +531,20 @@ def run_directory(entry: dict[str, Any]) -> Path:
     return RUN_ROOT / f"{entry['runOrdinal']:03d}-{entry['caseId'].lower()}-{entry['slug']}"
 
 
-def execute_run(entry: dict[str, Any], frozen: dict[str, dict[str, Any]]) -> dict[str, Any]:
+def set_aside_abandoned_run(entry: dict[str, Any]) -> Path | None:
+    """Move a run directory without ``run.json`` out of ``RUN_ROOT``; only the lease holder may call this."""
+
+    directory = run_directory(entry)
+    if not directory.exists() or (directory / "run.json").exists():
+        return None
+    ABANDONED_RUN_ROOT.mkdir(parents=True, exist_ok=True)
+    attempt = len(list(ABANDONED_RUN_ROOT.glob(f"{directory.name}.attempt-*"))) + 1
+    target = ABANDONED_RUN_ROOT / f"{directory.name}.attempt-{attempt}"
+    directory.replace(target)
+    return target
+
+
+def execute_run(entry: dict[str, Any], frozen: dict[str, dict[str, Any]], *, reclaim: bool = False) -> dict[str, Any]:
     directory = run_directory(entry)
     record_path = directory / "run.json"
     if record_path.exists():
@@ -498,6 +552,7 @@ def execute_run(entry: dict[str, Any], frozen: dict[str, dict[str, Any]]) -> dic
         if record.get("terminalStatus") not in TERMINAL_STATUSES:
             raise RuntimeError(f"NON_TERMINAL_EXISTING_RUN:{entry['runId']}")
         return record
+    retried = reclaim and set_aside_abandoned_run(entry) is not None
     directory.mkdir(parents=True, exist_ok=False)
     runtime_input = read_json(REPOSITORY_ROOT / entry["caseFile"])
     case = comparative_case(runtime_input)
@@ -596,7 +651,7 @@ def execute_run(entry: dict[str, Any], frozen: dict[str, dict[str, Any]]) -> dic
         "stderr": stderr or None,
         "error": error,
         "bestRunSelected": False,
-        "retryPerformedByCampaign": False,
+        "retryPerformedByCampaign": retried,
         "sealedReferenceAccessed": False,
     }
     write_json(record_path, record)
@@ -655,19 +710,61 @@ def generation_manifest(records: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def generate() -> None:
+def generate(*, workers: int | None = None) -> None:
+    """Drain the run schedule through the durable run queue; the last process to finish freezes the output."""
+
     assert_precommit()
     frozen = manifests()
-    records: list[dict[str, Any]] = []
-    for entry in schedule():
-        assert_protected_clean()
-        record = execute_run(entry, frozen)
-        records.append(record)
-        print(
-            f"{entry['runOrdinal']:03d}/090 {entry['caseId']} {entry['baselineId']} {record['terminalStatus']} {record['latencyMs']}ms",
-            flush=True,
-        )
+    entries = schedule()
+    by_run = {entry["runId"]: entry for entry in entries}
+    queue = WorkQueue(RUN_QUEUE_PATH, lease_seconds=RUN_LEASE_SECONDS)
+    queue.enqueue(entry["runId"] for entry in entries)
+    for entry in entries:
+        # Runs finished before the queue existed.
+        if (run_directory(entry) / "run.json").exists():
+            status = read_json(run_directory(entry) / "run.json").get("terminalStatus")
+            if status not in TERMINAL_STATUSES:
+                raise RuntimeError(f"NON_TERMINAL_EXISTING_RUN:{entry['runId']}")
+            queue.mark_terminal(entry["runId"], status)
+
+    failed = threading.Event()
+
+    def work(index: int) -> None:
+        while not failed.is_set() and (lease := queue.lease(f"{os.getpid()}:{index}")) is not None:
+            entry = by_run[lease.key]
+            try:
+                assert_protected_clean()
+                with queue.heartbeat(lease):
+                    record = execute_run(entry, frozen, reclaim=True)
+            except BaseException:
+                # The other workers finish their current run and lease nothing more,
+                # so a failing run is not retried by each of them in turn.
+                failed.set()
+                with contextlib.suppress(RuntimeError):
+                    # Already lost if the lease expired and was reclaimed meanwhile.
+                    queue.release(lease)
+                raise
+            queue.complete(lease, record["terminalStatus"])
+            print(
+                f"{entry['runOrdinal']:03d}/090 {entry['caseId']} {entry['baselineId']} {record['terminalStatus']} {record['latencyMs']}ms",
+                flush=True,
+            )
+
+    size = GENERATION_WORKERS if workers is None else workers
+    if size < 1:
+        raise RuntimeError("GENERATION_WORKERS_INVALID")
+    if size == 1:
+        work(0)
+    else:
+        with ThreadPoolExecutor(max_workers=size, thread_name_prefix="sem003d-generate") as executor:
+            for future in [executor.submit(work, index) for index in range(size)]:
+                future.result()
+    counts = queue.counts()
+    if counts["PENDING"] or counts["LEASED"]:
+        print(f"GENERATION_IN_PROGRESS pending={counts['PENDING']} leased={counts['LEASED']}", flush=True)
+        return
     assert_protected_clean()
+    records = [read_json(run_directory(entry) / "run.json") for entry in entries]
     manifest = generation_manifest(records)
     write_json(GENERATION_MANIFEST_PATH, manifest)
     print(
@@ -791,19 +888,29 @@ def bound_candidate(
 
 
 def evaluate_with_node(evaluation_input: dict[str, Any]) -> dict[str, Any]:
-    completed = subprocess.run(
+    completed = shared_pool(
         ["node", str(CAMPAIGN_ROOT / "evaluate-run.mjs")],
         cwd=REPOSITORY_ROOT,
-        input=json.dumps(evaluation_input, ensure_ascii=False),
-        text=True,
-        capture_output=True,
-        check=False,
-    )
-    if completed.returncode != 0:
+        size=EVALUATION_WORKERS,
+    ).call(evaluation_input)
+    if completed.exit_code != 0:
         raise RuntimeError(sanitize(completed.stderr or completed.stdout))
     return json.loads(completed.stdout)
 
 
+def evaluate_batch(evaluation_inputs: list[dict[str, Any]]) -> list[tuple[dict[str, Any] | None, dict[str, str] | None]]:
+    """Evaluate on warm Node workers; results come back in input order."""
+
+    def evaluate_one(evaluation_input: dict[str, Any]) -> tuple[dict[str, Any] | None, dict[str, str] | None]:
+        try:
+            return evaluate_with_node(evaluation_input), None
+        except Exception as caught:
+            return None, {"class": caught.__class__.__name__, "message": sanitize(str(caught))}
+
+    with ThreadPoolExecutor(max_workers=EVALUATION_WORKERS, thread_name_prefix="sem003d-evaluate") as executor:
+        return list(executor.map(evaluate_one, evaluation_inputs))
+
+
 def property_aliases() -> tuple[dict[str, str], dict[str, str]]:
     registry = read_json(EVALUATOR_ROOT / "registry" / "property-registry.json")
     by_id = {entry["id"]: entry["alias"] for entry in registry["properties"]}
@@ -837,7 +944,7 @@ def evaluate() -> None:
     envelopes = {path.stem.removesuffix(".envelope"): read_json(path) for path in SEALED_ENVELOPE_ROOT.glob("*.envelope.json")}
     if len(cases) != 15 or len(envelopes) != 15:
         raise RuntimeError("SEALED_REFERENCE_COUNT_MISMATCH")
-    evaluation_rows: list[dict[str, Any]] = []
+    prepared: list[tuple[dict[str, Any], dict[str, Any], dict[str, Any], Path]] = []
     for entry in schedule():
         record = read_json(run_directory(entry) / "run.json")
         slug = Path(entry["caseFile"]).name.removesuffix(".input.json")
@@ -857,13 +964,17 @@ def evaluate() -> None:
         directory = EVALUATION_ROOT / f"{entry['runOrdinal']:03d}-{entry['caseId'].lower()}-{entry['slug']}"
         write_json(directory / "candidate.json", candidate)
         write_json(directory / "evaluation-input.json", evaluation_input)
-        try:
-            result = evaluate_with_node(evaluation_input)
+        prepared.append((entry, record, evaluation_input, directory))
+    try:
+        outcomes = evaluate_batch([evaluation_input for _, _, evaluation_input, _ in prepared])
+    finally:
+        close_shared_pools()
+    evaluation_rows: list[dict[str, Any]] = []
+    for (entry, record, evaluation_input, directory), (result, error) in zip(prepared, outcomes):
+        benchmark_case = evaluation_input["benchmarkCase"]
+        if error is None:
             write_json(directory / "evaluator-result.json", result)
-            error = None
-        except BaseException as caught:
-            result = None
-            error = {"class": caught.__class__.__name__, "message": sanitize(str(caught))}
+        else:
             write_json(directory / "evaluation-error.json", error)
         applicable_ids = set(benchmark_case["reference"]["applicableSEM002Properties"])
         applicable_aliases = {by_id[value] for value in applicable_ids if value in by_id}
@@ -1036,7 +1147,13 @@ def validate() -> None:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("command", choices=["preflight", "write-precommit", "generate", "evaluate", "validate"])
+    parser.add_argument("--sem-pool-size", type=int, default=SEM_RUNNER_POOL_SIZE)
+    parser.add_argument("--evaluation-workers", type=int, default=EVALUATION_WORKERS)
+    parser.add_argument("--generation-workers", type=int, default=GENERATION_WORKERS)
     arguments = parser.parse_args()
+    configure_sem_pool(arguments.sem_pool_size)
+    configure_evaluation_workers(arguments.evaluation_workers)
+    configure_generation_workers(arguments.generation_workers)
     if arguments.command == "preflight":
         value = preflight(write=False)
         print(f"PREFLIGHT PASS schedule={value['runCount']} evaluator={value['evaluator']['version']}")
@@ -1044,7 +1161,10 @@ def main() -> int:
         value = preflight(write=True)
         print(f"PRECOMMIT WRITTEN scheduleDigest={value['scheduleDigest']}")
     elif arguments.command == "generate":
-        generate()
+        try:
+            generate()
+        finally:
+            close_shared_pools()
     elif arguments.command == "evaluate":
         evaluate()
     elif arguments.command == "validate":
@@ -11,12 +11,14 @@ import statistics
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable
 
 import dspy
 from google import genai
 from google.genai import types
+from pydantic import BaseModel, TypeAdapter
 from pydantic_ai import Agent
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
@@ -53,6 +55,8 @@ from common_contract_ablation_02.models import (  # noqa: E402
     CriticResult,
     SimulatorBatch,
 )
+from providers.canonical import canonical_digest, pretty_json  # noqa: E402
+from providers.node_worker import NodeWorkerPool, close_shared_pools, shared_pool  # noqa: E402
 
 
 COMMON_PROMPT_PATH = PACKAGE_ROOT / "common-state-system.txt"
@@ -63,10 +67,12 @@ COMMON_SCHEMA_PATH = PACKAGE_ROOT / "common-scientific-state.schema.json"
 CRITIC_SCHEMA_PATH = PACKAGE_ROOT / "conditional-critic-result.schema.json"
 SIMULATOR_SCHEMA_PATH = PACKAGE_ROOT / "researcher-simulator.schema.json"
 BUDGET_PLAN_PATH = RESULT_ROOT / "provider-budget-plan.json"
+SEM_RUNNER_POOL_SIZE = 1
+CONFIGURATION_WORKERS = 2
 
 
 def stable_json(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+    return pretty_json(value)
 
 
 def write_json(path: Path, value: Any) -> None:
@@ -85,8 +91,7 @@ def sha256(path: Path) -> str:
 
 
 def logical_digest(value: Any) -> str:
-    material = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
-    return hashlib.sha256(material).hexdigest()
+    return canonical_digest(value)
 
 
 def load_local_environment() -> None:
@@ -153,11 +158,20 @@ def native_checkpoint(phase: str, scenario_id: str, round_id: str, configuration
     return NATIVE_ROOT / f"{checkpoint_stem(phase, scenario_id, round_id, configuration_id)}.json"
 
 
+class StateCheckpoint(BaseModel):
+    """State checkpoint envelope; only the state is read back."""
+
+    state: CommonScientificState
+
+
+STATE_CHECKPOINT = TypeAdapter(StateCheckpoint)
+
+
 def load_state(phase: str, scenario_id: str, round_id: str, configuration_id: str) -> CommonScientificState | None:
     path = state_checkpoint(phase, scenario_id, round_id, configuration_id)
     if not path.exists():
         return None
-    return CommonScientificState.model_validate(read_json(path)["state"])
+    return STATE_CHECKPOINT.validate_json(path.read_bytes()).state
 
 
 def save_state(
@@ -261,6 +275,10 @@ def freeze() -> dict[str, Any]:
         PACKAGE_ROOT / "campaign.py",
         PACKAGE_ROOT / "reporting.py",
         PACKAGE_ROOT / "sem_pair_runner.ts",
+        COMPARISON_ROOT / "providers" / "jsonl_writer.py",
+        COMPARISON_ROOT / "providers" / "canonical.py",
+        COMPARISON_ROOT / "providers" / "node_worker.py",
+        COMPARISON_ROOT / "providers" / "node_worker.mjs",
         COMMON_PROMPT_PATH,
         CRITIC_PROMPT_PATH,
         SIMULATOR_PROMPT_PATH,
@@ -489,6 +507,24 @@ def sem_pair_possible(
     )
 
 
+def configure_sem_pool(size: int) -> None:
+    global SEM_RUNNER_POOL_SIZE
+    if size < 1:
+        raise RuntimeError("SEM_RUNNER_POOL_SIZE_INVALID")
+    SEM_RUNNER_POOL_SIZE = size
+
+
+def sem_runner_pool() -> NodeWorkerPool:
+    environment = os.environ.copy()
+    environment["GEMINI_API_KEY"] = api_key()
+    return shared_pool(
+        [str(REPOSITORY_ROOT / "node_modules" / ".bin" / "vite-node"), str(PACKAGE_ROOT / "sem_pair_runner.ts")],
+        cwd=REPOSITORY_ROOT,
+        size=SEM_RUNNER_POOL_SIZE,
+        env=environment,
+    )
+
+
 def run_sem_process(
     *,
     mode: str,
@@ -513,19 +549,8 @@ def run_sem_process(
         payload["full"] = {"previousModel": previous_full}
     if mode in {"PAIR", "SINGLE"}:
         payload["single"] = {"previousModel": previous_single}
-    executable = REPOSITORY_ROOT / "node_modules" / ".bin" / "vite-node"
-    environment = os.environ.copy()
-    environment["GEMINI_API_KEY"] = api_key()
-    completed = subprocess.run(
-        [str(executable), str(PACKAGE_ROOT / "sem_pair_runner.ts")],
-        cwd=REPOSITORY_ROOT,
-        input=json.dumps(payload, ensure_ascii=False),
-        text=True,
-        capture_output=True,
-        check=False,
-        env=environment,
-    )
-    if completed.returncode != 0:
+    completed = sem_runner_pool().call(payload)
+    if completed.exit_code != 0:
         raise RuntimeError((completed.stderr or completed.stdout or "SEM_PAIR_RUNNER_FAILED")[-5000:])
     lines = [line for line in completed.stdout.splitlines() if line.strip()]
     if not lines:
@@ -1004,38 +1029,78 @@ def run_configuration_state(
     scenario_id: str,
     round_id: str,
     branches: dict[str, dict[str, Any]],
+    workers: int = CONFIGURATION_WORKERS,
 ) -> None:
+    """Produce one interactive round for the five configurations.
+
+    The configurations run as three units (SEM pair, Pydantic pair, DSPy), each on its
+    own branch turns. The SEM pair runner reserves provider calls by reading the
+    ledger file outside ``ProviderLedger``'s admission slot, so it runs first and
+    alone; the Pydantic and DSPy units then run concurrently and their reservations
+    stay serialized by the slot. A failing unit does not stop the others: every unit
+    settles and checkpoints what it produced before the first failure, in unit
+    order, is raised so a resume reruns only the missing configurations.
+    """
+
+    if workers < 1:
+        raise RuntimeError("CONFIGURATION_WORKERS_INVALID")
     full_branch = branches["SEM_FULL"]
     single_branch = branches["SEM_SINGLE_PASS"]
-    full_model, single_model = run_sem_configurations(
-        phase="INTERACTIVE",
-        scenario_id=scenario_id,
-        round_id=round_id,
-        turns_full=[ConversationTurn.model_validate(turn) for turn in full_branch["turns"]],
-        turns_single=[ConversationTurn.model_validate(turn) for turn in single_branch["turns"]],
-        previous_full=full_branch.get("previousModel"),
-        previous_single=single_branch.get("previousModel"),
-    )
-    full_branch["previousModel"] = full_model
-    single_branch["previousModel"] = single_model
-    run_pydantic_configurations(
-        ledger=ledger,
-        phase="INTERACTIVE",
-        scenario_id=scenario_id,
-        round_id=round_id,
-        turns_common=[ConversationTurn.model_validate(turn) for turn in branches["PYDANTIC_COMMON_CONTRACT"]["turns"]],
-        turns_critic=[ConversationTurn.model_validate(turn) for turn in branches["PYDANTIC_CONDITIONAL_CRITIC"]["turns"]],
-    )
-    run_dspy_configuration(
-        ledger=ledger,
-        phase="INTERACTIVE",
-        scenario_id=scenario_id,
-        round_id=round_id,
-        turns=[ConversationTurn.model_validate(turn) for turn in branches["DSPY_COMMON_CONTRACT"]["turns"]],
-    )
+
+    def sem_unit() -> None:
+        full_model, single_model = run_sem_configurations(
+            phase="INTERACTIVE",
+            scenario_id=scenario_id,
+            round_id=round_id,
+            turns_full=[ConversationTurn.model_validate(turn) for turn in full_branch["turns"]],
+            turns_single=[ConversationTurn.model_validate(turn) for turn in single_branch["turns"]],
+            previous_full=full_branch.get("previousModel"),
+            previous_single=single_branch.get("previousModel"),
+        )
+        full_branch["previousModel"] = full_model
+        single_branch["previousModel"] = single_model
+
+    def pydantic_unit() -> None:
+        run_pydantic_configurations(
+            ledger=ledger,
+            phase="INTERACTIVE",
+            scenario_id=scenario_id,
+            round_id=round_id,
+            turns_common=[ConversationTurn.model_validate(turn) for turn in branches["PYDANTIC_COMMON_CONTRACT"]["turns"]],
+            turns_critic=[ConversationTurn.model_validate(turn) for turn in branches["PYDANTIC_CONDITIONAL_CRITIC"]["turns"]],
+        )
+
+    def dspy_unit() -> None:
+        run_dspy_configuration(
+            ledger=ledger,
+            phase="INTERACTIVE",
+            scenario_id=scenario_id,
+            round_id=round_id,
+            turns=[ConversationTurn.model_validate(turn) for turn in branches["DSPY_COMMON_CONTRACT"]["turns"]],
+        )
+
+    def settle(unit: Callable[[], None]) -> BaseException | None:
+        try:
+            unit()
+        except Exception as caught:
+            return caught
+        return None
+
+    failures = [settle(sem_unit)]
+    shared = [pydantic_unit, dspy_unit]
+    if workers == 1:
+        failures.extend(settle(unit) for unit in shared)
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(shared)), thread_name_prefix=f"configurations-{scenario_id}") as executor:
+            failures.extend(executor.map(settle, shared))
+    raised = [caught for caught in failures if caught is not None]
+    if raised:
+        for other in raised[1:]:
+            raised[0].add_note(f"ALSO_FAILED:{other.__class__.__name__}: {other}"[:2000])
+        raise raised[0]
 
 
-def run_phase_b() -> None:
+def run_phase_b(*, workers: int = CONFIGURATION_WORKERS) -> None:
     verify_freeze()
     ledger = ProviderLedger(LEDGER_PATH)
     scenario_map = {item["scenarioId"]: item for item in scenarios()}
@@ -1064,6 +1129,7 @@ def run_phase_b() -> None:
                 scenario_id=scenario_id,
                 round_id=round_id,
                 branches=branches,
+                workers=workers,
             )
             questions: dict[str, str] = {}
             for configuration_id, branch in branches.items():
@@ -1162,15 +1228,22 @@ def summary() -> dict[str, Any]:
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("action", choices=["freeze", "verify-freeze", "phase-a", "phase-b", "summary"])
+    parser.add_argument("--sem-pool-size", type=int, default=SEM_RUNNER_POOL_SIZE)
+    parser.add_argument("--configuration-workers", type=int, default=CONFIGURATION_WORKERS)
     args = parser.parse_args()
+    configure_sem_pool(args.sem_pool_size)
     if args.action == "freeze":
         print(stable_json(freeze()))
     elif args.action == "verify-freeze":
         print(stable_json(verify_freeze()))
-    elif args.action == "phase-a":
-        run_phase_a()
-    elif args.action == "phase-b":
-        run_phase_b()
+    elif args.action in {"phase-a", "phase-b"}:
+        try:
+            if args.action == "phase-a":
+                run_phase_a()
+            else:
+                run_phase_b(workers=args.configuration_workers)
+        finally:
+            close_shared_pools()
     else:
         print(stable_json(summary()))
     return 0
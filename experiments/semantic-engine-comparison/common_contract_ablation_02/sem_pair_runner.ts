@@ -15,6 +15,7 @@ import {
   type SemanticReconstructionCandidate,
   type SemanticReconstructionRequest,
 } from "../../../src/features/scientific-semantic-reconstruction/types.js";
+import { isServing, serveLines } from "../providers/node_worker.mjs";
 
 type ConversationTurn = { turnId: string; role: "USER" | "ASSISTANT"; content: string };
 type BranchInput = { previousModel: ScientificSemanticModel | null };
@@ -260,8 +261,7 @@ const safe = async (fn: () => Promise<unknown> | unknown) => {
   }
 };
 
-const main = async () => {
-  const input = JSON.parse(readFileSync(0, "utf8")) as Input;
+const run = async (input: Input) => {
   const output: Record<string, unknown> = {
     mode: input.mode,
     pairedFirstReconstruction: input.mode === "PAIR",
@@ -315,7 +315,15 @@ const main = async () => {
   process.stdout.write(`${JSON.stringify(output)}\n`);
 };
 
-void main().catch((caught) => {
-  process.stderr.write(`${caught instanceof Error ? caught.stack ?? caught.message : String(caught)}\n`);
-  process.exitCode = 1;
-});
+const main = async () => {
+  await run(JSON.parse(readFileSync(0, "utf8")) as Input);
+};
+
+if (isServing()) {
+  serveLines(run);
+} else {
+  void main().catch((caught) => {
+    process.stderr.write(`${caught instanceof Error ? caught.stack ?? caught.message : String(caught)}\n`);
+    process.exitCode = 1;
+  });
+}
@@ -2,10 +2,19 @@ from __future__ import annotations
 
 import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from common_contract_ablation_02.campaign import critic_trigger, provider_budget_plan, scenarios, select_question
+from common_contract_ablation_02 import campaign
+from common_contract_ablation_02.campaign import (
+    critic_trigger,
+    provider_budget_plan,
+    run_configuration_state,
+    scenarios,
+    select_question,
+)
 from common_contract_ablation_02.ledger import ProviderLedger
 from common_contract_ablation_02.models import CommonScientificState
 
@@ -141,6 +150,68 @@ class CampaignContractTests(unittest.TestCase):
                     operation_key="synthetic:success",
                 )
 
+    def test_ledger_records_each_reservation_once(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            ledger = ProviderLedger(Path(directory) / "ledger.jsonl")
+            with patch.object(ledger.limiter, "record", wraps=ledger.limiter.record) as record:
+                for index in range(3):
+                    ledger.call(
+                        configuration_id="TEST",
+                        phase="TEST",
+                        scenario_id="SYNTHETIC",
+                        round_id="T0",
+                        operation="SYNTHETIC",
+                        operation_key=f"synthetic:{index}",
+                        function=lambda: None,
+                    )
+                ledger._observe_reservations()
+            tokens = [call.kwargs["token"] for call in record.call_args_list]
+            self.assertEqual([f"{ledger.path}:{number}" for number in (1, 2, 3)], tokens)
+
+    def test_configuration_units_run_concurrently_and_settle_before_failing(self) -> None:
+        branches = {
+            configuration_id: {"turns": [{"turnId": "T0", "role": "USER", "content": "Demande exacte."}]}
+            for configuration_id in campaign.CONFIGURATION_IDS
+        }
+        barrier = threading.Barrier(2, timeout=5)
+        order: list[str] = []
+
+        def sem(**_: object) -> None:
+            order.append("SEM")
+            raise RuntimeError("SEM_PAIR_RUNNER_FAILED")
+
+        def pydantic(**_: object) -> None:
+            barrier.wait()
+            order.append("PYDANTIC")
+
+        def dspy(**_: object) -> None:
+            barrier.wait()
+            order.append("DSPY")
+            raise RuntimeError("DSPY_FAILED")
+
+        with (
+            patch.object(campaign, "run_sem_configurations", side_effect=sem),
+            patch.object(campaign, "run_pydantic_configurations", side_effect=pydantic),
+            patch.object(campaign, "run_dspy_configuration", side_effect=dspy),
+            self.assertRaisesRegex(RuntimeError, "SEM_PAIR_RUNNER_FAILED") as raised,
+        ):
+            run_configuration_state(ledger=None, scenario_id="I01", round_id="T0", branches=branches, workers=2)
+        self.assertEqual("SEM", order[0])
+        self.assertEqual({"PYDANTIC", "DSPY"}, set(order[1:]))
+        self.assertIn("ALSO_FAILED:RuntimeError: DSPY_FAILED", raised.exception.__notes__)
+
+    def test_state_checkpoint_round_trips_through_typed_loader(self) -> None:
+        value = state()
+        with tempfile.TemporaryDirectory() as temporary:
+            root = Path(temporary)
+            with patch.object(campaign, "STATE_ROOT", root / "states"), patch.object(campaign, "NATIVE_ROOT", root / "native"):
+                self.assertIsNone(campaign.load_state("B", "I01", "T0", "SEM_FULL"))
+                campaign.save_state(
+                    phase="B", scenario_id="I01", round_id="T0", configuration_id="SEM_FULL",
+                    state=value, native={"raw": True}, metadata={},
+                )
+                self.assertEqual(value, campaign.load_state("B", "I01", "T0", "SEM_FULL"))
+
     def test_no_blind_binding_in_experimental_inputs(self) -> None:
         package_root = Path(__file__).resolve().parent
         result_root = package_root.parent / "results" / "common-contract-ablation-02"
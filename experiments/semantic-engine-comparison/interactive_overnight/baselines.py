@@ -3,7 +3,6 @@ from __future__ import annotations
 import json
 import os
 import re
-import subprocess
 from pathlib import Path
 from typing import Any
 
@@ -18,12 +17,15 @@ from pydantic_ai import Agent
 from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.providers.google import GoogleProvider
 
+from providers.node_worker import NodeWorkerPool, shared_pool
+
 from .ledger import ProviderLedger
 from .models import BASELINE_IDS, GENERIC_SYSTEM_PROMPT, InteractiveCase, InteractiveProjection, render_case
 
 
 ROOT = Path(__file__).resolve().parents[3]
 MODEL = "gemini-3.5-flash-lite"
+SEM_RUNNER_POOL_SIZE = 1
 
 
 def api_key() -> str:
@@ -172,8 +174,23 @@ def run_outlines(case: InteractiveCase) -> tuple[InteractiveProjection, Any]:
     return output, _dump(native)
 
 
+def configure_sem_pool(size: int) -> None:
+    global SEM_RUNNER_POOL_SIZE
+    if size < 1:
+        raise RuntimeError("SEM_RUNNER_POOL_SIZE_INVALID")
+    SEM_RUNNER_POOL_SIZE = size
+
+
+def sem_runner_pool() -> NodeWorkerPool:
+    return shared_pool(
+        [str(ROOT / "node_modules" / ".bin" / "vite-node"), "experiments/semantic-engine-comparison/interactive_overnight/sem_runner.ts"],
+        cwd=ROOT,
+        size=SEM_RUNNER_POOL_SIZE,
+        env=os.environ.copy(),
+    )
+
+
 def run_sem(case: InteractiveCase, *, ledger_path: Path, scenario: str, round_id: str, operation_key: str) -> tuple[InteractiveProjection, Any]:
-    executable = ROOT / "node_modules" / ".bin" / "vite-node"
     payload = {
         "caseId": case.case_id,
         "language": case.language,
@@ -186,16 +203,8 @@ def run_sem(case: InteractiveCase, *, ledger_path: Path, scenario: str, round_id
         "roundId": round_id,
         "operationKey": operation_key,
     }
-    completed = subprocess.run(
-        [str(executable), "experiments/semantic-engine-comparison/interactive_overnight/sem_runner.ts"],
-        cwd=ROOT,
-        input=json.dumps(payload, ensure_ascii=False),
-        text=True,
-        capture_output=True,
-        check=False,
-        env=os.environ.copy(),
-    )
-    if completed.returncode != 0:
+    completed = sem_runner_pool().call(payload)
+    if completed.exit_code != 0:
         raise RuntimeError((completed.stderr or completed.stdout or "SEM runner failed")[-3000:])
     lines = [line for line in completed.stdout.splitlines() if line.strip()]
     if not lines:
@@ -8,12 +8,13 @@ import os
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from google import genai
 from google.genai import types
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 PACKAGE_ROOT = Path(__file__).resolve().parent
@@ -27,13 +28,18 @@ LEDGER_PATH = RESULT_ROOT / "provider-ledger.jsonl"
 
 sys.path.insert(0, str(COMPARISON_ROOT))
 
-from interactive_overnight.baselines import MODEL, api_key, run_external, run_sem  # noqa: E402
+from interactive_overnight.baselines import MODEL, api_key, configure_sem_pool, run_external, run_sem  # noqa: E402
 from interactive_overnight.ledger import ProviderLedger, utc_now  # noqa: E402
 from interactive_overnight.models import BASELINE_IDS, ConversationTurn, InteractiveCase, InteractiveProjection  # noqa: E402
+from providers.canonical import pretty_json  # noqa: E402
+from providers.node_worker import close_shared_pools  # noqa: E402
 
 
 BASELINE_ORDER = ["sem-current", "dspy", "instructor", "pydanticai", "outlines", "langextract"]
 CAMPAIGN_ID = "EXP-SEM-INTERACTIVE-01"
+BRANCH_WORKERS = len(BASELINE_ORDER)
+# Baselines that reserve provider calls outside ProviderLedger's admission slot.
+EXCLUSIVE_BASELINES = {"sem-current"}
 
 SMOKE_CASES = [
     {
@@ -114,6 +120,15 @@ class SimulatorBatch(BaseModel):
     answers: list[SimulatorAnswer]
 
 
+class NormalizedOutput(BaseModel):
+    """Normalized checkpoint envelope; only the projection is read back."""
+
+    projection: InteractiveProjection
+
+
+NORMALIZED_OUTPUT = TypeAdapter(NormalizedOutput)
+
+
 def map_simulator_answers(recorded: dict[str, Any], questions: dict[str, str]) -> dict[str, str]:
     """Map a provider batch without inventing an answer or replaying a successful call."""
     output: dict[str, str] = {}
@@ -133,7 +148,7 @@ def map_simulator_answers(recorded: dict[str, Any], questions: dict[str, str]) -
 
 
 def stable_json(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+    return pretty_json(value)
 
 
 def write_json(path: Path, value: Any) -> None:
@@ -147,6 +162,12 @@ def read_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def load_normalized(path: Path) -> InteractiveProjection:
+    """Validate a normalized checkpoint straight from its bytes."""
+
+    return NORMALIZED_OUTPUT.validate_json(path.read_bytes()).projection
+
+
 def digest(path: Path) -> str:
     return hashlib.sha256(path.read_bytes()).hexdigest()
 
@@ -303,7 +324,60 @@ def scenario_cost_estimate(readiness: dict[str, Any]) -> int:
     return 3 * per_state + 2
 
 
-def run_scenario(ledger: ProviderLedger, readiness: dict[str, Any], scenario: dict[str, Any]) -> dict[str, Any]:
+def run_branch_round(
+    ledger: ProviderLedger, *, scenario_id: str, slug: str, branch: dict[str, Any], round_id: str,
+) -> tuple[InteractiveProjection, bool] | None:
+    """Produce one branch state for one round; only this branch's dict is touched."""
+
+    output_path = NORMALIZED_ROOT / f"interactive-{scenario_id}-{slug}-{round_id}.json".lower()
+    if output_path.exists():
+        projection = load_normalized(output_path)
+        read_json(NATIVE_ROOT / f"interactive-{scenario_id}-{slug}-{round_id}.json".lower())
+        return projection, True
+    case = InteractiveCase(case_id=f"{scenario_id}-{slug}-{round_id}", conversation_turns=branch["turns"])
+    try:
+        projection, native = run_candidate(
+            slug, case, ledger=ledger, scenario=scenario_id, round_id=round_id,
+            operation_key=f"CANDIDATE:{scenario_id}:{slug}:{round_id}",
+        )
+        save_output(phase="interactive", scenario=scenario_id, baseline=slug, round_id=round_id, projection=projection, native=native)
+    except Exception as caught:
+        branch["status"] = "TECHNICAL_FAILURE"
+        branch["failure"] = {"class": error_kind(caught), "error": f"{caught.__class__.__name__}: {caught}"[-2000:]}
+        return None
+    return projection, False
+
+
+def fan_out_round(
+    ledger: ProviderLedger, *, scenario_id: str, branches: dict[str, dict[str, Any]], round_id: str, workers: int = BRANCH_WORKERS,
+) -> dict[str, tuple[InteractiveProjection, bool] | None]:
+    """Run every active branch of one round, concurrently where the ledger allows it.
+
+    Branches are independent until the batched simulator call. Provider branches
+    reserve through ``ledger``, whose admission slot serializes reservations, so they
+    run on a thread pool. The SEM runner reserves from its own process by reading
+    the ledger file, outside that slot, so it never overlaps them. Results keep
+    branch order.
+    """
+
+    if workers < 1:
+        raise RuntimeError("BRANCH_WORKERS_INVALID")
+    pending = [slug for slug, branch in branches.items() if branch["status"] == "ACTIVE"]
+
+    def advance(slug: str) -> tuple[InteractiveProjection, bool] | None:
+        return run_branch_round(ledger, scenario_id=scenario_id, slug=slug, branch=branches[slug], round_id=round_id)
+
+    results = {slug: advance(slug) for slug in pending if slug in EXCLUSIVE_BASELINES}
+    shared = [slug for slug in pending if slug not in EXCLUSIVE_BASELINES]
+    if workers == 1 or len(shared) < 2:
+        results.update({slug: advance(slug) for slug in shared})
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(shared)), thread_name_prefix=f"branches-{scenario_id}") as executor:
+            results.update(zip(shared, executor.map(advance, shared)))
+    return {slug: results[slug] for slug in pending}
+
+
+def run_scenario(ledger: ProviderLedger, readiness: dict[str, Any], scenario: dict[str, Any], *, workers: int = BRANCH_WORKERS) -> dict[str, Any]:
     scenario_id = scenario["scenarioId"]
     active = [slug for slug in BASELINE_ORDER if readiness["baselines"][slug]["status"] == "TECHNICALLY_READY"]
     branches = {
@@ -319,29 +393,12 @@ def run_scenario(ledger: ProviderLedger, readiness: dict[str, Any], scenario: di
     for state_index in range(3):
         round_id = f"T{state_index}"
         questions: dict[str, str] = {}
-        for slug in active:
-            branch = branches[slug]
-            if branch["status"] != "ACTIVE":
+        produced = fan_out_round(ledger, scenario_id=scenario_id, branches=branches, round_id=round_id, workers=workers)
+        for slug, result in produced.items():
+            if result is None:
                 continue
-            output_path = NORMALIZED_ROOT / f"interactive-{scenario_id}-{slug}-{round_id}.json".lower()
-            if output_path.exists():
-                stored = read_json(output_path)
-                projection = InteractiveProjection.model_validate(stored["projection"])
-                native = read_json(NATIVE_ROOT / f"interactive-{scenario_id}-{slug}-{round_id}.json".lower())
-                reused = True
-            else:
-                case = InteractiveCase(case_id=f"{scenario_id}-{slug}-{round_id}", conversation_turns=branch["turns"])
-                try:
-                    projection, native = run_candidate(
-                        slug, case, ledger=ledger, scenario=scenario_id, round_id=round_id,
-                        operation_key=f"CANDIDATE:{scenario_id}:{slug}:{round_id}",
-                    )
-                    save_output(phase="interactive", scenario=scenario_id, baseline=slug, round_id=round_id, projection=projection, native=native)
-                    reused = False
-                except Exception as caught:
-                    branch["status"] = "TECHNICAL_FAILURE"
-                    branch["failure"] = {"class": error_kind(caught), "error": f"{caught.__class__.__name__}: {caught}"[-2000:]}
-                    continue
+            projection, reused = result
+            branch = branches[slug]
             branch["states"].append({"round": round_id, "projection": projection.model_dump(mode="json"), "reused": reused})
             if projection.action == "STOP":
                 branch["status"] = "STOPPED_BY_CANDIDATE"
@@ -378,7 +435,7 @@ def run_scenario(ledger: ProviderLedger, readiness: dict[str, Any], scenario: di
     return serializable
 
 
-def run_interactive(ledger: ProviderLedger, readiness: dict[str, Any]) -> list[dict[str, Any]]:
+def run_interactive(ledger: ProviderLedger, readiness: dict[str, Any], *, workers: int = BRANCH_WORKERS) -> list[dict[str, Any]]:
     completed = []
     for index, scenario in enumerate(SCENARIOS):
         path = TRANSCRIPT_ROOT / f"{scenario['scenarioId'].lower()}.json"
@@ -391,12 +448,19 @@ def run_interactive(ledger: ProviderLedger, readiness: dict[str, Any]) -> list[d
             if index < 4:
                 break
             continue
-        completed.append(run_scenario(ledger, readiness, scenario))
+        completed.append(run_scenario(ledger, readiness, scenario, workers=workers))
     return completed
 
 
 def manifest(ledger: ProviderLedger, readiness: dict[str, Any], transcripts: list[dict[str, Any]]) -> dict[str, Any]:
-    files = sorted([*PACKAGE_ROOT.glob("*.py"), PACKAGE_ROOT / "sem_runner.ts"])
+    files = sorted([
+        *PACKAGE_ROOT.glob("*.py"),
+        PACKAGE_ROOT / "sem_runner.ts",
+        COMPARISON_ROOT / "providers" / "jsonl_writer.py",
+        COMPARISON_ROOT / "providers" / "canonical.py",
+        COMPARISON_ROOT / "providers" / "node_worker.py",
+        COMPARISON_ROOT / "providers" / "node_worker.mjs",
+    ])
     value = {
         "campaignId": CAMPAIGN_ID,
         "status": "GENERATION_COMPLETE_AWAITING_POST_HOC_ADJUDICATION",
@@ -428,7 +492,10 @@ def manifest(ledger: ProviderLedger, readiness: dict[str, Any], transcripts: lis
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--phase", choices=["smoke", "interactive", "all"], default="all")
+    parser.add_argument("--sem-pool-size", type=int, default=1)
+    parser.add_argument("--branch-workers", type=int, default=BRANCH_WORKERS)
     args = parser.parse_args()
+    configure_sem_pool(args.sem_pool_size)
     RESULT_ROOT.mkdir(parents=True, exist_ok=True)
     for path in [TRANSCRIPT_ROOT, NATIVE_ROOT, NORMALIZED_ROOT]:
         path.mkdir(parents=True, exist_ok=True)
@@ -440,13 +507,16 @@ def main() -> int:
     })
     ledger = ProviderLedger(LEDGER_PATH)
     readiness = read_json(RESULT_ROOT / "technical-readiness.json") if (RESULT_ROOT / "technical-readiness.json").exists() else None
-    if args.phase in {"smoke", "all"}:
-        readiness = smoke(ledger)
-    if readiness is None:
-        raise RuntimeError("TECHNICAL_READINESS_MISSING")
     transcripts: list[dict[str, Any]] = []
-    if args.phase in {"interactive", "all"}:
-        transcripts = run_interactive(ledger, readiness)
+    try:
+        if args.phase in {"smoke", "all"}:
+            readiness = smoke(ledger)
+        if readiness is None:
+            raise RuntimeError("TECHNICAL_READINESS_MISSING")
+        if args.phase in {"interactive", "all"}:
+            transcripts = run_interactive(ledger, readiness, workers=args.branch_workers)
+    finally:
+        close_shared_pools()
     manifest(ledger, readiness, transcripts)
     print(stable_json({
         "campaignId": CAMPAIGN_ID,
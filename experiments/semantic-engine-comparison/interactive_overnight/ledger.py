@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import datetime as dt
 import json
-import time
+import threading
 from pathlib import Path
 from typing import Any, Callable
 
+from providers.jsonl_writer import JsonlWriter
+from providers.rate_limit import RollingWindowLimiter
+
 
 KNOWN_DAILY_USAGE_BEFORE_MISSION = 357
 MAX_NEW_REQUESTS = 135
@@ -18,9 +21,14 @@ def utc_now() -> str:
 
 
 class ProviderLedger:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, *, limiter: RollingWindowLimiter | None = None, durability: str = "group"):
         self.path = path
+        self.writer = JsonlWriter(path, durability=durability)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.limiter = limiter or RollingWindowLimiter(limit=MAX_STARTS_PER_ROLLING_MINUTE)
+        self._offset = 0
+        self._tail_lock = threading.Lock()
+        self.limiter.add_observer(self._observe_reservations)
 
     def events(self) -> list[dict[str, Any]]:
         if not self.path.exists():
@@ -38,46 +46,59 @@ class ProviderLedger:
         }
 
     def append(self, event: dict[str, Any]) -> None:
-        with self.path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(event, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n")
+        # A reservation is on disk before the provider call it authorizes can start.
+        self.writer.append(event, sync=event.get("event") == "RESERVED")
 
-    def _pace(self) -> None:
-        while True:
-            recent = []
-            now = time.time()
-            for item in self.reservations():
+    def _observe_reservations(self) -> None:
+        # Tail the ledger from the last offset, so every reservation is recorded once.
+        with self._tail_lock:
+            size = self.path.stat().st_size if self.path.exists() else 0
+            if size < self._offset:
+                self._offset = 0
+            if size == self._offset:
+                return
+            with self.path.open("rb") as handle:
+                handle.seek(self._offset)
+                chunk = handle.read(size - self._offset)
+            # A trailing fragment without newline is an append still in flight.
+            complete = chunk[: chunk.rfind(b"\n") + 1]
+            for line in complete.decode("utf-8").splitlines():
+                event = json.loads(line) if line.strip() else {}
+                if event.get("event") != "RESERVED":
+                    continue
                 try:
-                    stamp = dt.datetime.fromisoformat(str(item["reservedAt"]).replace("Z", "+00:00")).timestamp()
+                    stamp = dt.datetime.fromisoformat(str(event["reservedAt"]).replace("Z", "+00:00")).timestamp()
                 except (KeyError, ValueError):
                     continue
-                if now - stamp < 60:
-                    recent.append(stamp)
-            if len(recent) < MAX_STARTS_PER_ROLLING_MINUTE:
-                return
-            time.sleep(max(0.1, 60.05 - (now - min(recent))))
+                self.limiter.record(stamp, str(event.get("operation")), token=f"{self.path}:{event.get('requestNumber')}")
+            self._offset += len(complete)
+
+    def _pace(self) -> None:
+        with self.limiter.slot():
+            return
 
     def reserve(self, *, baseline: str, scenario: str, round_id: str, operation: str, operation_key: str, retry: int = 0) -> dict[str, Any]:
-        self._pace()
-        existing = self.reservations()
-        if len(existing) >= MAX_NEW_REQUESTS or KNOWN_DAILY_USAGE_BEFORE_MISSION + len(existing) >= HARD_STOP_DAILY_ESTIMATE:
-            raise RuntimeError("PROVIDER_DAILY_BUDGET_HARD_STOP")
-        number = len(existing) + 1
-        event = {
-            "event": "RESERVED",
-            "requestNumber": number,
-            "operationKey": operation_key,
-            "baselineOrSimulator": baseline,
-            "scenario": scenario,
-            "round": round_id,
-            "operation": operation,
-            "reservedAt": utc_now(),
-            "provider": "GOOGLE_GEMINI",
-            "model": "gemini-3.5-flash-lite",
-            "status": "RESERVED",
-            "retry": retry,
-        }
-        self.append(event)
-        return event
+        with self.limiter.slot(operation):
+            existing = self.reservations()
+            if len(existing) >= MAX_NEW_REQUESTS or KNOWN_DAILY_USAGE_BEFORE_MISSION + len(existing) >= HARD_STOP_DAILY_ESTIMATE:
+                raise RuntimeError("PROVIDER_DAILY_BUDGET_HARD_STOP")
+            number = len(existing) + 1
+            event = {
+                "event": "RESERVED",
+                "requestNumber": number,
+                "operationKey": operation_key,
+                "baselineOrSimulator": baseline,
+                "scenario": scenario,
+                "round": round_id,
+                "operation": operation,
+                "reservedAt": utc_now(),
+                "provider": "GOOGLE_GEMINI",
+                "model": "gemini-3.5-flash-lite",
+                "status": "RESERVED",
+                "retry": retry,
+            }
+            self.append(event)
+            return event
 
     def complete(self, reservation: dict[str, Any], *, started_at: str, success: bool, status: str, error: str | None = None) -> None:
         self.append({
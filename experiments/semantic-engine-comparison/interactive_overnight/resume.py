@@ -14,6 +14,7 @@ from .campaign import (
     InteractiveCase,
     InteractiveProjection,
     ConversationTurn,
+    load_normalized,
     read_json,
     run_candidate,
     save_output,
@@ -27,9 +28,9 @@ MISSING_STATUS = "SIMULATOR_OUTPUT_NOT_CHECKPOINTED_OR_BRANCH_MISSING"
 
 
 def load_projection(scenario_id: str, baseline: str, round_id: str) -> tuple[InteractiveProjection, Any]:
-    normalized = read_json(NORMALIZED_ROOT / f"interactive-{scenario_id}-{baseline}-{round_id}.json".lower())
+    projection = load_normalized(NORMALIZED_ROOT / f"interactive-{scenario_id}-{baseline}-{round_id}.json".lower())
     native = read_json(NATIVE_ROOT / f"interactive-{scenario_id}-{baseline}-{round_id}.json".lower())
-    return InteractiveProjection.model_validate(normalized["projection"]), native
+    return projection, native
 
 
 def serialize_transcript(transcript: dict[str, Any]) -> None:
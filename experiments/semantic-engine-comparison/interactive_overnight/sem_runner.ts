@@ -3,6 +3,7 @@ import { appendFileSync, readFileSync } from "node:fs";
 import { GeminiScientificSemanticProvider } from "../../../src/features/scientific-semantic-reconstruction/provider.js";
 import { processScientificSemanticHttp } from "../../../src/features/scientific-semantic-reconstruction/server.js";
 import { SCIENTIFIC_SEMANTIC_SCHEMA_VERSION } from "../../../src/features/scientific-semantic-reconstruction/types.js";
+import { isServing, serveLines } from "../providers/node_worker.mjs";
 
 type Input = {
   caseId: string;
@@ -53,8 +54,7 @@ const reserve = async (input: Input, operation: string) => {
   return value;
 };
 
-const main = async () => {
-  const input = JSON.parse(readFileSync(0, "utf8")) as Input;
+const run = async (input: Input) => {
   let currentOperation = "SEM_PROVIDER_OPERATION";
   const ledgerFetch: typeof fetch = async (url, init) => {
     const reservation = await reserve(input, currentOperation);
@@ -104,7 +104,15 @@ const main = async () => {
   process.stdout.write(`${JSON.stringify(response.body)}\n`);
 };
 
-void main().catch((caught) => {
-  process.stderr.write(`${caught instanceof Error ? caught.stack ?? caught.message : String(caught)}\n`);
-  process.exitCode = 1;
-});
+const main = async () => {
+  await run(JSON.parse(readFileSync(0, "utf8")) as Input);
+};
+
+if (isServing()) {
+  serveLines(run);
+} else {
+  void main().catch((caught) => {
+    process.stderr.write(`${caught instanceof Error ? caught.stack ?? caught.message : String(caught)}\n`);
+    process.exitCode = 1;
+  });
+}
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import threading
 import unittest
+from unittest.mock import patch
 
 from pydantic import ValidationError
 
 from .adjudicate import BASELINES, CAPABILITIES, MATRIX
-from .campaign import map_simulator_answers
+from . import campaign
+from .campaign import fan_out_round, map_simulator_answers
 from .models import ConversationTurn, InteractiveCase, InteractiveProjection
 
 
@@ -49,6 +52,32 @@ class InteractiveContractTests(unittest.TestCase):
         recorded = {"answers": [{"baseline": "Même question ?", "answer": "Réponse"}]}
         self.assertEqual(map_simulator_answers(recorded, questions), {})
 
+    def test_round_fans_out_provider_branches_and_isolates_sem(self) -> None:
+        branches = {slug: {"status": "ACTIVE"} for slug in ["sem-current", "dspy", "instructor", "outlines"]}
+        branches["outlines"]["status"] = "FINISHED"
+        barrier = threading.Barrier(2, timeout=5)
+        running: set[str] = set()
+        lock = threading.Lock()
+        overlapped_sem: list[set[str]] = []
+
+        def fake_round(_ledger, *, scenario_id, slug, branch, round_id):
+            with lock:
+                running.add(slug)
+                if "sem-current" in running and len(running) > 1:
+                    overlapped_sem.append(set(running))
+            if slug != "sem-current":
+                barrier.wait()
+            with lock:
+                running.discard(slug)
+            return None if slug == "dspy" else (InteractiveProjection(state_summary=slug, action="FINISH"), False)
+
+        with patch.object(campaign, "run_branch_round", side_effect=fake_round):
+            results = fan_out_round(None, scenario_id="I01", branches=branches, round_id="T0", workers=4)
+        self.assertEqual(["sem-current", "dspy", "instructor"], list(results))
+        self.assertIsNone(results["dspy"])
+        self.assertEqual("instructor", results["instructor"][0].state_summary)
+        self.assertEqual([], overlapped_sem)
+
 
 if __name__ == "__main__":
     unittest.main()
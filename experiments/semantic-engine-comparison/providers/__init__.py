@@ -0,0 +1 @@
+"""Provider-side infrastructure shared by the experimental campaigns."""
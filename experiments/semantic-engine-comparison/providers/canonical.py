@@ -0,0 +1,126 @@
+"""Canonical JSON text and SHA-256 digests shared by the campaigns, the hybrid runtime and SEM-AUDIT-D.
+
+Every function returns exactly the bytes of ``json.dumps(value, ensure_ascii=False,
+sort_keys=True, ...)`` with the separators or indent named below, so no identifier or
+digest moves, and raises where ``json.dumps`` raises. ``orjson`` encodes when it is
+installed; documents it could render differently (floats ``repr`` writes with an
+exponent, non-finite floats, integers beyond 64 bits, lone surrogates, non-string
+keys, types orjson knows but ``json`` does not) go through the standard library.
+"""
+
+from __future__ import annotations
+
+import enum
+import gc
+import hashlib
+import json
+import uuid
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+# orjson encodes these natively where ``json`` raises TypeError. Datetimes, dataclasses and
+# builtin subclasses have passthrough options; enums and UUIDs are found by the scan.
+_PASSTHROUGH = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson
+    else 0
+)
+_ORJSON_ONLY = (enum.Enum, uuid.UUID)
+_CONTAINERS = {dict, list, tuple}
+_STREAM_ENCODER = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+Default = Callable[[Any], Any] | None
+
+
+def _encodes_alike(value: Any) -> bool:
+    """Whether orjson writes ``value`` exactly as ``json`` does.
+
+    No enum or UUID, and every float in the range ``float.__repr__`` spells without an
+    exponent; orjson spells the others differently ("1e16" or "0.00001"). One C-level
+    pass over the types of each nesting level; only floats are looked at one by one.
+    """
+
+    level = [value]
+    while level:
+        kinds = set(map(type, level))
+        if any(issubclass(kind, _ORJSON_ONLY) for kind in kinds):
+            return False
+        if float in kinds and not all(
+            item == 0 or 1e-4 <= abs(item) < 1e16 for item in level if item.__class__ is float
+        ):
+            return False
+        level = gc.get_referents(*[item for item in level if item.__class__ in _CONTAINERS])
+    return True
+
+
+def _checked(default: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def hook(value: Any) -> Any:
+        converted = default(value)
+        if not _encodes_alike(converted):
+            raise TypeError("NOT_JSON_NATIVE")
+        return converted
+
+    return hook
+
+
+def _accelerated(value: Any, option: int, default: Default = None) -> bytes | None:
+    if orjson is None:
+        return None
+    try:
+        data = orjson.dumps(value, default=default and _checked(default), option=option | _PASSTHROUGH)
+    except TypeError:
+        return None
+    # Only a document orjson accepted is scanned: it is finite and free of cycles.
+    if not _encodes_alike(value):
+        return None
+    return data
+
+
+def canonical_bytes(value: Any, *, default: Default = None) -> bytes:
+    """Compact form: ``separators=(",", ":")``, UTF-8.
+
+    ``default`` is the ``json.dumps`` hook: it turns a value neither encoder knows (a
+    read-only view, say) into one they do, at encoding time and without a prior copy.
+    """
+
+    data = _accelerated(value, orjson.OPT_SORT_KEYS, default) if orjson else None
+    if data is None:
+        data = json.dumps(
+            value, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=default
+        ).encode("utf-8")
+    return data
+
+
+def canonical_json(value: Any) -> str:
+    return canonical_bytes(value).decode("utf-8")
+
+
+def pretty_json(value: Any) -> str:
+    """Checkpoint form: ``indent=2`` plus a trailing newline."""
+
+    data = _accelerated(value, orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2) if orjson else None
+    if data is None:
+        return json.dumps(value, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+    return data.decode("utf-8") + "\n"
+
+
+def canonical_digest(value: Any, *, default: Default = None) -> str:
+    return hashlib.sha256(canonical_bytes(value, default=default)).hexdigest()
+
+
+def update_digest(hasher: Any, value: Any) -> Any:
+    """Feed the compact form of ``value`` to ``hasher`` chunk by chunk, never holding the whole text."""
+
+    for chunk in _STREAM_ENCODER.iterencode(value):
+        hasher.update(chunk.encode("utf-8"))
+    return hasher
+
+
+def stream_digest(value: Any) -> str:
+    return update_digest(hashlib.sha256(), value).hexdigest()
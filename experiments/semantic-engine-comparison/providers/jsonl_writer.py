@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import IO, Any
+
+
+DURABILITY_POLICIES = {"flush", "event", "group"}
+TAIL_BLOCK_BYTES = 4096
+
+
+def _encode(value: Any) -> bytes:
+    return (json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def repair_torn_tail(path: Path) -> bytes | None:
+    """Make the file end on a line boundary; return the torn fragment, if any.
+
+    A last line without its newline that still parses is a complete event whose
+    newline was lost, and only gets the newline. Anything else is an append cut by a
+    crash: it is moved to ``<name>.torn`` (kept as evidence, never replayed) and
+    truncated from the ledger so the next append does not fuse with it.
+    """
+
+    if not path.exists():
+        return None
+    with path.open("r+b") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        if end == 0:
+            return None
+        handle.seek(end - 1)
+        if handle.read(1) == b"\n":
+            return None
+        start = end
+        while start > 0:
+            step = min(TAIL_BLOCK_BYTES, start)
+            start -= step
+            handle.seek(start)
+            cut = handle.read(step).rfind(b"\n")
+            if cut >= 0:
+                start += cut + 1
+                break
+        handle.seek(start)
+        fragment = handle.read()
+        try:
+            json.loads(fragment)
+        except ValueError:
+            with path.with_name(path.name + ".torn").open("ab") as torn:
+                torn.write(fragment + b"\n")
+                torn.flush()
+                os.fsync(torn.fileno())
+            handle.truncate(start)
+            handle.flush()
+            os.fsync(handle.fileno())
+            return fragment
+        handle.seek(0, os.SEEK_END)
+        handle.write(b"\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+        return None
+
+
+def _close(handle: IO[bytes]) -> None:
+    handle.close()
+
+
+class JsonlWriter:
+    """Append-only JSONL writer that keeps its handle open.
+
+    Each event is one unbuffered ``write`` of one complete line, so concurrent
+    readers tailing the file only ever see whole lines or an in-flight fragment.
+    Durability is explicit: ``flush`` hands lines to the OS only, ``event`` fsyncs
+    every append, and ``group`` lets appends arriving within ``group_window``
+    seconds share one fsync; each append still returns only once its line is on
+    disk. ``append(..., sync=True)`` fsyncs that event immediately under any
+    policy. The torn tail of a crashed writer is repaired when the file is opened.
+    """
+
+    def __init__(self, path: Path, *, durability: str = "group", group_window: float = 0.002):
+        if durability not in DURABILITY_POLICIES or group_window < 0:
+            raise RuntimeError("JSONL_DURABILITY_INVALID")
+        self.path = path
+        self.durability = durability
+        self.group_window = group_window
+        self.torn: bytes | None = None
+        self.fsyncs = 0
+        self._handle: IO[bytes] | None = None
+        self._lock = threading.Lock()
+        self._commit = threading.Condition()
+        self._written = 0
+        self._synced = 0
+        self._leader = False
+
+    def _open(self) -> IO[bytes]:
+        if self._handle is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.torn = repair_torn_tail(self.path)
+            self._handle = self.path.open("ab", buffering=0)
+            weakref.finalize(self, _close, self._handle)
+        return self._handle
+
+    def _fsync(self) -> int:
+        """Fsync everything written so far; caller holds ``_lock``."""
+
+        assert self._handle is not None
+        os.fsync(self._handle.fileno())
+        self.fsyncs += 1
+        return self._written
+
+    def append(self, value: Any, *, sync: bool = False) -> None:
+        line = _encode(value)
+        with self._lock:
+            handle = self._open()
+            handle.write(line)
+            self._written += 1
+            ticket = self._written
+            if sync or self.durability == "event":
+                synced = self._fsync()
+                with self._commit:
+                    self._synced = max(self._synced, synced)
+                    self._commit.notify_all()
+                return
+        if self.durability == "group":
+            self._group_commit(ticket)
+
+    def _group_commit(self, ticket: int) -> None:
+        with self._commit:
+            while self._synced < ticket:
+                if self._leader:
+                    self._commit.wait()
+                    continue
+                self._leader = True
+                self._commit.release()
+                try:
+                    # Let concurrent appends join this commit before paying for the fsync.
+                    time.sleep(self.group_window)
+                    with self._lock:
+                        synced = self._fsync()
+                finally:
+                    self._commit.acquire()
+                    self._leader = False
+                    self._commit.notify_all()
+                self._synced = max(self._synced, synced)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._handle is not None:
+                if self._synced < self._written:
+                    self._fsync()
+                self._handle.close()
+                self._handle = None
@@ -0,0 +1,71 @@
+import { createInterface } from "node:readline";
+
+// Line-delimited JSON-RPC 2.0 server shared by the SEM runner scripts.
+// Requests are handled one at a time; while a request runs, writes to
+// process.stdout/process.stderr are captured into its reply so the Python side
+// keeps the single-shot "last stdout line is the result" semantics.
+
+export const SERVE_ENVIRONMENT = "NODE_WORKER_SERVE";
+
+export const isServing = () => process.env[SERVE_ENVIRONMENT] === "1";
+
+const writeFrame = process.stdout.write.bind(process.stdout);
+const emit = (frame) => writeFrame(`${JSON.stringify({ jsonrpc: "2.0", ...frame })}\n`);
+
+const capture = (stream, sink) => {
+  const original = stream.write;
+  stream.write = (chunk, ...rest) => {
+    sink.push(typeof chunk === "string" ? chunk : Buffer.from(chunk).toString("utf8"));
+    const callback = rest.find((item) => typeof item === "function");
+    if (callback) callback();
+    return true;
+  };
+  return () => {
+    stream.write = original;
+  };
+};
+
+const dispatch = async (line, handle) => {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (caught) {
+    emit({ id: null, error: { code: -32700, message: caught instanceof Error ? caught.message : String(caught) } });
+    return;
+  }
+  if (request.method === "ping") {
+    emit({ id: request.id, result: { ready: true, pid: process.pid } });
+    return;
+  }
+  if (request.method !== "run") {
+    emit({ id: request.id, error: { code: -32601, message: `UNKNOWN_METHOD:${request.method}` } });
+    return;
+  }
+  const stdout = [];
+  const stderr = [];
+  const restoreOut = capture(process.stdout, stdout);
+  const restoreErr = capture(process.stderr, stderr);
+  const previousExitCode = process.exitCode;
+  let exitCode = 0;
+  try {
+    await handle(request.params);
+  } catch (caught) {
+    stderr.push(`${caught instanceof Error ? caught.stack ?? caught.message : String(caught)}\n`);
+    exitCode = 1;
+  } finally {
+    restoreOut();
+    restoreErr();
+  }
+  if (process.exitCode && process.exitCode !== previousExitCode) exitCode = Number(process.exitCode);
+  process.exitCode = previousExitCode;
+  emit({ id: request.id, result: { stdout: stdout.join(""), stderr: stderr.join(""), exitCode } });
+};
+
+export const serveLines = (handle) => {
+  const lines = createInterface({ input: process.stdin, crlfDelay: Infinity });
+  let queue = Promise.resolve();
+  lines.on("line", (line) => {
+    if (!line.trim()) return;
+    queue = queue.then(() => dispatch(line, handle));
+  });
+};
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+
+
+SERVE_ENVIRONMENT = "NODE_WORKER_SERVE"
+STDERR_TAIL_LINES = 200
+SHUTDOWN_GRACE_SECONDS = 5.0
+_EOF = object()
+
+
+@dataclass(frozen=True)
+class WorkerReply:
+    """What a single-shot ``subprocess.run`` of the runner would have returned."""
+
+    stdout: str
+    stderr: str
+    exit_code: int
+
+
+class _WorkerLost(Exception):
+    pass
+
+
+def _read_frames(stream: IO[str], frames: queue.Queue[Any]) -> None:
+    for line in stream:
+        try:
+            frame = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        # Anything written outside a request (module load noise) is not a frame.
+        if isinstance(frame, dict) and frame.get("jsonrpc") == "2.0" and "id" in frame:
+            frames.put(frame)
+    frames.put(_EOF)
+
+
+def _drain(stream: IO[str], tail: deque[str]) -> None:
+    for line in stream:
+        tail.append(line)
+
+
+def _terminate(process: subprocess.Popen[str]) -> None:
+    if process.poll() is not None:
+        return
+    try:
+        if process.stdin:
+            process.stdin.close()
+        process.wait(timeout=SHUTDOWN_GRACE_SECONDS)
+    except (OSError, subprocess.TimeoutExpired):
+        process.kill()
+        process.wait()
+
+
+class NodeWorker:
+    """One warm Node runner process serving requests over line-delimited JSON-RPC.
+
+    The process is started lazily and must answer ``ping`` before it receives work,
+    so Node startup and TypeScript transpilation are paid once. A process that
+    crashes or times out is replaced on the next request. The request in flight is
+    reported as a failed run and never replayed: it may already have reached the
+    provider.
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        *,
+        cwd: Path,
+        env: dict[str, str] | None = None,
+        start_timeout: float = 120.0,
+        request_timeout: float | None = None,
+    ):
+        self.command = list(command)
+        self.cwd = cwd
+        self.env = env
+        self.start_timeout = start_timeout
+        self.request_timeout = request_timeout
+        self.starts = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._process: subprocess.Popen[str] | None = None
+        self._frames: queue.Queue[Any] = queue.Queue()
+        self._stderr: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+        self._readers: list[threading.Thread] = []
+        self._finalizer: weakref.finalize | None = None
+
+    def alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _stderr_tail(self) -> str:
+        for reader in self._readers:
+            reader.join(timeout=1.0)
+        return "".join(self._stderr)
+
+    def _start(self) -> None:
+        environment = dict(os.environ if self.env is None else self.env)
+        environment[SERVE_ENVIRONMENT] = "1"
+        process = subprocess.Popen(
+            self.command,
+            cwd=self.cwd,
+            env=environment,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        assert process.stdout is not None and process.stderr is not None
+        self._process = process
+        self._frames = queue.Queue()
+        self._stderr = deque(maxlen=STDERR_TAIL_LINES)
+        self._readers = [
+            threading.Thread(target=_read_frames, args=(process.stdout, self._frames), daemon=True),
+            threading.Thread(target=_drain, args=(process.stderr, self._stderr), daemon=True),
+        ]
+        for reader in self._readers:
+            reader.start()
+        self._finalizer = weakref.finalize(self, _terminate, process)
+        self.starts += 1
+        try:
+            ready = self._exchange("ping", None, self.start_timeout)
+        except _WorkerLost as lost:
+            raise RuntimeError(f"NODE_WORKER_START_FAILED:{lost}"[-4000:]) from None
+        if not ready.get("ready"):
+            self._stop()
+            raise RuntimeError("NODE_WORKER_START_FAILED")
+
+    def _stop(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+        self._process = None
+        self._finalizer = None
+
+    def _lost(self, reason: str) -> _WorkerLost:
+        process = self._process
+        self._stop()
+        code = process.returncode if process is not None else None
+        return _WorkerLost(f"{reason}:{code}\n{self._stderr_tail()}")
+
+    def _exchange(self, method: str, params: Any, timeout: float | None) -> dict[str, Any]:
+        assert self._process is not None and self._process.stdin is not None
+        request_id = next(self._ids)
+        try:
+            self._process.stdin.write(
+                json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}, ensure_ascii=False) + "\n"
+            )
+            self._process.stdin.flush()
+        except OSError:
+            raise self._lost("NODE_WORKER_EXITED") from None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                frame = self._frames.get(timeout=remaining)
+            except queue.Empty:
+                raise self._lost("NODE_WORKER_TIMEOUT") from None
+            if frame is _EOF:
+                raise self._lost("NODE_WORKER_EXITED")
+            if frame.get("id") != request_id:
+                continue
+            if "error" in frame:
+                raise RuntimeError(f"NODE_WORKER_PROTOCOL_ERROR:{frame['error'].get('message')}")
+            return dict(frame.get("result") or {})
+
+    def ping(self, *, timeout: float = 10.0) -> bool:
+        """Health check: start the process if needed and confirm it answers."""
+
+        with self._lock:
+            try:
+                if not self.alive():
+                    self._start()
+                    return True
+                return bool(self._exchange("ping", None, timeout).get("ready"))
+            except _WorkerLost:
+                return False
+
+    def call(self, params: Any, *, timeout: float | None = None) -> WorkerReply:
+        with self._lock:
+            if not self.alive():
+                self._start()
+            self.requests += 1
+            try:
+                result = self._exchange("run", params, timeout if timeout is not None else self.request_timeout)
+            except _WorkerLost as lost:
+                return WorkerReply(stdout="", stderr=str(lost), exit_code=1)
+            return WorkerReply(
+                stdout=str(result.get("stdout") or ""),
+                stderr=str(result.get("stderr") or ""),
+                exit_code=int(result.get("exitCode") or 0),
+            )
+
+    async def call_async(self, params: Any, *, timeout: float | None = None) -> WorkerReply:
+        return await asyncio.to_thread(self.call, params, timeout=timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop()
+
+    def __enter__(self) -> NodeWorker:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+class NodeWorkerPool:
+    """Up to ``size`` warm workers running the same runner command.
+
+    Workers start on first demand and the most recently used idle worker is
+    reused first, so a sequential campaign keeps a single warm process.
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        *,
+        cwd: Path,
+        size: int = 1,
+        env: dict[str, str] | None = None,
+        start_timeout: float = 120.0,
+        request_timeout: float | None = None,
+    ):
+        if size < 1:
+            raise RuntimeError("NODE_WORKER_POOL_SIZE_INVALID")
+        self.size = size
+        self.workers = [
+            NodeWorker(command, cwd=cwd, env=env, start_timeout=start_timeout, request_timeout=request_timeout)
+            for _ in range(size)
+        ]
+        self._idle: queue.LifoQueue[NodeWorker] = queue.LifoQueue()
+        for worker in reversed(self.workers):
+            self._idle.put(worker)
+
+    @property
+    def starts(self) -> int:
+        return sum(worker.starts for worker in self.workers)
+
+    def call(self, params: Any, *, timeout: float | None = None) -> WorkerReply:
+        worker = self._idle.get()
+        try:
+            return worker.call(params, timeout=timeout)
+        finally:
+            self._idle.put(worker)
+
+    async def call_async(self, params: Any, *, timeout: float | None = None) -> WorkerReply:
+        return await asyncio.to_thread(self.call, params, timeout=timeout)
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.close()
+
+    def __enter__(self) -> NodeWorkerPool:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+_SHARED: dict[tuple[tuple[str, ...], str], NodeWorkerPool] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_pool(
+    command: list[str],
+    *,
+    cwd: Path,
+    size: int = 1,
+    env: dict[str, str] | None = None,
+) -> NodeWorkerPool:
+    """One in-process pool per runner command; the first caller fixes its size and environment."""
+
+    with _SHARED_LOCK:
+        key = (tuple(command), str(cwd))
+        if key not in _SHARED:
+            _SHARED[key] = NodeWorkerPool(command, cwd=cwd, size=size, env=env)
+        return _SHARED[key]
+
+
+def close_shared_pools() -> None:
+    with _SHARED_LOCK:
+        pools = list(_SHARED.values())
+        _SHARED.clear()
+    for pool in pools:
+        pool.close()
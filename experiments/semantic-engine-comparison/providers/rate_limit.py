@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import functools
+import itertools
+import threading
+import time
+from collections import deque
+from typing import AsyncIterator, Callable, Iterator
+
+
+GLOBAL_KEY = "*"
+
+
+class RollingWindowLimiter:
+    """Exact rolling-window start limiter shared by threads and asyncio tasks.
+
+    A start is admissible when fewer than ``limit`` starts (and fewer than the
+    per-key quota, when one is configured) fall inside the last ``window`` seconds.
+    Waiters are admitted strictly in arrival order and sleep until the computed
+    admission instant instead of polling: threads wait on one condition, and each
+    asyncio waiter on its own event, set when it reaches the head of the queue or a
+    start is recorded. Observers run before each decision so an external source of
+    truth (an append-only ledger) can record starts made by other processes.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: int,
+        window: float = 60.0,
+        quotas: dict[str, int] | None = None,
+        margin: float = 0.05,
+        clock: Callable[[], float] = time.time,
+    ):
+        if limit < 1 or window <= 0:
+            raise RuntimeError("RATE_LIMIT_CONFIGURATION_INVALID")
+        self.limit = limit
+        self.window = window
+        self.quotas = dict(quotas or {})
+        self.margin = margin
+        self.clock = clock
+        self._observers: list[Callable[[], None]] = []
+        self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
+        self._starts: dict[str, list[float]] = {GLOBAL_KEY: []}
+        self._tokens: set[str] = set()
+        self._queue: deque[int] = deque()
+        self._tickets = itertools.count()
+        self._wakeups: dict[int, Callable[[], None]] = {}
+
+    def add_observer(self, observer: Callable[[], None]) -> None:
+        with self._lock:
+            self._observers.append(observer)
+
+    def record(self, stamp: float, key: str | None = None, *, token: str | None = None) -> None:
+        with self._condition:
+            if token is not None:
+                if token in self._tokens:
+                    return
+                self._tokens.add(token)
+            bisect.insort(self._starts[GLOBAL_KEY], stamp)
+            if key is not None and key in self.quotas:
+                bisect.insort(self._starts.setdefault(key, []), stamp)
+            self._condition.notify_all()
+            self._wake_head()
+
+    def _earliest(self, stamps: list[float], limit: int, now: float) -> float:
+        recent = stamps[bisect.bisect_right(stamps, now - self.window):]
+        if len(recent) < limit:
+            return now
+        # The oldest start that must leave the window before one more is allowed.
+        return recent[len(recent) - limit] + self.window + self.margin
+
+    def next_start(self, key: str | None = None, *, now: float | None = None) -> float:
+        with self._lock:
+            moment = self.clock() if now is None else now
+            value = self._earliest(self._starts[GLOBAL_KEY], self.limit, moment)
+            if key is not None and key in self.quotas:
+                value = max(value, self._earliest(self._starts.get(key, []), self.quotas[key], moment))
+            return value
+
+    def recent_count(self, key: str | None = None, *, now: float | None = None) -> int:
+        with self._lock:
+            moment = self.clock() if now is None else now
+            stamps = self._starts.get(GLOBAL_KEY if key is None else key, [])
+            return len(stamps) - bisect.bisect_right(stamps, moment - self.window)
+
+    def _enqueue(self, wakeup: Callable[[], None] | None = None) -> int:
+        with self._condition:
+            ticket = next(self._tickets)
+            self._queue.append(ticket)
+            if wakeup is not None:
+                self._wakeups[ticket] = wakeup
+            return ticket
+
+    def _leave(self, ticket: int) -> None:
+        with self._condition:
+            with contextlib.suppress(ValueError):
+                self._queue.remove(ticket)
+            self._wakeups.pop(ticket, None)
+            self._condition.notify_all()
+            self._wake_head()
+
+    def _wake_head(self) -> None:
+        """Wake the asyncio waiter at the head of the queue; caller holds ``_lock``.
+
+        Only the head can be admitted, so nobody else needs to re-decide.
+        """
+
+        if self._queue and (wakeup := self._wakeups.get(self._queue[0])) is not None:
+            wakeup()
+
+    def _observe(self) -> None:
+        # Observers take their own locks; never call them while holding ours.
+        for observer in list(self._observers):
+            observer()
+
+    def _decide(self, ticket: int, key: str | None) -> tuple[bool, float | None]:
+        """Return whether ``ticket`` may start now, else how long it may sleep.
+
+        ``None`` means another waiter is ahead and the window is open: wait for it
+        to leave rather than for the clock.
+        """
+
+        now = self.clock()
+        delay = max(0.0, self.next_start(key, now=now) - now)
+        if self._queue[0] != ticket:
+            return False, delay or None
+        return delay == 0, delay
+
+    @contextlib.contextmanager
+    def slot(self, key: str | None = None) -> Iterator[None]:
+        """Hold the single admission slot; the caller records its start before leaving."""
+
+        ticket = self._enqueue()
+        try:
+            while True:
+                self._observe()
+                with self._condition:
+                    ready, timeout = self._decide(ticket, key)
+                    if ready:
+                        break
+                    self._condition.wait(timeout=timeout)
+            yield
+        finally:
+            self._leave(ticket)
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self, key: str | None = None) -> AsyncIterator[None]:
+        wakeup = asyncio.Event()
+        ticket = self._enqueue(functools.partial(asyncio.get_running_loop().call_soon_threadsafe, wakeup.set))
+        try:
+            while True:
+                wakeup.clear()
+                self._observe()
+                with self._lock:
+                    ready, timeout = self._decide(ticket, key)
+                    if self._queue[0] != ticket:
+                        timeout = None
+                if ready:
+                    break
+                # Until the window opens, or until this waiter is woken as the new head.
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+            yield
+        finally:
+            self._leave(ticket)
+
+    def acquire(self, key: str | None = None) -> float:
+        with self.slot(key):
+            stamp = self.clock()
+            self.record(stamp, key)
+            return stamp
+
+    async def acquire_async(self, key: str | None = None) -> float:
+        async with self.slot_async(key):
+            stamp = self.clock()
+            self.record(stamp, key)
+            return stamp
+
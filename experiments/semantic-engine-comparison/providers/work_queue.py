@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+
+PENDING = "PENDING"
+LEASED = "LEASED"
+TERMINAL = "TERMINAL"
+BUSY_TIMEOUT_SECONDS = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    ordinal INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    owner TEXT,
+    token TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_expires REAL,
+    result TEXT,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state_ordinal ON jobs (state, ordinal);
+"""
+
+
+@dataclass(frozen=True)
+class Lease:
+    key: str
+    token: str
+    owner: str
+    attempt: int
+    expires: float
+
+
+class WorkQueue:
+    """Durable SQLite work queue: each job is ``PENDING``, ``LEASED`` or ``TERMINAL``.
+
+    Jobs are leased in enqueue order, one owner at a time, for ``lease_seconds``. A
+    lease that is neither renewed nor completed before it expires was abandoned by a
+    killed worker: the next ``lease`` call reclaims it, so a crashed campaign resumes
+    without manual cleanup. Every state change is one ``BEGIN IMMEDIATE``
+    transaction, so workers in other threads and other processes share the queue.
+    """
+
+    def __init__(self, path: Path, *, lease_seconds: float = 300.0, clock: Callable[[], float] = time.time):
+        if lease_seconds <= 0:
+            raise RuntimeError("WORK_QUEUE_LEASE_INVALID")
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connect()
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+        connection.execute("PRAGMA synchronous=FULL")
+        return connection
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    def enqueue(self, keys: Iterable[str]) -> int:
+        """Add missing jobs as ``PENDING``; known jobs keep their state. Returns how many were added."""
+
+        now = self.clock()
+        with self._transaction() as connection:
+            start = connection.execute("SELECT COALESCE(MAX(ordinal), 0) FROM jobs").fetchone()[0]
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO jobs (key, ordinal, state, updated) VALUES (?, ?, ?, ?)",
+                [(key, start + offset, PENDING, now) for offset, key in enumerate(keys, start=1)],
+            )
+            return connection.total_changes - before
+
+    def mark_terminal(self, key: str, result: str | None = None) -> None:
+        """Record a pending job finished outside the queue (for instance before the queue existed).
+
+        Leased jobs are left to their owner, or to reclaim once the lease expires.
+        """
+
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET state = ?, result = ?, updated = ? WHERE key = ? AND state = ?",
+                (TERMINAL, result, self.clock(), key, PENDING),
+            )
+
+    def lease(self, owner: str) -> Lease | None:
+        """Lease the first pending job, reclaiming expired leases first; ``None`` when nothing is leasable."""
+
+        now = self.clock()
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, token = NULL, lease_expires = NULL, updated = ? "
+                "WHERE state = ? AND lease_expires <= ?",
+                (PENDING, now, LEASED, now),
+            )
+            row = connection.execute(
+                "SELECT key, attempts FROM jobs WHERE state = ? ORDER BY ordinal LIMIT 1", (PENDING,)
+            ).fetchone()
+            if row is None:
+                return None
+            value = Lease(key=row[0], token=uuid.uuid4().hex, owner=owner, attempt=row[1] + 1, expires=now + self.lease_seconds)
+            connection.execute(
+                "UPDATE jobs SET state = ?, owner = ?, token = ?, attempts = ?, lease_expires = ?, updated = ? WHERE key = ?",
+                (LEASED, owner, value.token, value.attempt, value.expires, now, value.key),
+            )
+            return value
+
+    def _owned(self, connection: sqlite3.Connection, lease: Lease) -> None:
+        row = connection.execute("SELECT state, token FROM jobs WHERE key = ?", (lease.key,)).fetchone()
+        if row is None or row[0] != LEASED or row[1] != lease.token:
+            raise RuntimeError(f"WORK_QUEUE_LEASE_LOST:{lease.key}")
+
+    def renew(self, lease: Lease) -> Lease:
+        now = self.clock()
+        with self._transaction() as connection:
+            self._owned(connection, lease)
+            expires = now + self.lease_seconds
+            connection.execute("UPDATE jobs SET lease_expires = ?, updated = ? WHERE key = ?", (expires, now, lease.key))
+        return Lease(key=lease.key, token=lease.token, owner=lease.owner, attempt=lease.attempt, expires=expires)
+
+    def complete(self, lease: Lease, result: str | None = None) -> None:
+        with self._transaction() as connection:
+            self._owned(connection, lease)
+            connection.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, token = NULL, lease_expires = NULL, result = ?, updated = ? WHERE key = ?",
+                (TERMINAL, result, self.clock(), lease.key),
+            )
+
+    def release(self, lease: Lease) -> None:
+        """Hand a job back as ``PENDING`` after a failure that produced no terminal outcome."""
+
+        with self._transaction() as connection:
+            self._owned(connection, lease)
+            connection.execute(
+                "UPDATE jobs SET state = ?, owner = NULL, token = NULL, lease_expires = NULL, updated = ? WHERE key = ?",
+                (PENDING, self.clock(), lease.key),
+            )
+
+    @contextlib.contextmanager
+    def heartbeat(self, lease: Lease, *, interval: float | None = None) -> Iterator[threading.Event]:
+        """Renew ``lease`` in the background while the body runs.
+
+        Yields an event set once the lease is lost: fenced by another owner, or left
+        to expire while the database kept failing. The body may check it to abort
+        early; a body that finishes on a lost lease raises ``WORK_QUEUE_LEASE_LOST``.
+        """
+
+        stopped = threading.Event()
+        lost = threading.Event()
+        period = self.lease_seconds / 3 if interval is None else interval
+
+        def renew() -> None:
+            current = lease
+            while not stopped.wait(period):
+                try:
+                    current = self.renew(current)
+                except RuntimeError:
+                    lost.set()
+                    return
+                except sqlite3.Error:
+                    # A busy or unavailable database is retried until the lease runs out.
+                    if self.clock() >= current.expires:
+                        lost.set()
+                        return
+
+        thread = threading.Thread(target=renew, name=f"lease-{lease.key}", daemon=True)
+        thread.start()
+        try:
+            yield lost
+        finally:
+            stopped.set()
+            thread.join()
+        if lost.is_set():
+            raise RuntimeError(f"WORK_QUEUE_LEASE_LOST:{lease.key}")
+
+    def counts(self) -> dict[str, int]:
+        with self._transaction() as connection:
+            rows = connection.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return {PENDING: 0, LEASED: 0, TERMINAL: 0, **dict(rows)}
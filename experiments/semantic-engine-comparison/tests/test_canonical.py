@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+import enum
+import hashlib
+import json
+from pathlib import Path
+import sys
+import unittest
+import uuid
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from providers import canonical  # noqa: E402
+
+
+def compact(value: object) -> bytes:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def pretty(value: object) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, indent=2) + "\n"
+
+
+SAMPLES: list[object] = [
+    {},
+    [],
+    {"b": [1, 2.5, None, True], "a": {"z": "Fläche ∂t", "y": []}, "c": {}},
+    {"small": [1e-7, 1e-05, 0.0001, 0.00001234, -2.5e-12], "large": [1e16, 1.5e300, 123456789.125]},
+    {"x": 1e16},
+    {"large": [1e21, 1.23e17, 1.5e300, -0.0, 5e-324], "digest": "3e4f" * 16},
+    {"label": "1e-7 looks like a float", "ints": [0, -1, 2**63, -(2**64), 10**30]},
+    {2: "int keys", 10: "sort numerically"},
+    {"control": "\u0000\t\n\"\\", "emoji": "\U0001f9ea"},
+    [{"nested": [[[[{"deep": 0.1}]]]]}],
+]
+
+
+class CanonicalJsonTests(unittest.TestCase):
+    def test_output_is_byte_identical_to_the_standard_library(self) -> None:
+        for value in SAMPLES:
+            with self.subTest(value=value):
+                self.assertEqual(compact(value), canonical.canonical_bytes(value))
+                self.assertEqual(compact(value).decode("utf-8"), canonical.canonical_json(value))
+                self.assertEqual(pretty(value), canonical.pretty_json(value))
+
+    def test_digests_match_and_streaming_needs_no_full_text(self) -> None:
+        for value in SAMPLES:
+            with self.subTest(value=value):
+                expected = hashlib.sha256(compact(value)).hexdigest()
+                self.assertEqual(expected, canonical.canonical_digest(value))
+                self.assertEqual(expected, canonical.stream_digest(value))
+        hasher = canonical.update_digest(hashlib.sha256(b"prefix"), SAMPLES[2])
+        self.assertEqual(hashlib.sha256(b"prefix" + compact(SAMPLES[2])).hexdigest(), hasher.hexdigest())
+
+    def test_unsupported_values_still_raise_type_error(self) -> None:
+        class Color(enum.Enum):
+            RED = "red"
+
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        for value in [object(), dt.datetime(2026, 1, 1), Color.RED, uuid.UUID(int=0), Point(1)]:
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    canonical.canonical_bytes({"value": [value]})
+                with self.assertRaises(TypeError):
+                    canonical.pretty_json({"value": value})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import unittest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from providers.jsonl_writer import JsonlWriter, repair_torn_tail  # noqa: E402
+
+
+def lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+class JsonlWriterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp.name) / "ledger.jsonl"
+
+    def tearDown(self) -> None:
+        self.temp.cleanup()
+
+    def test_torn_tail_is_moved_aside_and_truncated_on_open(self) -> None:
+        self.path.write_bytes(b'{"event":"RESERVED","requestNumber":1}\n{"event":"COMPL')
+        writer = JsonlWriter(self.path)
+        writer.append({"event": "RESERVED", "requestNumber": 2})
+        writer.close()
+        self.assertEqual(b'{"event":"COMPL', writer.torn)
+        self.assertEqual([1, 2], [event["requestNumber"] for event in lines(self.path)])
+        self.assertEqual('{"event":"COMPL\n', self.path.with_name("ledger.jsonl.torn").read_text(encoding="utf-8"))
+
+    def test_complete_last_event_only_regains_its_newline(self) -> None:
+        self.path.write_bytes(b'{"event":"RESERVED","requestNumber":1}')
+        self.assertIsNone(repair_torn_tail(self.path))
+        self.assertEqual(b'{"event":"RESERVED","requestNumber":1}\n', self.path.read_bytes())
+        self.assertFalse(self.path.with_name("ledger.jsonl.torn").exists())
+
+    def test_event_policy_and_sync_flag_fsync_each_append(self) -> None:
+        writer = JsonlWriter(self.path, durability="event")
+        for number in range(3):
+            writer.append({"requestNumber": number})
+        self.assertEqual(3, writer.fsyncs)
+        relaxed = JsonlWriter(self.path, durability="flush")
+        relaxed.append({"requestNumber": 3})
+        relaxed.append({"requestNumber": 4}, sync=True)
+        self.assertEqual(1, relaxed.fsyncs)
+        self.assertEqual(list(range(5)), [event["requestNumber"] for event in lines(self.path)])
+        with self.assertRaisesRegex(RuntimeError, "JSONL_DURABILITY_INVALID"):
+            JsonlWriter(self.path, durability="never")
+
+    def test_group_commit_shares_fsyncs_between_concurrent_appends(self) -> None:
+        writer = JsonlWriter(self.path, durability="group", group_window=0.05)
+        barrier = threading.Barrier(8)
+
+        def append(number: int) -> None:
+            barrier.wait()
+            writer.append({"requestNumber": number})
+
+        threads = [threading.Thread(target=append, args=(number,)) for number in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(set(range(8)), {event["requestNumber"] for event in lines(self.path)})
+        self.assertGreaterEqual(writer.fsyncs, 1)
+        self.assertLess(writer.fsyncs, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
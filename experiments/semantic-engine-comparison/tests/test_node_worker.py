@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from providers.node_worker import NodeWorker, NodeWorkerPool  # noqa: E402
+
+
+RUNNER = """
+import {{ isServing, serveLines }} from {module};
+
+const run = async (input) => {{
+  if (input.crash) process.exit(3);
+  if (input.fail) throw new Error("RUNNER_FAILED");
+  if (input.delay) await new Promise((resolve) => setTimeout(resolve, input.delay));
+  process.stderr.write(`warning ${{input.value}}\\n`);
+  process.stdout.write("progress\\n");
+  process.stdout.write(`${{JSON.stringify({{ pid: process.pid, value: input.value }})}}\\n`);
+}};
+
+if (isServing()) serveLines(run);
+"""
+
+
+@unittest.skipUnless(shutil.which("node"), "node is required")
+class NodeWorkerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp.name)
+        runner = self.root / "runner.mjs"
+        runner.write_text(RUNNER.format(module=json.dumps((ROOT / "providers" / "node_worker.mjs").as_uri())), encoding="utf-8")
+        self.command = ["node", str(runner)]
+        self.worker = NodeWorker(self.command, cwd=self.root, request_timeout=30)
+
+    def tearDown(self) -> None:
+        self.worker.close()
+        self.temp.cleanup()
+
+    def test_one_warm_process_serves_requests_with_per_request_output(self) -> None:
+        first = self.worker.call({"value": 1})
+        second = self.worker.call({"value": 2})
+        self.assertEqual(1, self.worker.starts)
+        self.assertEqual((0, 0), (first.exit_code, second.exit_code))
+        self.assertEqual("warning 2\n", second.stderr)
+        self.assertEqual("progress", second.stdout.splitlines()[0])
+        last = [json.loads(reply.stdout.splitlines()[-1]) for reply in (first, second)]
+        self.assertEqual([1, 2], [item["value"] for item in last])
+        self.assertEqual(last[0]["pid"], last[1]["pid"])
+
+    def test_handler_error_fails_the_request_only(self) -> None:
+        failed = self.worker.call({"fail": True})
+        self.assertEqual(1, failed.exit_code)
+        self.assertIn("RUNNER_FAILED", failed.stderr)
+        self.assertEqual(0, self.worker.call({"value": 3}).exit_code)
+        self.assertEqual(1, self.worker.starts)
+
+    def test_crashed_process_fails_in_flight_request_and_restarts(self) -> None:
+        self.assertTrue(self.worker.ping())
+        crashed = self.worker.call({"crash": True})
+        self.assertNotEqual(0, crashed.exit_code)
+        self.assertIn("NODE_WORKER_EXITED:3", crashed.stderr)
+        self.assertFalse(self.worker.alive())
+        self.assertEqual(0, self.worker.call({"value": 4}).exit_code)
+        self.assertEqual(2, self.worker.starts)
+
+    def test_pool_reuses_one_warm_worker_until_requests_overlap(self) -> None:
+        with NodeWorkerPool(self.command, cwd=self.root, size=2) as pool:
+            for value in range(3):
+                self.assertEqual(0, pool.call({"value": value}).exit_code)
+            self.assertEqual(1, pool.starts)
+            replies = []
+            threads = [
+                threading.Thread(target=lambda value=value: replies.append(pool.call({"value": value, "delay": 200})))
+                for value in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(2, pool.starts)
+            pids = {json.loads(reply.stdout.splitlines()[-1])["pid"] for reply in replies}
+            self.assertEqual(2, len(pids))
+
+
+if __name__ == "__main__":
+    unittest.main()
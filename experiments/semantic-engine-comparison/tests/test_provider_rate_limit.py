@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+import threading
+import time
+import unittest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from providers.rate_limit import RollingWindowLimiter  # noqa: E402
+
+
+def max_in_window(stamps: list[float], window: float) -> int:
+    ordered = sorted(stamps)
+    return max(sum(1 for other in ordered if start <= other < start + window) for start in ordered)
+
+
+class RollingWindowLimiterTests(unittest.TestCase):
+    def test_next_start_is_the_exact_instant_the_oldest_start_leaves_the_window(self) -> None:
+        limiter = RollingWindowLimiter(limit=10, clock=lambda: 30.0)
+        for stamp in range(10):
+            limiter.record(float(stamp))
+        self.assertEqual(60.05, limiter.next_start())
+        self.assertEqual(10, limiter.recent_count())
+        self.assertEqual(70.0, limiter.next_start(now=70.0))
+
+    def test_role_quota_is_enforced_inside_the_global_window(self) -> None:
+        limiter = RollingWindowLimiter(limit=10, quotas={"CRITIC": 2}, margin=0.0, clock=lambda: 5.0)
+        limiter.record(1.0, "CRITIC")
+        limiter.record(2.0, "CRITIC")
+        limiter.record(3.0, "PRIMARY")
+        self.assertEqual(5.0, limiter.next_start("PRIMARY"))
+        self.assertEqual(61.0, limiter.next_start("CRITIC"))
+
+    def test_duplicate_tokens_are_recorded_once(self) -> None:
+        limiter = RollingWindowLimiter(limit=1, margin=0.0, clock=lambda: 1.0)
+        limiter.record(0.5, token="ledger:1")
+        limiter.record(0.5, token="ledger:1")
+        self.assertEqual(1, limiter.recent_count())
+
+    def test_thread_waiters_are_admitted_in_arrival_order_without_overrun(self) -> None:
+        limiter = RollingWindowLimiter(limit=2, window=0.2, margin=0.0)
+        admitted: list[tuple[int, float]] = []
+
+        def worker(index: int) -> None:
+            admitted.append((index, limiter.acquire()))
+
+        threads = []
+        for index in range(6):
+            thread = threading.Thread(target=worker, args=(index,))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+        self.assertEqual(list(range(6)), [index for index, _ in admitted])
+        self.assertLessEqual(max_in_window([stamp for _, stamp in admitted], 0.2), 2)
+
+    def test_asyncio_waiters_share_the_same_window(self) -> None:
+        limiter = RollingWindowLimiter(limit=2, window=0.2, margin=0.0)
+
+        async def scenario() -> list[float]:
+            return list(await asyncio.gather(*(limiter.acquire_async() for _ in range(5))))
+
+        stamps = asyncio.run(scenario())
+        self.assertEqual(5, len(stamps))
+        self.assertLessEqual(max_in_window(stamps, 0.2), 2)
+        self.assertGreaterEqual(max(stamps) - min(stamps), 0.4)
+
+
+    def test_asyncio_waiters_are_woken_instead_of_polling(self) -> None:
+        limiter = RollingWindowLimiter(limit=10, window=0.2, margin=0.0)
+        observed: list[float] = []
+        limiter.add_observer(lambda: observed.append(time.time()))
+
+        async def admitted() -> None:
+            async with limiter.slot_async():
+                await asyncio.sleep(0.05)
+
+        async def scenario() -> None:
+            await asyncio.gather(*(admitted() for _ in range(4)))
+
+        asyncio.run(scenario())
+        # Each waiter decides once on arrival and once when it becomes the head.
+        self.assertLessEqual(len(observed), 8)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from providers.work_queue import WorkQueue  # noqa: E402
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class WorkQueueTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp.name) / "queue.sqlite3"
+        self.clock = Clock()
+
+    def tearDown(self) -> None:
+        self.temp.cleanup()
+
+    def test_jobs_are_leased_in_order_and_enqueue_is_idempotent(self) -> None:
+        queue = WorkQueue(self.path, clock=self.clock)
+        self.assertEqual(3, queue.enqueue(["A", "B", "C"]))
+        self.assertEqual(0, queue.enqueue(["A", "B", "C"]))
+        queue.mark_terminal("B", "SUCCESS")
+        first = queue.lease("w1")
+        queue.complete(first, "SUCCESS")
+        self.assertEqual(["A", "C"], [first.key, queue.lease("w1").key])
+        self.assertIsNone(queue.lease("w1"))
+        self.assertEqual({"PENDING": 0, "LEASED": 1, "TERMINAL": 2}, WorkQueue(self.path).counts())
+
+    def test_abandoned_lease_is_reclaimed_and_the_stale_owner_is_fenced(self) -> None:
+        queue = WorkQueue(self.path, lease_seconds=10, clock=self.clock)
+        queue.enqueue(["A"])
+        abandoned = queue.lease("killed")
+        self.assertIsNone(queue.lease("survivor"))
+        queue.mark_terminal("A")
+        self.clock.now += 11
+        reclaimed = queue.lease("survivor")
+        self.assertEqual(("A", 2), (reclaimed.key, reclaimed.attempt))
+        with self.assertRaisesRegex(RuntimeError, "WORK_QUEUE_LEASE_LOST:A"):
+            queue.complete(abandoned)
+        self.clock.now += 8
+        reclaimed = queue.renew(reclaimed)
+        self.clock.now += 8
+        self.assertIsNone(queue.lease("other"))
+        queue.release(reclaimed)
+        self.assertEqual(3, queue.lease("other").attempt)
+
+    def test_concurrent_workers_lease_each_job_once(self) -> None:
+        queue = WorkQueue(self.path)
+        keys = [f"RUN-{index:02d}" for index in range(40)]
+        queue.enqueue(keys)
+        leased: list[str] = []
+        lock = threading.Lock()
+
+        def work(index: int) -> None:
+            mine = WorkQueue(self.path)
+            while (lease := mine.lease(f"w{index}")) is not None:
+                with lock:
+                    leased.append(lease.key)
+                mine.complete(lease)
+
+        threads = [threading.Thread(target=work, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(keys), sorted(leased))
+        self.assertEqual(40, queue.counts()["TERMINAL"])
+
+    def test_heartbeat_keeps_a_long_job_leased(self) -> None:
+        queue = WorkQueue(self.path, lease_seconds=0.3)
+        queue.enqueue(["A"])
+        lease = queue.lease("w1")
+        with queue.heartbeat(lease, interval=0.05):
+            time.sleep(0.6)
+            self.assertIsNone(queue.lease("w2"))
+        queue.complete(lease)
+
+
+    def test_heartbeat_flags_a_lost_lease(self) -> None:
+        queue = WorkQueue(self.path, lease_seconds=10, clock=self.clock)
+        queue.enqueue(["A"])
+        lease = queue.lease("w1")
+        with self.assertRaisesRegex(RuntimeError, "WORK_QUEUE_LEASE_LOST:A"):
+            with queue.heartbeat(lease, interval=0.02) as lost:
+                self.clock.now += 11
+                self.assertEqual("w2", queue.lease("w2").owner)
+                self.assertTrue(lost.wait(1.0))
+
+    def test_heartbeat_retries_database_errors_until_the_lease_expires(self) -> None:
+        queue = WorkQueue(self.path, lease_seconds=10, clock=self.clock)
+        queue.enqueue(["A"])
+        lease = queue.lease("w1")
+        failures = 0
+
+        def unavailable(_: object) -> None:
+            nonlocal failures
+            failures += 1
+            raise sqlite3.OperationalError("database is locked")
+
+        with patch.object(queue, "renew", side_effect=unavailable):
+            with self.assertRaisesRegex(RuntimeError, "WORK_QUEUE_LEASE_LOST:A"):
+                with queue.heartbeat(lease, interval=0.02) as lost:
+                    time.sleep(0.1)
+                    self.assertFalse(lost.is_set())
+                    self.clock.now += 10
+                    self.assertTrue(lost.wait(1.0))
+        self.assertGreater(failures, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ sys.path.insert(0, str(ROOT))
 
 from baselines.langextract_baseline import LANGEXTRACT_OUTPUT_SCHEMA  # noqa: E402
 from contracts.projection import schema_documents  # noqa: E402
+from providers.canonical import canonical_bytes  # noqa: E402
 
 
 LOCK = REPOSITORY_ROOT / "experiments" / "requirements-experiments-lock.txt"
@@ -41,10 +42,6 @@ def digest_files(paths: list[Path]) -> str:
     return digest.hexdigest()
 
 
-def canonical_bytes(value: object) -> bytes:
-    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
-
-
 def manifest_digest(value: dict) -> str:
     return sha256_bytes(canonical_bytes(value))
 